@@ -3,7 +3,7 @@ Comprehensive Attendance Management API
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 from sqlalchemy import and_, or_, func, desc, asc
 from typing import List, Optional, Any, Dict
 from datetime import datetime, date, timedelta
@@ -38,6 +38,16 @@ class AttendanceStatusEnum(str, Enum):
     emergency_leave = "emergency_leave"
 
 
+class WeekdayEnum(str, Enum):
+    monday = "monday"
+    tuesday = "tuesday"
+    wednesday = "wednesday"
+    thursday = "thursday"
+    friday = "friday"
+    saturday = "saturday"
+    sunday = "sunday"
+
+
 class AttendanceRecordCreate(BaseModel):
     student_id: int
     class_id: int
@@ -77,7 +87,9 @@ class AttendancePolicyCreate(BaseModel):
     allow_self_check_out: bool = False
     grace_period_minutes: int = 5
     half_day_threshold_hours: float = 4.0
-    working_days: List[str] = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+    working_days: List[WeekdayEnum] = [
+        WeekdayEnum.monday, WeekdayEnum.tuesday, WeekdayEnum.wednesday, WeekdayEnum.thursday, WeekdayEnum.friday
+    ]
 
 
 class AttendanceSessionCreate(BaseModel):
@@ -141,7 +153,7 @@ async def create_attendance_policy(
             allow_self_check_out=policy_data.allow_self_check_out,
             grace_period_minutes=policy_data.grace_period_minutes,
             half_day_threshold_hours=policy_data.half_day_threshold_hours,
-            working_days=policy_data.working_days,
+            working_days=[day.value for day in policy_data.working_days],
             created_by=current_user.id
         )
         
@@ -239,52 +251,22 @@ async def mark_bulk_attendance(
         if bulk_data.policy_id:
             policy = db.query(AttendancePolicy).filter(AttendancePolicy.id == bulk_data.policy_id).first()
         
-        success_count = 0
-        error_count = 0
-        errors = []
-        
-        for record_data in bulk_data.records:
-            try:
-                # Check if attendance already exists
-                existing = db.query(AttendanceRecord).filter(
-                    and_(
-                        AttendanceRecord.student_id == record_data.student_id,
-                        AttendanceRecord.class_id == record_data.class_id,
-                        AttendanceRecord.date == bulk_data.date
-                    )
-                ).first()
-                
-                if existing:
-                    # Update existing record
-                    existing.status = record_data.status
-                    existing.check_in_time = record_data.check_in_time
-                    existing.check_out_time = record_data.check_out_time
-                    existing.reason = record_data.reason
-                    existing.notes = record_data.notes
-                    existing.expected_hours = record_data.expected_hours
-                    existing.updated_at = datetime.utcnow()
-                    success_count += 1
-                else:
-                    # Create new record
-                    attendance = AttendanceRecord(
-                        student_id=record_data.student_id,
-                        class_id=record_data.class_id,
-                        policy_id=policy.id if policy else None,
-                        date=bulk_data.date,
-                        status=record_data.status,
-                        check_in_time=record_data.check_in_time,
-                        check_out_time=record_data.check_out_time,
-                        reason=record_data.reason,
-                        notes=record_data.notes,
-                        expected_hours=record_data.expected_hours,
-                        marked_by=current_user.id
-                    )
-                    db.add(attendance)
-                    success_count += 1
-                    
-            except Exception as e:
-                error_count += 1
-                errors.append(f"Student {record_data.student_id}: {str(e)}")
+        success_count = AttendanceRecord.upsert(db, [
+            {
+                "student_id": record_data.student_id,
+                "class_id": record_data.class_id,
+                "policy_id": policy.id if policy else None,
+                "date": bulk_data.date,
+                "status": record_data.status.value,
+                "actual_check_in": record_data.check_in_time,
+                "actual_check_out": record_data.check_out_time,
+                "reason": record_data.reason,
+                "notes": record_data.notes,
+                "expected_hours": record_data.expected_hours,
+                "marked_by": current_user.id,
+            }
+            for record_data in bulk_data.records
+        ])
         
         db.commit()
         
@@ -293,8 +275,9 @@ async def mark_bulk_attendance(
         return {
             "message": f"Attendance marked for {success_count} students",
             "success_count": success_count,
-            "error_count": error_count,
-            "errors": errors
+            # Kept for existing clients; the upsert writes every record or fails as a whole
+            "error_count": 0,
+            "errors": []
         }
         
     except Exception as e:
@@ -319,7 +302,9 @@ async def generate_attendance_report(
         # Build base query
         query = db.query(AttendanceRecord).options(
             joinedload(AttendanceRecord.student).joinedload(Student.user),
-            joinedload(AttendanceRecord.class_info)
+            joinedload(AttendanceRecord.class_info),
+            joinedload(AttendanceRecord.student).raiseload("*"),
+            raiseload("*")
         )
         
         # Apply filters
@@ -722,28 +707,31 @@ async def get_attendance_analytics(
         # Build base query
         query = db.query(AttendanceRecord).options(
             joinedload(AttendanceRecord.student).joinedload(Student.user),
-            joinedload(AttendanceRecord.class_info)
+            joinedload(AttendanceRecord.class_info),
+            joinedload(AttendanceRecord.student).raiseload("*"),
+            raiseload("*")
         )
         
         # Apply filters
+        criteria = [
+            AttendanceRecord.date >= start_date,
+            AttendanceRecord.date <= end_date
+        ]
         if class_id:
-            query = query.filter(AttendanceRecord.class_id == class_id)
+            criteria.append(AttendanceRecord.class_id == class_id)
         if student_id:
-            query = query.filter(AttendanceRecord.student_id == student_id)
+            criteria.append(AttendanceRecord.student_id == student_id)
         
-        query = query.filter(
-            and_(
-                AttendanceRecord.date >= start_date,
-                AttendanceRecord.date <= end_date
-            )
-        )
-        
-        records = query.all()
+        records = query.filter(and_(*criteria)).all()
         
         # Calculate analytics
         total_days = len(set(r.date for r in records))
         total_records = len(records)
         
+        # Punctuality, computed in the database and read as one array
+        late_minutes = AttendanceRecord.late_minutes_array(db, *criteria)
+        late_minutes = late_minutes[late_minutes > 0]
+        
         # Status breakdown
         status_counts = {}
         for record in records:
@@ -790,6 +778,9 @@ async def get_attendance_analytics(
                 "total_days": total_days,
                 "total_records": total_records,
                 "overall_attendance_percentage": round(overall_attendance_percentage, 2),
+                "late_check_ins": int(late_minutes.size),
+                "average_late_minutes": round(float(late_minutes.mean()), 2) if late_minutes.size else 0,
+                "max_late_minutes": int(late_minutes.max()) if late_minutes.size else 0,
                 "date_range": {
                     "start_date": start_date,
                     "end_date": end_date
@@ -831,7 +822,9 @@ async def get_attendance_reports(
         # Build base query
         query = db.query(AttendanceRecord).options(
             joinedload(AttendanceRecord.student).joinedload(Student.user),
-            joinedload(AttendanceRecord.class_info)
+            joinedload(AttendanceRecord.class_info),
+            joinedload(AttendanceRecord.student).raiseload("*"),
+            raiseload("*")
         )
         
         # Apply filters
@@ -989,7 +982,7 @@ async def get_admin_attendance_by_class_daily(
         attendance_records = db.query(AttendanceRecord).filter(
             AttendanceRecord.class_id == class_obj.id,
             AttendanceRecord.date == date
-        ).options(joinedload(AttendanceRecord.student)).all()
+        ).options(raiseload("*")).all()
         
         # Create attendance summary for this class
         total_students = len(students)
@@ -1112,7 +1105,7 @@ async def get_admin_attendance_by_class_monthly(
             AttendanceRecord.class_id == class_obj.id,
             AttendanceRecord.date >= start_date,
             AttendanceRecord.date <= end_date
-        ).options(joinedload(AttendanceRecord.student)).all()
+        ).options(raiseload("*")).all()
         
         # Calculate monthly statistics
         total_students = len(students)
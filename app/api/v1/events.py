@@ -6,7 +6,7 @@ from typing import Any, List, Optional
 from datetime import date, datetime, time
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, select
 from app.database.session import get_db
 from app.api.deps import get_current_user
 from app.core.permissions import UserRole
@@ -14,7 +14,7 @@ from app.core.role_config import role_config
 from app.models.user import User
 from app.models.student import Student
 from app.models.academic import Class, ClassSubject
-from app.models.events import Event, EventAssignment
+from app.models.events import Event, EventAssignment, EventStatus, EventTargetType, event_effective_assignments
 from app.services.notification import NotificationService
 import logging
 
@@ -33,7 +33,7 @@ class EventCreateRequest(BaseModel):
     start_time: Optional[time] = None  # Will be extracted from start datetime
     end_time: Optional[time] = None  # Will be extracted from end datetime
     location: Optional[str] = None
-    target_type: Optional[str] = None  # Will be mapped from audience
+    target_type: Optional[EventTargetType] = None  # Will be mapped from audience
     target_class_id: Optional[int] = None
     
     # Frontend fields
@@ -50,9 +50,9 @@ class EventUpdateRequest(BaseModel):
     start_time: Optional[time] = None
     end_time: Optional[time] = None
     location: Optional[str] = None
-    target_type: Optional[str] = None
+    target_type: Optional[EventTargetType] = None
     target_class_id: Optional[int] = None
-    status: Optional[str] = None
+    status: Optional[EventStatus] = None
 
 class EventResponse(BaseModel):
     """Schema for event response"""
@@ -251,23 +251,8 @@ async def create_event(
     db.commit()
     db.refresh(event)
     
-    # Create event assignments for students
-    if event.target_type in ["school_wide", "class_specific"]:
-        students_query = db.query(Student).filter(Student.is_active == True)
-        
-        if event.target_type == "class_specific":
-            students_query = students_query.filter(Student.current_class_id == event.target_class_id)
-        
-        students = students_query.all()
-        
-        for student in students:
-            assignment = EventAssignment(
-                event_id=event.id,
-                student_id=student.id
-            )
-            db.add(assignment)
-        
-        db.commit()
+    # School-wide and class-wide audiences are resolved through the
+    # event_effective_assignments view; no per-student rows are stored
     
     # Send notifications
     try:
@@ -330,8 +315,8 @@ async def create_event(
 async def list_events(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    target_type: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
+    target_type: Optional[EventTargetType] = Query(None),
+    status: Optional[EventStatus] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> Any:
@@ -452,8 +437,11 @@ async def get_my_events(
             detail="Student profile not found"
         )
     
-    events = db.query(Event).join(EventAssignment).filter(
-        EventAssignment.student_id == student.id
+    events = db.query(Event).filter(
+        Event.id.in_(
+            select(event_effective_assignments.c.event_id)
+            .where(event_effective_assignments.c.student_id == student.id)
+        )
     ).options(
         joinedload(Event.creator),
         joinedload(Event.target_class)
@@ -505,8 +493,11 @@ async def get_child_events(
     
     # Get events for all children
     child_ids = [child.id for child in parent.children]
-    events = db.query(Event).join(EventAssignment).filter(
-        EventAssignment.student_id.in_(child_ids)
+    events = db.query(Event).filter(
+        Event.id.in_(
+            select(event_effective_assignments.c.event_id)
+            .where(event_effective_assignments.c.student_id.in_(child_ids))
+        )
     ).options(
         joinedload(Event.creator),
         joinedload(Event.target_class)
@@ -647,7 +638,6 @@ async def update_event(
     for field, value in update_data.items():
         setattr(event, field, value)
     
-    event.updated_at = datetime.now()
     db.commit()
     db.refresh(event)
     
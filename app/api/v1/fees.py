@@ -1,6 +1,6 @@
 """fees API endpoints"""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.database.session import get_db
@@ -82,10 +82,13 @@ async def create_invoice(
 
 @router.get("/invoices", response_model=List[InvoiceResponse])
 async def get_invoices(
+    student_id: Optional[int] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all invoices"""
+    """Get all invoices, optionally for a single student"""
+    if student_id is not None:
+        return Invoice.for_student(db, student_id)
     invoices = db.query(Invoice).all()
     return invoices
 
@@ -9,6 +9,7 @@ from typing import List
 
 from app.database.session import get_db
 from app.models.form import Form, FormField, FormFieldOption
+from app.models._cache import get_form_by_key
 from app.schemas.form import (
     FormCreate,
     FormUpdate,
@@ -370,8 +371,8 @@ def get_form_for_rendering(form_key: str, db: Session = Depends(get_db)):
     """
     Retrieve a single form schema by its key for rendering.
     """
-    db_form = db.query(Form).filter(Form.key == form_key, Form.is_active == True).first()
-    if not db_form:
+    db_form = get_form_by_key(db, form_key)
+    if not db_form or not db_form.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Form not found"
         )
@@ -392,8 +393,8 @@ def submit_form(
     """
     Submit data for a specific form.
     """
-    db_form = db.query(Form).filter(Form.key == form_key, Form.is_active == True).first()
-    if not db_form:
+    db_form = get_form_by_key(db, form_key)
+    if not db_form or not db_form.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Form not found"
         )
@@ -3,17 +3,18 @@ Library and Inventory API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.database.session import get_db
+from app.database.session import get_db, get_read_db
 from app.models import library as models
 from app.schemas import library as schemas
 
 router = APIRouter()
 
 # Helper function to get an object or raise 404
+# (Session.get() answers repeat lookups within a request from the identity map)
 def get_object_or_404(db: Session, model, object_id: int):
-    obj = db.query(model).filter(model.id == object_id).first()
+    obj = db.get(model, object_id)
     if obj is None:
         raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
     return obj
@@ -64,6 +65,10 @@ def create_book(book: schemas.BookCreate, db: Session = Depends(get_db)):
 def read_books(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     return db.query(models.Book).offset(skip).limit(limit).all()
 
+@router.get("/books/summary/", response_model=List[schemas.BookSummary])
+def read_book_summaries(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
+    return models.Book.summary_query(db).offset(skip).limit(limit).all()
+
 @router.get("/books/{book_id}", response_model=schemas.Book)
 def read_book(book_id: int, db: Session = Depends(get_db)):
     return get_object_or_404(db, models.Book, book_id)
@@ -100,16 +105,32 @@ def read_library_members(skip: int = 0, limit: int = 100, db: Session = Depends(
 # BookIssue endpoints
 @router.post("/book-issues/", response_model=schemas.BookIssue, status_code=201)
 def create_book_issue(issue: schemas.BookIssueCreate, db: Session = Depends(get_db)):
+    get_object_or_404(db, models.Book, issue.book_id)
+    if not models.Book.adjust_copies(db, {issue.book_id: -1}):
+        db.rollback()
+        raise HTTPException(status_code=409, detail="No copies of this book are available")
     db_issue = models.BookIssue(**issue.dict())
-    # TODO: Decrement available_copies of the book
     db.add(db_issue)
     db.commit()
     db.refresh(db_issue)
     return db_issue
 
+@router.post("/book-issues/{issue_id}/return", response_model=schemas.BookIssue)
+def return_book_issue(issue_id: int, db: Session = Depends(get_db)):
+    db_issue = get_object_or_404(db, models.BookIssue, issue_id)
+    if not models.BookIssue.mark_returned(db, issue_id):
+        raise HTTPException(status_code=409, detail="Book issue already returned")
+    models.Book.adjust_copies(db, {db_issue.book_id: 1})
+    db.commit()
+    db.refresh(db_issue)
+    return db_issue
+
 @router.get("/book-issues/", response_model=List[schemas.BookIssue])
-def read_book_issues(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(models.BookIssue).offset(skip).limit(limit).all()
+def read_book_issues(skip: int = 0, limit: int = 100, overdue: Optional[bool] = None, db: Session = Depends(get_read_db)):
+    query = db.query(models.BookIssue)
+    if overdue is not None:
+        query = query.filter(models.BookIssue.is_overdue if overdue else ~models.BookIssue.is_overdue)
+    return query.offset(skip).limit(limit).all()
 
 # InventoryCategory endpoints
 @router.post("/inventory-categories/", response_model=schemas.InventoryCategory, status_code=201)
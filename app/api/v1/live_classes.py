@@ -1,7 +1,7 @@
 """live_classes API endpoints"""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from datetime import datetime
+from sqlalchemy.orm import Session, joinedload, undefer_group
+from datetime import datetime, timezone
 from typing import Dict, Any
 from app.api import deps
 from app.models.live_class import LiveClass, LiveClassStatus
@@ -84,7 +84,8 @@ def schedule_live_class(
         db.refresh(live_class)
         live_class = db.query(LiveClass).options(
             joinedload(LiveClass.teacher),
-            joinedload(LiveClass.class_)
+            joinedload(LiveClass.class_),
+            undefer_group("jitsi")
         ).filter(LiveClass.id == live_class.id).first()
         
         logger.info(f"Created live class with Jitsi room: {jitsi_config['room_name']}")
@@ -158,7 +159,8 @@ def get_live_classes(
     # Filter based on user role
     query = db.query(LiveClass).options(
         joinedload(LiveClass.teacher),
-        joinedload(LiveClass.class_)
+        joinedload(LiveClass.class_),
+        undefer_group("jitsi")
     )
     
     if current_user.role == UserRole.TEACHER:
@@ -272,7 +274,7 @@ def join_live_class(
         attendance = ClassAttendance(
             live_class_id=class_id,
             user_id=current_user.id,
-            join_time=datetime.utcnow(),
+            join_time=datetime.now(timezone.utc),
             jitsi_participant_id=jitsi_join_config.get("participant_id"),
             jitsi_join_token=jitsi_token
         )
@@ -335,7 +337,8 @@ def start_live_class(
     # Load relationships
     live_class = db.query(LiveClass).options(
         joinedload(LiveClass.teacher),
-        joinedload(LiveClass.class_)
+        joinedload(LiveClass.class_),
+        undefer_group("jitsi")
     ).filter(LiveClass.id == live_class.id).first()
     
     logger.info(f"Live class {class_id} started by teacher {current_user.id}")
@@ -423,7 +426,8 @@ def end_live_class(
     # Load relationships
     live_class = db.query(LiveClass).options(
         joinedload(LiveClass.teacher),
-        joinedload(LiveClass.class_)
+        joinedload(LiveClass.class_),
+        undefer_group("jitsi")
     ).filter(LiveClass.id == live_class.id).first()
     
     logger.info(f"Live class {class_id} ended by teacher {current_user.id}")
@@ -547,7 +551,7 @@ def leave_live_class(
             detail="Attendance record not found.",
         )
 
-    attendance.leave_time = datetime.utcnow()
+    attendance.leave_time = datetime.now(timezone.utc)
     db.commit()
     db.refresh(attendance)
     
@@ -605,7 +609,8 @@ def get_live_class_info(
     # Load relationships
     live_class = db.query(LiveClass).options(
         joinedload(LiveClass.teacher),
-        joinedload(LiveClass.class_)
+        joinedload(LiveClass.class_),
+        undefer_group("jitsi")
     ).filter(LiveClass.id == live_class.id).first()
     
     return {
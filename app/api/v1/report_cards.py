@@ -9,6 +9,7 @@ from typing import List
 from app.api import deps
 from app.models import user as user_model
 from app.models import report_card as report_card_model
+from app.models.student import Student
 from app.schemas import report_card as report_card_schema
 
 router = APIRouter()
@@ -54,9 +55,36 @@ def publish_report_card(
     """
     Publish a report card template to teachers for a specific class and term.
     """
-    # This is a placeholder implementation.
-    # In a real application, you would create report card entries for each student.
-    return {"message": "Report card published successfully."}
+    ReportCard = report_card_model.ReportCard
+    already_published = (
+        db.query(ReportCard.student_id)
+        .filter(
+            ReportCard.template_id == publish_in.template_id,
+            ReportCard.term_id == publish_in.term_id,
+        )
+    )
+    students = (
+        db.query(Student.id, Student.current_class_id)
+        .filter(
+            Student.current_class_id.in_(publish_in.class_ids),
+            Student.is_active.is_(True),
+            Student.id.not_in(already_published),
+        )
+        .all()
+    )
+    created = ReportCard.bulk_create(db, [
+        {
+            "template_id": publish_in.template_id,
+            "student_id": student_id,
+            "class_id": class_id,
+            "term_id": publish_in.term_id,
+            "data": {},
+            "status": "draft",
+        }
+        for student_id, class_id in students
+    ])
+    db.commit()
+    return {"message": "Report card published successfully.", "created": len(created)}
 
 
 @router.post("/submit")
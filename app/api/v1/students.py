@@ -5,7 +5,7 @@ Student management API endpoints
 from typing import Any, List, Optional
 from datetime import date, datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload, undefer_group
 from sqlalchemy import and_, or_, func
 from app.database.session import get_db
 from app.api.deps import get_current_user
@@ -15,6 +15,7 @@ from app.models.user import User, Parent
 from app.models.student import Student, AttendanceRecord, Grade, StudentDocument
 from app.models.academic import Class, Subject, ClassSubject
 from app.models.teacher import Teacher
+from app.models.hostel import HostelRoom
 from app.models.form import Form
 from app.schemas.user import UserCreate, UserResponse
 from app.models.form import FieldType
@@ -278,10 +279,12 @@ async def list_students(
 ) -> Any:
     """List all students with filtering and pagination"""
     
-    # Base query with joins
+    # Base query with joins; any relationship not loaded here raises instead of
+    # lazy loading once per student
     query = db.query(Student).join(User).options(
         joinedload(Student.user),
-        joinedload(Student.current_class)
+        joinedload(Student.current_class),
+        raiseload("*")
     )
     
     # Apply static filters
@@ -316,7 +319,7 @@ async def list_students(
                     if field.is_filterable and field.field_name in filters:
                         value = filters[field.field_name]
                         if value:
-                            query = query.filter(Student.dynamic_data[field.field_name].astext == str(value))
+                            query = query.filter(Student.dynamic_field(field.field_name) == str(value))
         except Exception as e:
             logger.error(f"Error applying dynamic filters: {e}")
 
@@ -744,7 +747,8 @@ async def get_student(
         joinedload(Student.user),
         joinedload(Student.current_class),
         joinedload(Student.bus_route),
-        joinedload(Student.hostel_room)
+        joinedload(Student.hostel_room).joinedload(HostelRoom.block),
+        undefer_group("extended")
     ).filter(Student.id == student_id).first()
     
     if not student:
@@ -1245,7 +1249,7 @@ async def get_my_dashboard(
                 "subject": g.subject.name if g.subject else None,
                 "assignment": g.assessment_name,
                 "grade": g.grade_letter,
-                "score": round((g.percentage or g.percentage_score or 0), 2),
+                "score": round(g.percentage or 0, 2),
             }
             for g in grades
         ],
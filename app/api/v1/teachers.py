@@ -12,7 +12,7 @@ from app.api.deps import get_current_user
 from app.core.permissions import UserRole
 from app.core.role_config import role_config
 from app.models.user import User
-from app.models.teacher import Teacher
+from app.models.teacher import Teacher, TeacherAttendance
 from app.models.student import Student, Grade
 from app.models.academic import Assignment
 from app.models.academic import Class, Subject, ClassSubject
@@ -107,6 +107,21 @@ class TeacherDynamicCreateRequest(BaseModel):
     """Schema for creating a teacher from dynamic form data"""
     dynamic_data: dict
 
+class TeacherAttendanceEntry(BaseModel):
+    """One teacher's attendance for the day"""
+    teacher_id: int
+    status: str  # present, absent, half_day, leave
+    check_in_time: Optional[datetime] = None
+    check_out_time: Optional[datetime] = None
+    leave_type: Optional[str] = None
+    reason: Optional[str] = None
+    hours_worked: Optional[float] = None
+
+class TeacherAttendanceBulkCreate(BaseModel):
+    """Schema for marking a day's attendance for many teachers"""
+    date: date
+    records: List[TeacherAttendanceEntry]
+
 # Teacher CRUD Operations
 @router.get("", response_model=dict)
 async def list_teachers(
@@ -406,7 +421,7 @@ async def get_my_teacher_dashboard(
                 "student": g.student.full_name if g.student else None,
                 "assignment": g.assessment_name,
                 "grade": g.grade_letter,
-                "score": round((g.percentage or g.percentage_score or 0), 2),
+                "score": round(g.percentage or 0, 2),
             }
             for g in grades
         ],
@@ -739,6 +754,52 @@ async def get_teacher_subjects(
         "total_subjects": len(subject_list)
     }
 
+# Teacher Attendance
+@router.post("/attendance/bulk", response_model=dict)
+async def mark_bulk_teacher_attendance(
+    bulk_data: TeacherAttendanceBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Mark a day's attendance for many teachers; teachers already marked that day are skipped"""
+    
+    if not role_config.can_access_module(current_user.role.value, "teachers"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions to access teachers module"
+        )
+    
+    try:
+        inserted_count = TeacherAttendance.bulk_copy(db, [
+            {
+                "teacher_id": record.teacher_id,
+                "date": bulk_data.date,
+                "status": record.status,
+                "check_in_time": record.check_in_time,
+                "check_out_time": record.check_out_time,
+                "leave_type": record.leave_type,
+                "reason": record.reason,
+                "hours_worked": record.hours_worked,
+            }
+            for record in bulk_data.records
+        ])
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error marking bulk teacher attendance: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to mark teacher attendance"
+        )
+    
+    logger.info(f"Teacher attendance marked for {inserted_count} teachers by {current_user.email}")
+    
+    return {
+        "message": f"Attendance marked for {inserted_count} teachers",
+        "inserted_count": inserted_count,
+        "skipped_count": len(bulk_data.records) - inserted_count
+    }
+
 from sqlalchemy import func
 from datetime import datetime, timedelta
 
@@ -71,6 +71,13 @@ def read_route(route_id: int, db: Session = Depends(deps.get_db)):
         raise HTTPException(status_code=404, detail="Route not found")
     return db_route
 
+@router.get("/routes/{route_id}/points", response_model=List[schemas.RoutePoint])
+def read_route_points(route_id: int, db: Session = Depends(deps.get_db)):
+    """A route's stop coordinates in pickup order, for map and tracking views"""
+    if db.query(models.Route.id).filter(models.Route.id == route_id).first() is None:
+        raise HTTPException(status_code=404, detail="Route not found")
+    return [point._asdict() for point in models.Stop.route_points(db, route_id)]
+
 @router.put("/routes/{route_id}", response_model=schemas.Route)
 def update_route(route_id: int, route: schemas.RouteUpdate, db: Session = Depends(deps.get_db)):
     db_route = db.query(models.Route).filter(models.Route.id == route_id).first()
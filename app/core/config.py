@@ -33,6 +33,12 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "duckdb:///./eschool.db"
     DATABASE_ECHO: bool = False  # Set to True for SQL query logging
+    DATABASE_POOL_SIZE: int = 20  # Persistent connections (PostgreSQL only)
+    DATABASE_MAX_OVERFLOW: int = 40  # Extra connections allowed under burst load
+    DATABASE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # Recycle connections after 30 minutes
+    DATABASE_POOL_USE_LIFO: bool = True  # Reuse the most recent connection so idle ones can be recycled
+    DATABASE_REPLICA_URL: Optional[str] = None  # Read replica for stale-tolerant reads (PostgreSQL only)
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = [
@@ -0,0 +1,115 @@
+"""
+Portable SQL expressions shared by the database models
+"""
+
+from sqlalchemy import Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class days_since(FunctionElement):
+    """Whole days from a DATE column to the current date"""
+    type = Integer()
+    inherit_cache = True
+    name = "days_since"
+
+
+@compiles(days_since)
+def _days_since_default(element, compiler, **kw):
+    return f"(CURRENT_DATE - {compiler.process(element.clauses, **kw)})"
+
+
+@compiles(days_since, "sqlite")
+def _days_since_sqlite(element, compiler, **kw):
+    return f"CAST(julianday(CURRENT_DATE) - julianday({compiler.process(element.clauses, **kw)}) AS INTEGER)"
+
+
+class years_since(FunctionElement):
+    """Completed years from a DATE or TIMESTAMP column to the current date"""
+    type = Integer()
+    inherit_cache = True
+    name = "years_since"
+
+
+@compiles(years_since)
+def _years_since_default(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"CAST(date_part('year', age(CURRENT_DATE, CAST({value} AS DATE))) AS INTEGER)"
+
+
+@compiles(years_since, "sqlite")
+def _years_since_sqlite(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return (
+        f"(CAST(strftime('%Y', CURRENT_DATE) AS INTEGER) - CAST(strftime('%Y', {value}) AS INTEGER)"
+        f" - (strftime('%m-%d', CURRENT_DATE) < strftime('%m-%d', {value})))"
+    )
+
+
+class seconds_of_day(FunctionElement):
+    """Whole seconds since midnight of a TIME or TIMESTAMP column"""
+    type = Integer()
+    inherit_cache = True
+    name = "seconds_of_day"
+
+
+@compiles(seconds_of_day)
+def _seconds_of_day_default(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"CAST(FLOOR(EXTRACT(EPOCH FROM CAST({value} AS TIME))) AS INTEGER)"
+
+
+@compiles(seconds_of_day, "sqlite")
+def _seconds_of_day_sqlite(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return (
+        f"(CAST(strftime('%H', {value}) AS INTEGER) * 3600 + CAST(strftime('%M', {value}) AS INTEGER) * 60"
+        f" + CAST(strftime('%S', {value}) AS INTEGER))"
+    )
+
+
+class weekday(FunctionElement):
+    """Day of the week of a DATE or TIMESTAMP column, Monday = 0 like date.weekday()"""
+    type = Integer()
+    inherit_cache = True
+    name = "weekday"
+
+
+@compiles(weekday)
+def _weekday_default(element, compiler, **kw):
+    return f"(CAST(EXTRACT(ISODOW FROM {compiler.process(element.clauses, **kw)}) AS INTEGER) - 1)"
+
+
+@compiles(weekday, "sqlite")
+def _weekday_sqlite(element, compiler, **kw):
+    return f"((CAST(strftime('%w', {compiler.process(element.clauses, **kw)}) AS INTEGER) + 6) % 7)"
+
+
+def bitflag_property(mask_attribute: str, bit: int, default_mask: int) -> hybrid_property:
+    """
+    Boolean attribute stored as one bit of an integer bitmask column
+
+    Reads and writes behave like a Boolean column on instances. In queries it
+    compiles to ``mask & bit != 0``.
+
+    Args:
+        mask_attribute: Name of the mapped integer column holding the flags
+        bit: Bit value of this flag
+        default_mask: Column default, used before the row has a mask
+    """
+    def _mask(instance):
+        mask = getattr(instance, mask_attribute)
+        return default_mask if mask is None else mask
+
+    def fget(instance):
+        return bool(_mask(instance) & bit)
+
+    def fset(instance, value):
+        mask = _mask(instance)
+        setattr(instance, mask_attribute, mask | bit if value else mask & ~bit)
+
+    def expression(cls):
+        return getattr(cls, mask_attribute).op("&")(bit) != 0
+
+    return hybrid_property(fget, fset, expr=expression)
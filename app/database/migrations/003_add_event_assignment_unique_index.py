@@ -0,0 +1,32 @@
+"""Add unique (event_id, student_id) index to event assignments
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Remove duplicate assignments so the unique index can be built
+    op.execute("""
+        DELETE FROM event_assignments
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM event_assignments GROUP BY event_id, student_id
+        )
+    """)
+    
+    # Unique index gives bulk assignment its ON CONFLICT target
+    op.create_index('uq_event_assignments_event_student', 'event_assignments', ['event_id', 'student_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_event_assignments_event_student', table_name='event_assignments')
@@ -0,0 +1,32 @@
+"""Store form submission data as JSONB with a GIN index (PostgreSQL)
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite keeps storing JSON as text; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("ALTER TABLE form_submissions ALTER COLUMN data TYPE jsonb USING data::jsonb")
+    op.create_index('ix_form_submissions_data_gin', 'form_submissions', ['data'], postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('ix_form_submissions_data_gin', table_name='form_submissions')
+    op.execute("ALTER TABLE form_submissions ALTER COLUMN data TYPE json USING data::json")
@@ -0,0 +1,49 @@
+"""Convert event and date-sheet status columns to native enums (PostgreSQL)
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type name, allowed values)
+ENUM_COLUMNS = [
+    ('events', 'target_type', 'event_target_type', ('school_wide', 'teachers', 'class_specific')),
+    ('events', 'status', 'event_status', ('active', 'cancelled', 'completed')),
+    ('datesheets', 'status', 'datesheet_status', ('draft', 'published', 'archived')),
+]
+
+
+def upgrade():
+    # SQLite keeps VARCHAR storage; the CHECK constraint applies to newly created tables
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column, type_name, values in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::text::{type_name}")
+    
+    op.create_index('ix_events_status', 'events', ['status'])
+    op.create_index('ix_datesheets_status', 'datesheets', ['status'])
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('ix_datesheets_status', table_name='datesheets')
+    op.drop_index('ix_events_status', table_name='events')
+    
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text")
+        postgresql.ENUM(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
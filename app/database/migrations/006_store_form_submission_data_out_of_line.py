@@ -0,0 +1,27 @@
+"""Keep form submission data out of the main heap tuple (PostgreSQL)
+
+Superseded: FormSubmission.data is loaded with every submission, so storing
+it uncompressed out of line only made each read fetch more TOAST pages. The
+revision is kept, empty, so the migration chain stays intact.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
@@ -0,0 +1,39 @@
+"""Tighten financial string columns
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+# (table, column, new length)
+STRING_COLUMNS = [
+    ('fee_types', 'name', 100),
+    ('fee_types', 'description', 255),
+    ('fee_structures', 'academic_year', 20),
+    ('fee_structures', 'frequency', 20),
+    ('transactions', 'receipt_number', 32),
+]
+
+
+def upgrade():
+    # SQLite ignores VARCHAR lengths; only PostgreSQL needs the type change
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column, length in STRING_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length), existing_type=sa.String())
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, column, length in STRING_COLUMNS:
+            op.alter_column(table, column, type_=sa.String(), existing_type=sa.String(length))
@@ -0,0 +1,56 @@
+"""Switch high-volume tables to BIGINT identity primary keys (PostgreSQL)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+IDENTITY_TABLES = ['invoices', 'transactions', 'form_submissions', 'event_assignments']
+
+# (table, column) foreign keys that must match the widened primary keys
+FOREIGN_KEYS = [
+    ('transactions', 'invoice_id'),
+]
+
+
+def upgrade():
+    # SQLite rowids are already 64-bit; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in IDENTITY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE bigint")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (START WITH 1 CACHE 100)")
+        # Continue numbering after the existing rows
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+    
+    for table, column in FOREIGN_KEYS:
+        op.alter_column(table, column, type_=sa.BigInteger(), existing_type=sa.Integer())
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in FOREIGN_KEYS:
+        op.alter_column(table, column, type_=sa.Integer(), existing_type=sa.BigInteger())
+    
+    for table in IDENTITY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE integer")
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
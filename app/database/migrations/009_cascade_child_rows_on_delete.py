@@ -0,0 +1,46 @@
+"""Cascade deletes of form, event and invoice children in the database
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.sqlite_tables import rebuild_foreign_key
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table)
+CASCADE_FOREIGN_KEYS = [
+    ('form_fields', 'form_id', 'forms'),
+    ('form_field_options', 'field_id', 'form_fields'),
+    ('form_submissions', 'form_id', 'forms'),
+    ('event_assignments', 'event_id', 'events'),
+    ('transactions', 'invoice_id', 'invoices'),
+]
+
+
+def _recreate_foreign_keys(ondelete):
+    bind = op.get_bind()
+    for table, column, referent in CASCADE_FOREIGN_KEYS:
+        if bind.dialect.name != 'postgresql':
+            # SQLite cannot alter constraints in place; rebuild the table instead
+            rebuild_foreign_key(bind, table, column, referent, ondelete)
+            continue
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade():
+    _recreate_foreign_keys(None)
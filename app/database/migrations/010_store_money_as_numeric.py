@@ -0,0 +1,51 @@
+"""Store fee, invoice and payment amounts as NUMERIC(12, 2)
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# (table, column)
+MONEY_COLUMNS = [
+    ('fee_structures', 'amount'),
+    ('invoices', 'amount_due'),
+    ('transactions', 'amount_paid'),
+]
+
+
+def upgrade():
+    # SQLite stores NUMERIC and REAL with the same affinity rules; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Numeric(12, 2),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f'{column}::numeric(12,2)',
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(12, 2),
+            existing_nullable=False,
+            postgresql_using=f'{column}::double precision',
+        )
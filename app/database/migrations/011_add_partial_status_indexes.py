@@ -0,0 +1,37 @@
+"""Add partial indexes for pending/unpaid invoices and active events
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, predicate)
+PARTIAL_INDEXES = [
+    ('ix_invoices_pending', 'invoices', ['due_date'], "status = 'PENDING'"),
+    ('ix_invoices_unpaid', 'invoices', ['student_id', 'due_date'], "status <> 'PAID'"),
+    ('ix_events_active_date', 'events', ['date'], "status = 'active'"),
+]
+
+
+def upgrade():
+    # Both PostgreSQL and SQLite support partial indexes
+    for name, table, columns, predicate in PARTIAL_INDEXES:
+        op.create_index(
+            name, table, columns,
+            postgresql_where=sa.text(predicate),
+            sqlite_where=sa.text(predicate),
+        )
+
+
+def downgrade():
+    for name, table, columns, predicate in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table)
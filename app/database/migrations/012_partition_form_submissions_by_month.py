@@ -0,0 +1,120 @@
+"""Range-partition form submissions by month of submission (PostgreSQL)
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# Months to pre-create beyond the current one; later rows land in the
+# default partition until the next partitions are added
+MONTHS_AHEAD = 12
+
+
+def _next_month(month_start):
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def create_monthly_partitions(start, months):
+    """Create form_submissions partitions for ``months`` months from ``start``"""
+    month_start = date(start.year, start.month, 1)
+    for _ in range(months):
+        month_end = _next_month(month_start)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS form_submissions_{month_start:%Ym%m} "
+            f"PARTITION OF form_submissions "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+        )
+        month_start = month_end
+
+
+def upgrade():
+    # SQLite has no table partitioning; nothing to do there
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    
+    op.execute("ALTER TABLE form_submissions RENAME TO form_submissions_unpartitioned")
+    op.execute(
+        "ALTER TABLE form_submissions_unpartitioned "
+        "RENAME CONSTRAINT form_submissions_pkey TO form_submissions_unpartitioned_pkey"
+    )
+    op.execute("UPDATE form_submissions_unpartitioned SET submitted_at = now() WHERE submitted_at IS NULL")
+    
+    # The partition key has to be part of the primary key
+    op.execute("CREATE SEQUENCE form_submissions_part_id_seq AS bigint")
+    op.execute("""
+        CREATE TABLE form_submissions (
+            id bigint NOT NULL DEFAULT nextval('form_submissions_part_id_seq'),
+            form_id integer NOT NULL REFERENCES forms (id) ON DELETE CASCADE,
+            user_id integer NOT NULL REFERENCES users (id),
+            data jsonb NOT NULL,
+            submitted_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, submitted_at)
+        ) PARTITION BY RANGE (submitted_at)
+    """)
+    op.execute("ALTER SEQUENCE form_submissions_part_id_seq OWNED BY form_submissions.id")
+    op.execute("CREATE TABLE form_submissions_default PARTITION OF form_submissions DEFAULT")
+    
+    oldest = bind.execute(sa.text("SELECT MIN(submitted_at) FROM form_submissions_unpartitioned")).scalar()
+    today = date.today()
+    first_month = oldest.date() if oldest else today
+    months = (today.year - first_month.year) * 12 + today.month - first_month.month + 1 + MONTHS_AHEAD
+    create_monthly_partitions(first_month, months)
+    
+    op.execute("""
+        INSERT INTO form_submissions (id, form_id, user_id, data, submitted_at)
+        SELECT id, form_id, user_id, data, submitted_at FROM form_submissions_unpartitioned
+    """)
+    op.execute(
+        "SELECT setval('form_submissions_part_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM form_submissions"
+    )
+    op.execute("DROP TABLE form_submissions_unpartitioned")
+    
+    op.create_index('ix_form_submissions_id', 'form_submissions', ['id'])
+    op.create_index('ix_form_submissions_form_id', 'form_submissions', ['form_id'])
+    op.create_index('ix_form_submissions_data_gin', 'form_submissions', ['data'], postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("""
+        CREATE TABLE form_submissions_unpartitioned (
+            id bigint GENERATED ALWAYS AS IDENTITY (START WITH 1 CACHE 100) PRIMARY KEY,
+            form_id integer NOT NULL REFERENCES forms (id) ON DELETE CASCADE,
+            user_id integer NOT NULL REFERENCES users (id),
+            data jsonb NOT NULL,
+            submitted_at timestamptz NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO form_submissions_unpartitioned (id, form_id, user_id, data, submitted_at)
+        OVERRIDING SYSTEM VALUE
+        SELECT id, form_id, user_id, data, submitted_at FROM form_submissions
+    """)
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('form_submissions_unpartitioned', 'id'), "
+        "COALESCE(MAX(id), 0) + 1, false) FROM form_submissions_unpartitioned"
+    )
+    op.execute("DROP TABLE form_submissions CASCADE")
+    op.execute("ALTER TABLE form_submissions_unpartitioned RENAME TO form_submissions")
+    op.execute(
+        "ALTER TABLE form_submissions "
+        "RENAME CONSTRAINT form_submissions_unpartitioned_pkey TO form_submissions_pkey"
+    )
+    op.create_index('ix_form_submissions_id', 'form_submissions', ['id'])
+    op.create_index('ix_form_submissions_data_gin', 'form_submissions', ['data'], postgresql_using='gin')
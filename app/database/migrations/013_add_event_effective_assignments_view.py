@@ -0,0 +1,49 @@
+"""Resolve school-wide and class-wide event audiences through a view
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.events import EVENT_EFFECTIVE_ASSIGNMENTS_SELECT
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(f"CREATE OR REPLACE VIEW event_effective_assignments AS {EVENT_EFFECTIVE_ASSIGNMENTS_SELECT}")
+    else:
+        op.execute(f"CREATE VIEW IF NOT EXISTS event_effective_assignments AS {EVENT_EFFECTIVE_ASSIGNMENTS_SELECT}")
+    
+    # Rows for broad audiences are now derived by the view
+    op.execute("""
+        DELETE FROM event_assignments
+        WHERE event_id IN (
+            SELECT id FROM events WHERE target_type IN ('school_wide', 'class_specific')
+        )
+    """)
+
+
+def downgrade():
+    # Materialize the derived audience back into per-student rows
+    op.execute("""
+        INSERT INTO event_assignments (event_id, student_id, created_at)
+        SELECT e.id, s.id, CURRENT_TIMESTAMP
+        FROM events e
+        JOIN students s
+          ON s.is_active
+         AND (e.target_type = 'school_wide'
+              OR (e.target_type = 'class_specific' AND s.current_class_id = e.target_class_id))
+        WHERE NOT EXISTS (
+            SELECT 1 FROM event_assignments ea WHERE ea.event_id = e.id AND ea.student_id = s.id
+        )
+    """)
+    op.execute("DROP VIEW IF EXISTS event_effective_assignments")
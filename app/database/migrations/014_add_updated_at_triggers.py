@@ -0,0 +1,38 @@
+"""Maintain updated_at with database triggers
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.triggers import updated_at_trigger_ddl
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+TABLES = ['events', 'forms', 'form_fields']
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for table in TABLES:
+        for statement in updated_at_trigger_ddl(table, dialect):
+            op.execute(statement)
+
+
+def downgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for table in TABLES:
+        if is_postgresql:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        else:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at")
+    
+    if is_postgresql:
+        op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,42 @@
+"""Add composite indexes for hostel attendance and book issue lookups
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_hostel_attendance_student_date', 'hostel_attendance', ['student_id', 'date'], None),
+    ('ix_hostel_attendance_room_date', 'hostel_attendance', ['room_id', 'date'], None),
+    ('ix_book_issues_member_due', 'book_issues', ['member_id', 'due_date'], None),
+    ('ix_book_issues_open_due', 'book_issues', ['due_date'], 'return_date IS NULL'),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, predicate in INDEXES:
+            where = sa.text(predicate) if predicate else None
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                postgresql_where=where,
+                sqlite_where=where,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, predicate in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
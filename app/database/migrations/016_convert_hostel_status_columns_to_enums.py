@@ -0,0 +1,50 @@
+"""Store hostel status, condition and priority columns as native enums
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type name, allowed values)
+ENUM_COLUMNS = [
+    ('hostel_rooms', 'condition', 'hostel_room_condition', ('excellent', 'good', 'fair', 'poor')),
+    ('hostel_allocations', 'status', 'hostel_allocation_status',
+     ('allocated', 'checked_in', 'checked_out', 'cancelled')),
+    ('hostel_maintenance_requests', 'priority', 'hostel_maintenance_priority',
+     ('low', 'medium', 'high', 'urgent')),
+    ('hostel_maintenance_requests', 'status', 'hostel_maintenance_status',
+     ('reported', 'assigned', 'in_progress', 'completed', 'cancelled')),
+    ('hostel_fee_payments', 'status', 'hostel_payment_status',
+     ('pending', 'completed', 'failed', 'refunded')),
+    ('hostel_attendance', 'status', 'hostel_attendance_status', ('present', 'absent', 'late', 'leave')),
+]
+
+
+def upgrade():
+    # SQLite keeps VARCHAR storage; the CHECK constraint applies to newly created tables
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column, type_name, values in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::text::{type_name}")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text")
+        postgresql.ENUM(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,101 @@
+"""Range-partition hostel attendance by month of attendance date (PostgreSQL)
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+# Months to pre-create beyond the current one; later rows land in the
+# default partition until the next partitions are added
+MONTHS_AHEAD = 12
+
+INDEXES = [
+    ('ix_hostel_attendance_id', ['id']),
+    ('ix_hostel_attendance_date', ['date']),
+    ('ix_hostel_attendance_student_date', ['student_id', 'date']),
+    ('ix_hostel_attendance_room_date', ['room_id', 'date']),
+]
+
+
+def _next_month(month_start):
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def create_monthly_partitions(start, months):
+    """Create hostel_attendance partitions for ``months`` months from ``start``"""
+    month_start = date(start.year, start.month, 1)
+    for _ in range(months):
+        month_end = _next_month(month_start)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS hostel_attendance_{month_start:%Ym%m} "
+            f"PARTITION OF hostel_attendance "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+        )
+        month_start = month_end
+
+
+def _swap_in_table(partitioned):
+    """Rebuild hostel_attendance from hostel_attendance_old, partitioned or not"""
+    # Columns, defaults and CHECKs come across with LIKE; keys are added explicitly
+    op.execute(f"""
+        CREATE TABLE hostel_attendance (
+            LIKE hostel_attendance_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY ({'id, date' if partitioned else 'id'}),
+            FOREIGN KEY (student_id) REFERENCES students (id),
+            FOREIGN KEY (room_id) REFERENCES hostel_rooms (id),
+            FOREIGN KEY (marked_by) REFERENCES users (id)
+        ){' PARTITION BY RANGE (date)' if partitioned else ''}
+    """)
+    # The id default still points at the old table's sequence; hand it over
+    # so dropping the old table leaves it in place
+    op.execute("ALTER SEQUENCE hostel_attendance_id_seq OWNED BY hostel_attendance.id")
+    if partitioned:
+        op.execute("CREATE TABLE hostel_attendance_default PARTITION OF hostel_attendance DEFAULT")
+        bind = op.get_bind()
+        oldest = bind.execute(sa.text("SELECT MIN(date) FROM hostel_attendance_old")).scalar()
+        today = date.today()
+        first_month = oldest or today
+        months = (today.year - first_month.year) * 12 + today.month - first_month.month + 1 + MONTHS_AHEAD
+        create_monthly_partitions(first_month, months)
+    
+    op.execute("INSERT INTO hostel_attendance SELECT * FROM hostel_attendance_old")
+    op.execute("DROP TABLE hostel_attendance_old")
+    for index_name, columns in INDEXES:
+        op.create_index(index_name, 'hostel_attendance', columns)
+
+
+def upgrade():
+    # SQLite has no table partitioning; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("ALTER TABLE hostel_attendance RENAME TO hostel_attendance_old")
+    op.execute("ALTER TABLE hostel_attendance_old RENAME CONSTRAINT hostel_attendance_pkey TO hostel_attendance_old_pkey")
+    for index_name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}_old")
+    # The partition key has to be part of the primary key
+    _swap_in_table(partitioned=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("ALTER TABLE hostel_attendance RENAME TO hostel_attendance_old")
+    op.execute("ALTER TABLE hostel_attendance_old RENAME CONSTRAINT hostel_attendance_pkey TO hostel_attendance_old_pkey")
+    for index_name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}_old")
+    _swap_in_table(partitioned=False)
@@ -0,0 +1,48 @@
+"""Store the hostel fee month as the first day of the month
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite keeps dates as ISO text; complete "2024-01" to "2024-01-01"
+        op.execute(
+            "UPDATE hostel_fee_payments SET fee_month = fee_month || '-01' "
+            "WHERE length(fee_month) = 7"
+        )
+        return
+    
+    op.execute(
+        "ALTER TABLE hostel_fee_payments ALTER COLUMN fee_month TYPE date "
+        "USING to_date(fee_month || '-01', 'YYYY-MM-DD')"
+    )
+    op.create_index(
+        'ix_hostel_fee_payments_fee_month_brin', 'hostel_fee_payments', ['fee_month'],
+        postgresql_using='brin',
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.execute("UPDATE hostel_fee_payments SET fee_month = substr(fee_month, 1, 7)")
+        return
+    
+    op.drop_index('ix_hostel_fee_payments_fee_month_brin', table_name='hostel_fee_payments')
+    op.execute(
+        "ALTER TABLE hostel_fee_payments ALTER COLUMN fee_month TYPE VARCHAR(20) "
+        "USING to_char(fee_month, 'YYYY-MM')"
+    )
@@ -0,0 +1,33 @@
+"""Allow one hostel attendance row per student per day
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the most recently marked row for any duplicated (student_id, date)
+    op.execute("""
+        DELETE FROM hostel_attendance
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM hostel_attendance GROUP BY student_id, date
+        )
+    """)
+    # Unique index gives the attendance upsert its ON CONFLICT target and
+    # replaces the plain composite index
+    op.drop_index('ix_hostel_attendance_student_date', table_name='hostel_attendance')
+    op.create_index('uq_hostel_attendance_student_date', 'hostel_attendance', ['student_id', 'date'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_hostel_attendance_student_date', table_name='hostel_attendance')
+    op.create_index('ix_hostel_attendance_student_date', 'hostel_attendance', ['student_id', 'date'])
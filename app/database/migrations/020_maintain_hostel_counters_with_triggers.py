@@ -0,0 +1,52 @@
+"""Maintain hostel block room counts and room occupancy with triggers
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17 19:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.triggers import counter_trigger_ddl
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+OCCUPYING_ALLOCATION = "{row}.status IN ('allocated', 'checked_in')"
+
+# (child table, foreign key, parent table, counter, condition, watched columns)
+COUNTERS = [
+    ('hostel_rooms', 'block_id', 'hostel_blocks', 'total_rooms', None, ()),
+    ('hostel_allocations', 'room_id', 'hostel_rooms', 'current_occupancy', OCCUPYING_ALLOCATION, ('status',)),
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for child, foreign_key, parent, counter, condition, watched in COUNTERS:
+        # Start from the true counts; the triggers keep them current from here
+        where = f" AND {condition.format(row=child)}" if condition else ""
+        op.execute(
+            f"UPDATE {parent} SET {counter} = "
+            f"(SELECT COUNT(*) FROM {child} WHERE {child}.{foreign_key} = {parent}.id{where})"
+        )
+        for statement in counter_trigger_ddl(
+            child, foreign_key, parent, counter, dialect, condition=condition, watched_columns=watched
+        ):
+            op.execute(statement)
+
+
+def downgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for child, _, _, counter, _, _ in COUNTERS:
+        name = f"{child}_{counter}"
+        if is_postgresql:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{name} ON {child}")
+            op.execute(f"DROP FUNCTION IF EXISTS maintain_{name}()")
+        else:
+            for suffix in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS trg_{name}_{suffix}")
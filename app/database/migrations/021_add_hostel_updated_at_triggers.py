@@ -0,0 +1,42 @@
+"""Maintain hostel updated_at columns with database triggers
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+
+from app.database.triggers import updated_at_trigger_ddl
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'hostel_blocks',
+    'hostel_rooms',
+    'hostel_allocations',
+    'hostel_maintenance_requests',
+    'hostel_fee_payments',
+    'hostel_attendance',
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for table in TABLES:
+        for statement in updated_at_trigger_ddl(table, dialect):
+            op.execute(statement)
+
+
+def downgrade():
+    # set_updated_at() is shared with the tables from migration 014 and stays
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for table in TABLES:
+        if is_postgresql:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        else:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at")
@@ -0,0 +1,38 @@
+"""Store system notification target roles as JSONB with a GIN index (PostgreSQL)
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite keeps storing JSON as text; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute(
+        "ALTER TABLE system_notifications ALTER COLUMN target_roles TYPE jsonb "
+        "USING NULLIF(target_roles, '')::jsonb"
+    )
+    op.create_index(
+        'ix_system_notifications_target_roles_gin', 'system_notifications', ['target_roles'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('ix_system_notifications_target_roles_gin', table_name='system_notifications')
+    op.execute("ALTER TABLE system_notifications ALTER COLUMN target_roles TYPE text USING target_roles::text")
@@ -0,0 +1,45 @@
+"""Store live class and class attendance times as timestamptz
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs written as naive UTC until now
+TIME_COLUMNS = [
+    ('live_classes', 'start_time'),
+    ('class_attendance', 'join_time'),
+    ('class_attendance', 'leave_time'),
+]
+
+
+def upgrade():
+    # SQLite has no separate zoned timestamp type; only the index applies there
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, column in TIME_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamptz "
+                f"USING {column} AT TIME ZONE 'UTC'"
+            )
+    
+    op.create_index('ix_live_classes_status_start_time', 'live_classes', ['status', 'start_time'])
+
+
+def downgrade():
+    op.drop_index('ix_live_classes_status_start_time', table_name='live_classes')
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, column in TIME_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamp "
+                f"USING {column} AT TIME ZONE 'UTC'"
+            )
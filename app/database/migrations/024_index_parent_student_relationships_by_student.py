@@ -0,0 +1,27 @@
+"""Index parent-student links by student
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-17 21:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The (parent_id, student_id) primary key cannot serve student_id IN (...) lookups
+    op.create_index(
+        'ix_parent_student_relationships_student_parent', 'parent_student_relationships',
+        ['student_id', 'parent_id'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_parent_student_relationships_student_parent', table_name='parent_student_relationships')
@@ -0,0 +1,34 @@
+"""Add composite indexes for student attendance and grade lookups
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns); the attendance ones may already exist from migration 001
+INDEXES = [
+    ('idx_attendance_records_student_date', 'attendance_records', ['student_id', 'date']),
+    ('idx_attendance_records_class_date', 'attendance_records', ['class_id', 'date']),
+    ('ix_grades_student_year_term', 'grades', ['student_id', 'academic_year', 'term']),
+    ('ix_grades_student_subject', 'grades', ['student_id', 'subject_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+
+def downgrade():
+    for name, _, _ in INDEXES:
+        if name.startswith('ix_'):
+            op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,50 @@
+"""Store live class, report card and student JSON columns as JSONB (PostgreSQL)
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-17 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ('live_classes', 'jitsi_settings'),
+    ('class_attendance', 'device_info'),
+    ('report_card_templates', 'fields'),
+    ('report_cards', 'data'),
+    ('students', 'dynamic_data'),
+]
+
+# (index name, table, column) for the columns that are filtered on
+GIN_INDEXES = [
+    ('ix_report_cards_data_gin', 'report_cards', 'data'),
+    ('ix_students_dynamic_data_gin', 'students', 'dynamic_data'),
+]
+
+
+def upgrade():
+    # SQLite keeps storing JSON as text; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
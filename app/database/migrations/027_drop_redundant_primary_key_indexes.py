@@ -0,0 +1,44 @@
+"""Drop secondary indexes that duplicate primary keys on student and class tables
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+# Tables whose "id" carried both the primary key index and an ix_<table>_id index
+TABLES = [
+    'students',
+    'attendance_records',
+    'grades',
+    'student_documents',
+    'student_notes',
+    'student_achievements',
+    'attendance_policies',
+    'attendance_sessions',
+    'period_attendance',
+    'attendance_exceptions',
+    'attendance_notifications',
+    'live_classes',
+    'class_attendance',
+    'report_card_templates',
+    'report_cards',
+]
+
+
+def upgrade():
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_id")
+
+
+def downgrade():
+    for table in TABLES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_id ON {table} (id)")
@@ -0,0 +1,37 @@
+"""Generate grade percentage from score and max_score in the database
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+PERCENTAGE_EXPRESSION = "CASE WHEN max_score > 0 THEN score * 100.0 / max_score ELSE 0 END"
+
+
+def upgrade():
+    op.drop_column('grades', 'percentage')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            f"ALTER TABLE grades ADD COLUMN percentage double precision "
+            f"GENERATED ALWAYS AS ({PERCENTAGE_EXPRESSION}) STORED"
+        )
+    else:
+        # SQLite can only add VIRTUAL generated columns to an existing table.
+        # The model declares it stored, which is what create_all() builds;
+        # either way the value follows score and max_score.
+        op.execute(f"ALTER TABLE grades ADD COLUMN percentage FLOAT GENERATED ALWAYS AS ({PERCENTAGE_EXPRESSION}) VIRTUAL")
+
+
+def downgrade():
+    op.drop_column('grades', 'percentage')
+    op.add_column('grades', sa.Column('percentage', sa.Float(), nullable=True))
+    op.execute(f"UPDATE grades SET percentage = {PERCENTAGE_EXPRESSION}")
@@ -0,0 +1,55 @@
+"""Store live class status as a checked lowercase string
+
+Stored values change: rows were written with the enum member names
+("SCHEDULED", "IN_PROGRESS", ...) and are rewritten to the lowercase values
+("scheduled", "in_progress", ...). Anything reading live_classes.status
+directly from the database must expect the new spelling. NULL statuses
+become 'scheduled'.
+
+On PostgreSQL the native liveclassstatus type is replaced by VARCHAR(16)
+with the ck_live_classes_status CHECK constraint. SQLite cannot add a
+constraint to an existing table, so there only the values are rewritten.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-17 23:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+VALUES = ('scheduled', 'in_progress', 'completed', 'canceled')
+CONSTRAINT = 'ck_live_classes_status'
+
+
+def upgrade():
+    op.execute("UPDATE live_classes SET status = 'SCHEDULED' WHERE status IS NULL")
+    if op.get_bind().dialect.name != 'postgresql':
+        op.execute("UPDATE live_classes SET status = lower(status)")
+        return
+    
+    op.execute("ALTER TABLE live_classes ALTER COLUMN status TYPE VARCHAR(16) USING lower(status::text)")
+    op.execute("ALTER TABLE live_classes ALTER COLUMN status SET NOT NULL")
+    op.create_check_constraint(CONSTRAINT, 'live_classes', f"status IN {VALUES}")
+    op.execute("DROP TYPE IF EXISTS liveclassstatus")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        op.execute("UPDATE live_classes SET status = upper(status)")
+        return
+    
+    op.drop_constraint(CONSTRAINT, 'live_classes', type_='check')
+    postgresql.ENUM(*(value.upper() for value in VALUES), name='liveclassstatus').create(op.get_bind(), checkfirst=True)
+    op.execute("ALTER TABLE live_classes ALTER COLUMN status DROP NOT NULL")
+    op.execute(
+        "ALTER TABLE live_classes ALTER COLUMN status TYPE liveclassstatus "
+        "USING upper(status)::liveclassstatus"
+    )
@@ -0,0 +1,37 @@
+"""Delete class attendance with its live class in the database
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.sqlite_tables import rebuild_foreign_key
+
+# revision identifiers, used by Alembic.
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+CONSTRAINT = 'class_attendance_live_class_id_fkey'
+
+
+def _recreate_foreign_key(ondelete):
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite cannot alter constraints in place; rebuild the table instead
+        rebuild_foreign_key(bind, 'class_attendance', 'live_class_id', 'live_classes', ondelete)
+        return
+    op.drop_constraint(CONSTRAINT, 'class_attendance', type_='foreignkey')
+    op.create_foreign_key(CONSTRAINT, 'class_attendance', 'live_classes', ['live_class_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_foreign_key('CASCADE')
+
+
+def downgrade():
+    _recreate_foreign_key(None)
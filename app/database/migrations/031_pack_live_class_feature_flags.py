@@ -0,0 +1,45 @@
+"""Pack live class enable_* flags into a feature_flags bitmask
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-18 00:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+# (boolean column, bit) -- must match the FLAG_* constants in app/models/live_class.py
+FLAG_COLUMNS = [
+    ('enable_chat', 1),
+    ('enable_whiteboard', 2),
+    ('enable_screen_sharing', 4),
+    ('enable_recording', 8),
+    ('enable_breakout_rooms', 16),
+    ('enable_polls', 32),
+    ('enable_reactions', 64),
+]
+ALL_FEATURES = 127
+
+
+def upgrade():
+    op.add_column(
+        'live_classes',
+        sa.Column('feature_flags', sa.Integer(), nullable=False, server_default=str(ALL_FEATURES)),
+    )
+    packed = " + ".join(f"CASE WHEN {column} THEN {bit} ELSE 0 END" for column, bit in FLAG_COLUMNS)
+    op.execute(f"UPDATE live_classes SET feature_flags = {packed}")
+    for column, _ in FLAG_COLUMNS:
+        op.drop_column('live_classes', column)
+
+
+def downgrade():
+    for column, bit in FLAG_COLUMNS:
+        op.add_column('live_classes', sa.Column(column, sa.Boolean(), nullable=False, server_default=sa.true()))
+        op.execute(f"UPDATE live_classes SET {column} = (feature_flags & {bit}) != 0")
+    op.drop_column('live_classes', 'feature_flags')
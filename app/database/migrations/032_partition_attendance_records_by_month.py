@@ -0,0 +1,105 @@
+"""Range-partition student attendance records by month of attendance date (PostgreSQL)
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+# Months to pre-create beyond the current one; later rows land in the
+# default partition until the next partitions are added
+MONTHS_AHEAD = 12
+
+FOREIGN_KEYS = [
+    ('student_id', 'students'),
+    ('class_id', 'classes'),
+    ('policy_id', 'attendance_policies'),
+    ('marked_by', 'users'),
+    ('verified_by', 'users'),
+]
+
+INDEXES = [
+    ('ix_attendance_records_date', ['date']),
+    ('idx_attendance_records_student_date', ['student_id', 'date']),
+    ('idx_attendance_records_class_date', ['class_id', 'date']),
+]
+
+
+def _next_month(month_start):
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def create_monthly_partitions(start, months):
+    """Create attendance_records partitions for ``months`` months from ``start``"""
+    month_start = date(start.year, start.month, 1)
+    for _ in range(months):
+        month_end = _next_month(month_start)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS attendance_records_{month_start:%Ym%m} "
+            f"PARTITION OF attendance_records "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+        )
+        month_start = month_end
+
+
+def _swap_in_table(partitioned):
+    """Rebuild attendance_records from attendance_records_old, partitioned or not"""
+    op.execute("ALTER TABLE attendance_records RENAME TO attendance_records_old")
+    op.execute("ALTER TABLE attendance_records_old RENAME CONSTRAINT attendance_records_pkey TO attendance_records_old_pkey")
+    for index_name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}_old")
+    
+    # Columns, defaults and CHECKs come across with LIKE; keys are added explicitly
+    foreign_keys = ",\n".join(
+        f"FOREIGN KEY ({column}) REFERENCES {referent} (id)" for column, referent in FOREIGN_KEYS
+    )
+    op.execute(f"""
+        CREATE TABLE attendance_records (
+            LIKE attendance_records_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY ({'id, date' if partitioned else 'id'}),
+            {foreign_keys}
+        ){' PARTITION BY RANGE (date)' if partitioned else ''}
+    """)
+    # The id default still points at the old table's sequence; hand it over
+    # so dropping the old table leaves it in place
+    op.execute("ALTER SEQUENCE attendance_records_id_seq OWNED BY attendance_records.id")
+    if partitioned:
+        op.execute("CREATE TABLE attendance_records_default PARTITION OF attendance_records DEFAULT")
+        oldest = op.get_bind().execute(sa.text("SELECT MIN(date) FROM attendance_records_old")).scalar()
+        today = date.today()
+        first_month = oldest or today
+        months = (today.year - first_month.year) * 12 + today.month - first_month.month + 1 + MONTHS_AHEAD
+        create_monthly_partitions(first_month, months)
+    
+    op.execute("INSERT INTO attendance_records SELECT * FROM attendance_records_old")
+    op.execute("DROP TABLE attendance_records_old")
+    for index_name, columns in INDEXES:
+        op.create_index(index_name, 'attendance_records', columns)
+
+
+def upgrade():
+    # SQLite has no table partitioning; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # The partition key has to be part of the primary key
+    _swap_in_table(partitioned=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    _swap_in_table(partitioned=False)
@@ -0,0 +1,37 @@
+"""Delete invoices with their student in the database
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-18 02:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.sqlite_tables import rebuild_foreign_key
+
+# revision identifiers, used by Alembic.
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+CONSTRAINT = 'invoices_student_id_fkey'
+
+
+def _recreate_foreign_key(ondelete):
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite cannot alter constraints in place; rebuild the table instead
+        rebuild_foreign_key(bind, 'invoices', 'student_id', 'students', ondelete)
+        return
+    op.drop_constraint(CONSTRAINT, 'invoices', type_='foreignkey')
+    op.create_foreign_key(CONSTRAINT, 'invoices', 'students', ['student_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_foreign_key('CASCADE')
+
+
+def downgrade():
+    _recreate_foreign_key(None)
@@ -0,0 +1,50 @@
+"""Delete student-owned rows with their student in the database
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.sqlite_tables import rebuild_foreign_key
+
+# revision identifiers, used by Alembic.
+revision = '034'
+down_revision = '033'
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table)
+FOREIGN_KEYS = [
+    ('attendance_records', 'student_id', 'students'),
+    ('grades', 'student_id', 'students'),
+    ('assignment_submissions', 'student_id', 'students'),
+    ('exam_results', 'student_id', 'students'),
+    ('student_documents', 'student_id', 'students'),
+    ('student_notes', 'student_id', 'students'),
+    ('student_achievements', 'student_id', 'students'),
+    # Exam answers go with their result, so cascading results stays unblocked
+    ('exam_answers', 'result_id', 'exam_results'),
+]
+
+
+def _recreate_foreign_keys(ondelete):
+    bind = op.get_bind()
+    for table, column, referent in FOREIGN_KEYS:
+        if bind.dialect.name != 'postgresql':
+            # SQLite cannot alter constraints in place; rebuild the table instead
+            rebuild_foreign_key(bind, table, column, referent, ondelete)
+            continue
+        constraint = f'{table}_{column}_fkey'
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(constraint, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade():
+    _recreate_foreign_keys(None)
@@ -0,0 +1,53 @@
+"""Tighten live class topic and student file path columns
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-18 04:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '035'
+down_revision = '034'
+branch_labels = None
+depends_on = None
+
+# (table, column, old length, new length)
+PATH_COLUMNS = [
+    ('student_documents', 'file_path', 500, 320),
+    ('student_achievements', 'certificate_path', 500, 320),
+]
+
+
+def upgrade():
+    # SQLite ignores VARCHAR lengths and cannot alter columns in place; the
+    # tables pick up the new definitions when they are recreated from the models
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # The create endpoint always requires a topic; backfill any legacy gaps
+    op.execute("UPDATE live_classes SET topic = 'Untitled class' WHERE topic IS NULL")
+    op.alter_column(
+        'live_classes', 'topic',
+        existing_type=sa.String(),
+        type_=sa.String(200),
+        nullable=False,
+        postgresql_using='left(topic, 200)',
+    )
+    
+    # Paths are not truncated: a longer stored path makes the migration fail
+    # instead of silently pointing at the wrong file
+    for table, column, old_length, new_length in PATH_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.String(old_length), type_=sa.String(new_length))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column, old_length, new_length in PATH_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.String(new_length), type_=sa.String(old_length))
+    
+    op.alter_column('live_classes', 'topic', existing_type=sa.String(200), type_=sa.String(), nullable=True)
@@ -0,0 +1,40 @@
+"""Add report card lookup and draft indexes
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-18 05:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '036'
+down_revision = '035'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_report_cards_student_term', 'report_cards', ['student_id', 'term_id'], None),
+    ('ix_report_cards_drafts', 'report_cards', ['term_id', 'class_id'], "status = 'draft'"),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, predicate in INDEXES:
+            where = sa.text(predicate) if predicate else None
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                postgresql_where=where,
+                sqlite_where=where,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, predicate in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Store attendance locations and policy working days as JSONB (PostgreSQL)
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-18 06:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '037'
+down_revision = '036'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ('attendance_records', 'check_in_location'),
+    ('attendance_records', 'check_out_location'),
+    ('attendance_policies', 'working_days'),
+]
+
+
+def upgrade():
+    # SQLite keeps storing JSON as text; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
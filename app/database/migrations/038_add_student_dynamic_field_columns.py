@@ -0,0 +1,38 @@
+"""Promote filtered student form fields out of dynamic_data into generated columns
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-10-18 07:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '038'
+down_revision = '037'
+branch_labels = None
+depends_on = None
+
+# dynamic_data keys that get their own column, named after the key
+PROMOTED_KEYS = ['grade_level', 'parent_email']
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for key in PROMOTED_KEYS:
+        if is_postgresql:
+            op.add_column('students', sa.Column(key, sa.String(), sa.Computed(f"dynamic_data->>'{key}'", persisted=True)))
+        else:
+            # SQLite can only add VIRTUAL generated columns to an existing table
+            op.execute(
+                f"ALTER TABLE students ADD COLUMN {key} VARCHAR "
+                f"GENERATED ALWAYS AS (json_extract(dynamic_data, '$.{key}')) VIRTUAL"
+            )
+        op.create_index(f'ix_students_{key}', 'students', [key])
+
+
+def downgrade():
+    for key in PROMOTED_KEYS:
+        op.drop_index(f'ix_students_{key}', table_name='students')
+        op.drop_column('students', key)
@@ -0,0 +1,35 @@
+"""Add absence and period attendance indexes
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-10-18 08:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '039'
+down_revision = '038'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_attendance_records_absent_date', 'attendance_records', ['date', 'student_id'], "status = 'absent'"),
+    ('ix_period_attendance_student_date', 'period_attendance', ['student_id', 'date'], None),
+    ('ix_period_attendance_session_date', 'period_attendance', ['session_id', 'date'], None),
+]
+
+
+def upgrade():
+    # Not CONCURRENTLY: attendance_records is partitioned on PostgreSQL, and
+    # partitioned tables only accept plain CREATE INDEX
+    for name, table, columns, predicate in INDEXES:
+        where = sa.text(predicate) if predicate else None
+        op.create_index(name, table, columns, postgresql_where=where, sqlite_where=where)
+
+
+def downgrade():
+    for name, table, columns, predicate in INDEXES:
+        op.drop_index(name, table_name=table)
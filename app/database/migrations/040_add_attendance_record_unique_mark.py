@@ -0,0 +1,40 @@
+"""Allow one attendance mark per student, class and day
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '040'
+down_revision = '039'
+branch_labels = None
+depends_on = None
+
+CONSTRAINT = 'uq_attendance_records_student_date_class'
+
+
+def upgrade():
+    # Keep the most recently marked row for any duplicated (student_id, date, class_id)
+    op.execute("""
+        DELETE FROM attendance_records
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM attendance_records GROUP BY student_id, date, class_id
+        )
+    """)
+    # The key includes the partition key (date), so PostgreSQL accepts it on
+    # the partitioned table; it is the ON CONFLICT target of the attendance upsert
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_unique_constraint(CONSTRAINT, 'attendance_records', ['student_id', 'date', 'class_id'])
+    else:
+        op.create_index(CONSTRAINT, 'attendance_records', ['student_id', 'date', 'class_id'], unique=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint(CONSTRAINT, 'attendance_records', type_='unique')
+    else:
+        op.drop_index(CONSTRAINT, table_name='attendance_records')
@@ -0,0 +1,46 @@
+"""Enforce natural keys on period attendance and attendance exceptions
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '041'
+down_revision = '040'
+branch_labels = None
+depends_on = None
+
+# (constraint name, table, columns)
+UNIQUE_KEYS = [
+    ('uq_period_attendance_student_session_date', 'period_attendance', ['student_id', 'session_id', 'date']),
+    ('uq_attendance_exceptions_student_date_type', 'attendance_exceptions', ['student_id', 'date', 'exception_type']),
+]
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for name, table, columns in UNIQUE_KEYS:
+        # Keep the most recent row for any duplicated key
+        op.execute(f"""
+            DELETE FROM {table}
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM {table} GROUP BY {', '.join(columns)}
+            )
+        """)
+        if is_postgresql:
+            op.create_unique_constraint(name, table, columns)
+        else:
+            op.create_index(name, table, columns, unique=True)
+
+
+def downgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for name, table, columns in UNIQUE_KEYS:
+        if is_postgresql:
+            op.drop_constraint(name, table, type_='unique')
+        else:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,57 @@
+"""Store attendance status and type columns as native enums
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '042'
+down_revision = '041'
+branch_labels = None
+depends_on = None
+
+ATTENDANCE_STATUSES = ('present', 'absent', 'late', 'excused', 'half_day', 'sick_leave', 'personal_leave', 'emergency_leave')
+
+# (table, column, enum type name, allowed values)
+ENUM_COLUMNS = [
+    ('attendance_records', 'status', 'attendance_status', ATTENDANCE_STATUSES),
+    ('attendance_records', 'attendance_type', 'attendance_type', ('daily', 'period_wise', 'subject_wise', 'activity_wise')),
+    ('period_attendance', 'status', 'period_attendance_status', ('present', 'absent', 'late', 'excused')),
+]
+
+# Partial index whose predicate compares status; rebuilt against the new type
+ABSENT_INDEX = ('ix_attendance_records_absent_date', 'attendance_records', ['date', 'student_id'])
+
+
+def _recreate_absent_index():
+    name, table, columns = ABSENT_INDEX
+    op.create_index(name, table, columns, postgresql_where=sa.text("status = 'absent'"))
+
+
+def upgrade():
+    # SQLite keeps VARCHAR storage; the CHECK constraint applies to newly created tables
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index(ABSENT_INDEX[0], table_name=ABSENT_INDEX[1])
+    for table, column, type_name, values in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::text::{type_name}")
+    _recreate_absent_index()
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index(ABSENT_INDEX[0], table_name=ABSENT_INDEX[1])
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text")
+        postgresql.ENUM(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
+    _recreate_absent_index()
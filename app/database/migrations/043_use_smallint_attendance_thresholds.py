@@ -0,0 +1,44 @@
+"""Store attendance thresholds and absence limits as SMALLINT
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '043'
+down_revision = '042'
+branch_labels = None
+depends_on = None
+
+# (table, column)
+SMALL_COLUMNS = [
+    ('attendance_policies', 'late_threshold_minutes'),
+    ('attendance_policies', 'early_departure_threshold_minutes'),
+    ('attendance_policies', 'max_consecutive_absences'),
+    ('attendance_policies', 'max_total_absences'),
+    ('attendance_policies', 'notify_after_consecutive_absences'),
+    ('attendance_policies', 'auto_mark_absent_after_minutes'),
+    ('attendance_policies', 'grace_period_minutes'),
+    ('attendance_sessions', 'late_threshold_minutes'),
+]
+
+
+def upgrade():
+    # SQLite stores every integer the same way; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in SMALL_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.Integer(), type_=sa.SmallInteger())
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, column in SMALL_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.SmallInteger(), type_=sa.Integer())
@@ -0,0 +1,44 @@
+"""Delete period attendance, exceptions and notifications with their student
+
+Revision ID: 044
+Revises: 043
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.sqlite_tables import rebuild_foreign_key
+
+# revision identifiers, used by Alembic.
+revision = '044'
+down_revision = '043'
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table)
+FOREIGN_KEYS = [
+    ('period_attendance', 'student_id', 'students'),
+    ('attendance_exceptions', 'student_id', 'students'),
+    ('attendance_notifications', 'student_id', 'students'),
+]
+
+
+def _recreate_foreign_keys(ondelete):
+    bind = op.get_bind()
+    for table, column, referent in FOREIGN_KEYS:
+        if bind.dialect.name != 'postgresql':
+            # SQLite cannot alter constraints in place; rebuild the table instead
+            rebuild_foreign_key(bind, table, column, referent, ondelete)
+            continue
+        constraint = f'{table}_{column}_fkey'
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(constraint, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade():
+    _recreate_foreign_keys(None)
@@ -0,0 +1,27 @@
+"""Index pending attendance notifications and announce new ones with NOTIFY
+
+Superseded: nothing in this tree dispatches attendance notifications, so
+neither the pending index nor the NOTIFY trigger had a reader. The revision
+is kept, empty, so the migration chain stays intact.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '045'
+down_revision = '044'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
@@ -0,0 +1,58 @@
+"""Pack attendance policy working days into a working_days_mask bitmask
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '046'
+down_revision = '045'
+branch_labels = None
+depends_on = None
+
+# Bit n is date.weekday() == n -- must match WEEKDAY_NAMES in app/models/student.py
+WEEKDAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+MONDAY_TO_FRIDAY = 31
+
+
+def _contains_day(is_postgresql, name):
+    if is_postgresql:
+        return f"working_days ? '{name}'"
+    return f"EXISTS (SELECT 1 FROM json_each(working_days) WHERE lower(value) = '{name}')"
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    op.add_column(
+        'attendance_policies',
+        sa.Column('working_days_mask', sa.SmallInteger(), nullable=False, server_default=str(MONDAY_TO_FRIDAY)),
+    )
+    op.execute("UPDATE attendance_policies SET working_days_mask = 0 WHERE working_days IS NOT NULL")
+    for bit, name in enumerate(WEEKDAY_NAMES):
+        op.execute(
+            f"UPDATE attendance_policies SET working_days_mask = working_days_mask | {1 << bit} "
+            f"WHERE working_days IS NOT NULL AND {_contains_day(is_postgresql, name)}"
+        )
+    op.drop_column('attendance_policies', 'working_days')
+
+
+def downgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    if is_postgresql:
+        op.add_column('attendance_policies', sa.Column('working_days', postgresql.JSONB(), nullable=True))
+        append = "working_days || to_jsonb('{name}'::text)"
+    else:
+        op.add_column('attendance_policies', sa.Column('working_days', sa.JSON(), nullable=True))
+        append = "json_insert(working_days, '$[#]', '{name}')"
+    op.execute("UPDATE attendance_policies SET working_days = '[]'")
+    for bit, name in enumerate(WEEKDAY_NAMES):
+        op.execute(
+            f"UPDATE attendance_policies SET working_days = {append.format(name=name)} "
+            f"WHERE working_days_mask & {1 << bit} != 0"
+        )
+    op.drop_column('attendance_policies', 'working_days_mask')
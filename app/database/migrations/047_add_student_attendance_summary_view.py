@@ -0,0 +1,41 @@
+"""Summarize monthly attendance hours per student in student_attendance_summary
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.student import POSTGRESQL_SUMMARY_MONTH, SQLITE_SUMMARY_MONTH, STUDENT_ATTENDANCE_SUMMARY_SELECT
+
+# revision identifiers, used by Alembic.
+revision = '047'
+down_revision = '046'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE MATERIALIZED VIEW IF NOT EXISTS student_attendance_summary AS "
+            + STUDENT_ATTENDANCE_SUMMARY_SELECT.format(month=POSTGRESQL_SUMMARY_MONTH)
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_student_attendance_summary_student_month "
+            "ON student_attendance_summary (student_id, month)"
+        )
+    else:
+        op.execute(
+            "CREATE VIEW IF NOT EXISTS student_attendance_summary AS "
+            + STUDENT_ATTENDANCE_SUMMARY_SELECT.format(month=SQLITE_SUMMARY_MONTH)
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS student_attendance_summary")
+    else:
+        op.execute("DROP VIEW IF EXISTS student_attendance_summary")
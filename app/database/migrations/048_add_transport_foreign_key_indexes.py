@@ -0,0 +1,36 @@
+"""Index transport route, stop and rider foreign keys
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '048'
+down_revision = '047'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_vehicles_route_id', 'vehicles', ['route_id']),
+    ('ix_stops_route_arrival', 'stops', ['route_id', 'arrival_time_am']),
+    ('ix_transport_members_route_stop', 'transport_members', ['route_id', 'stop_id']),
+    ('ix_transport_members_user_id', 'transport_members', ['user_id']),
+]
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,103 @@
+"""Range-partition audit logs by month of timestamp (PostgreSQL)
+
+Revision ID: 049
+Revises: 048
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '049'
+down_revision = '048'
+branch_labels = None
+depends_on = None
+
+# Months to pre-create beyond the current one; later rows land in the
+# default partition until the next partitions are added
+MONTHS_AHEAD = 12
+
+FOREIGN_KEYS = [
+    ('user_id', 'users'),
+]
+
+INDEXES = [
+    ('ix_audit_logs_id', ['id']),
+    ('ix_audit_logs_timestamp', ['timestamp']),
+]
+
+
+def _next_month(month_start):
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+def create_monthly_partitions(start, months):
+    """Create audit_logs partitions for ``months`` months from ``start``"""
+    month_start = date(start.year, start.month, 1)
+    for _ in range(months):
+        month_end = _next_month(month_start)
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS audit_logs_{month_start:%Ym%m} "
+            f"PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+        )
+        month_start = month_end
+
+
+def _swap_in_table(partitioned):
+    """Rebuild audit_logs from audit_logs_old, partitioned or not"""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_old")
+    op.execute("ALTER TABLE audit_logs_old RENAME CONSTRAINT audit_logs_pkey TO audit_logs_old_pkey")
+    for index_name, _ in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {index_name}_old")
+    
+    # Columns, defaults and CHECKs come across with LIKE; keys are added explicitly
+    foreign_keys = ",\n".join(
+        f"FOREIGN KEY ({column}) REFERENCES {referent} (id)" for column, referent in FOREIGN_KEYS
+    )
+    op.execute(f"""
+        CREATE TABLE audit_logs (
+            LIKE audit_logs_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY ({'id, "timestamp"' if partitioned else 'id'}),
+            {foreign_keys}
+        ){' PARTITION BY RANGE ("timestamp")' if partitioned else ''}
+    """)
+    # The id default still points at the old table's sequence; hand it over
+    # so dropping the old table leaves it in place
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    if partitioned:
+        op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+        oldest = op.get_bind().execute(sa.text('SELECT MIN("timestamp") FROM audit_logs_old')).scalar()
+        today = date.today()
+        first_month = oldest or today
+        months = (today.year - first_month.year) * 12 + today.month - first_month.month + 1 + MONTHS_AHEAD
+        create_monthly_partitions(first_month, months)
+    
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_old")
+    op.execute("DROP TABLE audit_logs_old")
+    for index_name, columns in INDEXES:
+        op.create_index(index_name, 'audit_logs', columns)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite has no table partitioning; it only gets the timestamp index
+        op.create_index('ix_audit_logs_timestamp', 'audit_logs', ['timestamp'])
+        return
+    
+    # The partition key has to be part of the primary key
+    _swap_in_table(partitioned=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_audit_logs_timestamp', table_name='audit_logs')
+        return
+    
+    _swap_in_table(partitioned=False)
+    op.drop_index('ix_audit_logs_timestamp', table_name='audit_logs')
@@ -0,0 +1,61 @@
+"""Move campaign target class and user ID lists into link tables
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '050'
+down_revision = '049'
+branch_labels = None
+depends_on = None
+
+# (link table, JSON column on communication_campaigns, target column, referenced table, reverse index)
+LINKS = [
+    ('campaign_target_classes', 'target_classes', 'class_id', 'classes', 'ix_campaign_target_classes_class_campaign'),
+    ('campaign_target_users', 'target_users', 'user_id', 'users', 'ix_campaign_target_users_user_campaign'),
+]
+
+
+def _json_elements(is_postgresql, column):
+    if is_postgresql:
+        return f"json_array_elements_text(c.{column}) AS t(value)"
+    return f"json_each(c.{column}) AS t"
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for table, column, target, referent, index_name in LINKS:
+        op.create_table(
+            table,
+            sa.Column('campaign_id', sa.Integer(), sa.ForeignKey('communication_campaigns.id', ondelete='CASCADE'), primary_key=True),
+            sa.Column(target, sa.Integer(), sa.ForeignKey(f'{referent}.id', ondelete='CASCADE'), primary_key=True),
+        )
+        op.create_index(index_name, table, [target, 'campaign_id'])
+        # Only IDs that still exist are carried over
+        op.execute(f"""
+            INSERT INTO {table} (campaign_id, {target})
+            SELECT DISTINCT c.id, CAST(t.value AS INTEGER)
+            FROM communication_campaigns c, {_json_elements(is_postgresql, column)}
+            WHERE c.{column} IS NOT NULL
+              AND CAST(t.value AS INTEGER) IN (SELECT id FROM {referent})
+        """)
+        op.drop_column('communication_campaigns', column)
+
+
+def downgrade():
+    aggregate = "json_agg({target} ORDER BY {target})" if op.get_bind().dialect.name == 'postgresql' else "json_group_array({target})"
+    for table, column, target, referent, index_name in LINKS:
+        op.add_column('communication_campaigns', sa.Column(column, sa.JSON(), nullable=True))
+        op.execute(f"""
+            UPDATE communication_campaigns
+            SET {column} = (
+                SELECT {aggregate.format(target=target)} FROM {table} WHERE {table}.campaign_id = communication_campaigns.id
+            )
+            WHERE id IN (SELECT campaign_id FROM {table})
+        """)
+        op.drop_table(table)
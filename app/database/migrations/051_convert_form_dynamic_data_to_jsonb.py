@@ -0,0 +1,36 @@
+"""Store class, assignment, exam and teacher form data as JSONB (PostgreSQL)
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '051'
+down_revision = '050'
+branch_labels = None
+depends_on = None
+
+# The list endpoints filter these with ->> equality, which a jsonb_ops GIN
+# index cannot serve, so the columns are converted but not GIN-indexed
+DYNAMIC_DATA_TABLES = ['classes', 'assignments', 'exams', 'teachers']
+
+
+def upgrade():
+    # SQLite keeps storing JSON as text; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in DYNAMIC_DATA_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN dynamic_data TYPE jsonb USING dynamic_data::jsonb")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in DYNAMIC_DATA_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN dynamic_data TYPE json USING dynamic_data::json")
@@ -0,0 +1,33 @@
+"""Store stop coordinates as integer multiples of 1e-7 degree
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '052'
+down_revision = '051'
+branch_labels = None
+depends_on = None
+
+# Must match COORDINATE_SCALE in app/models/transport.py
+COORDINATE_SCALE = 10000000
+COLUMNS = ['latitude', 'longitude']
+
+
+def upgrade():
+    for column in COLUMNS:
+        op.add_column('stops', sa.Column(f'{column}_e7', sa.Integer(), nullable=True))
+        op.execute(f"UPDATE stops SET {column}_e7 = CAST(ROUND({column} * {COORDINATE_SCALE}) AS INTEGER)")
+        op.drop_column('stops', column)
+
+
+def downgrade():
+    for column in COLUMNS:
+        op.add_column('stops', sa.Column(column, sa.Float(), nullable=True))
+        op.execute(f"UPDATE stops SET {column} = {column}_e7 * 1.0 / {COORDINATE_SCALE}")
+        op.drop_column('stops', f'{column}_e7')
@@ -0,0 +1,43 @@
+"""Store teacher performance metric scores as REAL
+
+Revision ID: 053
+Revises: 052
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '053'
+down_revision = '052'
+branch_labels = None
+depends_on = None
+
+METRIC_COLUMNS = [
+    'teaching_effectiveness',
+    'student_engagement',
+    'subject_knowledge',
+    'classroom_management',
+    'punctuality',
+    'communication_skills',
+    'professional_development',
+    'innovation',
+]
+
+
+def upgrade():
+    # SQLite stores every float the same way; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in METRIC_COLUMNS:
+        op.alter_column('teacher_performance', column, existing_type=sa.Float(), type_=sa.REAL())
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in METRIC_COLUMNS:
+        op.alter_column('teacher_performance', column, existing_type=sa.REAL(), type_=sa.Float())
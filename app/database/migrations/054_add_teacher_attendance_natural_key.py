@@ -0,0 +1,39 @@
+"""Enforce one teacher attendance row per teacher and day
+
+Revision ID: 054
+Revises: 053
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '054'
+down_revision = '053'
+branch_labels = None
+depends_on = None
+
+NAME = 'uq_teacher_attendance_teacher_date'
+COLUMNS = ['teacher_id', 'date']
+
+
+def upgrade():
+    # Keep the most recent row for any duplicated day
+    op.execute(f"""
+        DELETE FROM teacher_attendance
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM teacher_attendance GROUP BY {', '.join(COLUMNS)}
+        )
+    """)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_unique_constraint(NAME, 'teacher_attendance', COLUMNS)
+    else:
+        op.create_index(NAME, 'teacher_attendance', COLUMNS, unique=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint(NAME, 'teacher_attendance', type_='unique')
+    else:
+        op.drop_index(NAME, table_name='teacher_attendance')
@@ -0,0 +1,45 @@
+"""Maintain teacher and transport updated_at columns with database triggers
+
+Revision ID: 055
+Revises: 054
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+from app.database.triggers import updated_at_trigger_ddl
+
+# revision identifiers, used by Alembic.
+revision = '055'
+down_revision = '054'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'teachers',
+    'teacher_attendance',
+    'teacher_leaves',
+    'teacher_qualifications',
+    'teacher_trainings',
+    'teacher_performance',
+    'teacher_documents',
+    'vehicles',
+    'routes',
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for table in TABLES:
+        for statement in updated_at_trigger_ddl(table, dialect):
+            op.execute(statement)
+
+
+def downgrade():
+    # set_updated_at() is shared with the tables from migration 014 and stays
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    for table in TABLES:
+        if is_postgresql:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        else:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at")
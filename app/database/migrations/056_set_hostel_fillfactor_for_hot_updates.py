@@ -0,0 +1,39 @@
+"""Leave free space in hostel room and allocation pages for HOT updates
+
+Revision ID: 056
+Revises: 055
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '056'
+down_revision = '055'
+branch_labels = None
+depends_on = None
+
+# Must match HOT_UPDATE_FILLFACTOR in app/models/hostel.py
+FILLFACTOR = 80
+
+TABLES = [
+    'hostel_rooms',
+    'hostel_allocations',
+]
+
+
+def upgrade():
+    # SQLite has no fillfactor storage parameter; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        # Only pages written from now on keep the free space; run VACUUM FULL
+        # or pg_repack off-hours to rewrite the existing ones
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {FILLFACTOR})")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,41 @@
+"""Maintain route rider counts with a trigger on transport_members
+
+Revision ID: 057
+Revises: 056
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.database.triggers import counter_trigger_ddl
+
+# revision identifiers, used by Alembic.
+revision = '057'
+down_revision = '056'
+branch_labels = None
+depends_on = None
+
+NAME = 'transport_members_current_occupancy'
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    op.add_column('routes', sa.Column('current_occupancy', sa.Integer(), nullable=False, server_default='0'))
+    # Start from the true counts; the trigger keeps them current from here
+    op.execute(
+        "UPDATE routes SET current_occupancy = "
+        "(SELECT COUNT(*) FROM transport_members WHERE transport_members.route_id = routes.id)"
+    )
+    for statement in counter_trigger_ddl('transport_members', 'route_id', 'routes', 'current_occupancy', dialect):
+        op.execute(statement)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{NAME} ON transport_members")
+        op.execute(f"DROP FUNCTION IF EXISTS maintain_{NAME}()")
+    else:
+        for suffix in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{NAME}_{suffix}")
+    op.drop_column('routes', 'current_occupancy')
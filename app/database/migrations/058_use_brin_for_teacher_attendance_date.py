@@ -0,0 +1,39 @@
+"""Replace the teacher attendance date B-tree with a BRIN index
+
+Revision ID: 058
+Revises: 057
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '058'
+down_revision = '057'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite has no BRIN indexes and keeps its B-tree; nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_teacher_attendance_date_brin', 'teacher_attendance', ['date'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_teacher_attendance_date', table_name='teacher_attendance', postgresql_concurrently=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    with op.get_context().autocommit_block():
+        op.create_index('ix_teacher_attendance_date', 'teacher_attendance', ['date'], postgresql_concurrently=True)
+        op.drop_index('ix_teacher_attendance_date_brin', table_name='teacher_attendance', postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""
+Column mixins shared by the models
+"""
+
+from sqlalchemy import Column, DateTime, FetchedValue, event
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.sql import func
+
+from app.database.triggers import attach_updated_at_trigger
+
+
+class TimestampMixin:
+    """
+    ``created_at``/``updated_at`` columns with ``updated_at`` kept current by the database
+
+    Every mapped subclass gets the ``updated_at`` trigger, so the ORM never
+    computes or sends the value on flush.
+    """
+
+    @declared_attr
+    def created_at(cls):
+        return Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    @declared_attr
+    def updated_at(cls):
+        return Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False)
+
+
+@event.listens_for(TimestampMixin, "instrument_class", propagate=True)
+def _attach_timestamp_trigger(mapper, class_):
+    attach_updated_at_trigger(mapper.local_table)
@@ -2,12 +2,17 @@
 Database session management for DuckDB
 """
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, create_engine, event, table as table_clause, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import configure_mappers, sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from app.core.config import settings
+from app.database.sqlite_tables import delete_cascaded_rows
+from typing import Any, Dict, List, Optional, Sequence
+import csv
 import duckdb
+import enum
+import io
 import sqlite3
 from pathlib import Path
 
@@ -17,23 +22,108 @@ database_path = settings.DATABASE_URL.replace("duckdb:///", "").replace("sqlite:
 if not database_path.startswith("./"):
     database_path = f"./{database_path}"
 
-# Create SQLite engine for ORM operations (more stable)
-sqlite_url = f"sqlite:///{database_path}"
-engine = create_engine(
-    sqlite_url,
-    echo=settings.DATABASE_ECHO,
-    poolclass=StaticPool,
-    connect_args={
-        "check_same_thread": False,
-    }
-)
+if settings.DATABASE_URL.startswith("postgresql"):
+    # PostgreSQL: pooled connections sized for concurrent request handling
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DATABASE_ECHO,
+        echo_pool="debug" if settings.DATABASE_ECHO else False,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,
+        pool_pre_ping=True,
+        isolation_level="READ COMMITTED",
+        insertmanyvalues_page_size=1000,
+        # INSERTs already go out as multi-row VALUES pages; also group
+        # executemany UPDATEs and DELETEs (ORM flushes) with execute_batch
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=500,
+        query_cache_size=1200,
+    )
+    if settings.DATABASE_REPLICA_URL:
+        # Streaming replica for listings and aggregates that tolerate a few
+        # seconds of lag; keeps those scans off the primary's buffer cache
+        replica_engine = create_engine(
+            settings.DATABASE_REPLICA_URL,
+            echo=settings.DATABASE_ECHO,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,
+            pool_pre_ping=True,
+            query_cache_size=1200,
+        )
+    else:
+        replica_engine = engine
+else:
+    # Create SQLite engine for ORM operations (more stable)
+    sqlite_url = f"sqlite:///{database_path}"
+    engine = create_engine(
+        sqlite_url,
+        echo=settings.DATABASE_ECHO,
+        poolclass=StaticPool,
+        insertmanyvalues_page_size=1000,
+        query_cache_size=1200,
+        connect_args={
+            "check_same_thread": False,
+        }
+    )
+
+    replica_engine = engine
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session factory for read-only queries; falls back to the primary when no
+# replica is configured
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
 # Create declarative base for models
 Base = declarative_base()
 
+
+@event.listens_for(Base, "before_delete", propagate=True)
+def _cascade_sqlite_deletes(mapper, connection, target):
+    # Foreign keys stay off on SQLite, so its ON DELETE CASCADE actions are
+    # applied here for rows deleted through the ORM
+    if connection.dialect.name != "sqlite":
+        return
+    condition = and_(*(
+        column == value for column, value in zip(mapper.primary_key, mapper.primary_key_from_instance(target))
+    ))
+    delete_cascaded_rows(connection, mapper.local_table, condition)
+
+# Loader strategy for many-to-one relationships that callers are expected to
+# eager load; in production a forgotten joinedload/selectinload raises instead
+# of silently issuing one SELECT per row
+RELATIONSHIP_LAZY = "raise_on_sql" if settings.ENVIRONMENT == "production" else "select"
+
+# Batches at least this large are loaded with COPY instead of INSERT on PostgreSQL
+COPY_THRESHOLD = 100
+# NULL marker in COPY CSV data, so that empty strings stay empty strings
+COPY_NULL = "\\N"
+
+def get_db_url() -> str:
+    """
+    Get the URL of the database the ORM engine is connected to
+    
+    Returns:
+        Database URL
+    """
+    return engine.url.render_as_string(hide_password=False)
+
+def get_pool_status() -> str:
+    """
+    Get a summary of the engine's connection pool usage
+    
+    Returns:
+        Pool status description
+    """
+    return engine.pool.status()
+
 def get_db() -> Session:
     """
     Dependency function to get database session
@@ -47,6 +137,21 @@ def get_db() -> Session:
     finally:
         db.close()
 
+def get_read_db() -> Session:
+    """
+    Dependency function to get a session on the read replica
+    
+    Use only for endpoints that never write and can tolerate replication lag.
+    
+    Yields:
+        Read-only database session
+    """
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 def get_db_connection():
     """
     Get raw DuckDB connection for analytics queries
@@ -87,6 +192,112 @@ def create_tables():
     """
     Base.metadata.create_all(bind=engine)
 
+def warm_mappers():
+    """
+    Configure every mapper and resolve its relationships up front
+    
+    Without this the first query after boot pays for configuring the whole
+    registry. Call it once all model modules have been imported.
+    """
+    configure_mappers()
+    for mapper in Base.registry.mappers:
+        for relationship in mapper.relationships:
+            relationship.entity
+
+def dialect_insert(db: Session, table):
+    """
+    Build an INSERT construct for the dialect the session is bound to
+    
+    Both SQLite and PostgreSQL support ``ON CONFLICT`` clauses, but each
+    exposes them through its own ``insert()`` construct.
+    
+    Args:
+        db: Database session
+        table: Mapped class or Table to insert into
+    
+    Returns:
+        Dialect-specific Insert construct
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+def copy_rows(db: Session, table, rows: List[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> int:
+    """
+    Stream rows into a table with PostgreSQL ``COPY ... FROM STDIN``
+    
+    Runs on the session's connection, inside its transaction. Columns left
+    out get their server defaults; Python-side column defaults and ORM
+    events are skipped.
+    
+    Args:
+        db: Database session bound to PostgreSQL
+        table: Table to load
+        rows: Rows keyed by column name; missing keys are copied as NULL
+        columns: Columns to load, defaulting to the keys of the first row
+    
+    Returns:
+        Number of rows copied
+    """
+    if not rows:
+        return 0
+    columns = list(columns or rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            COPY_NULL if row.get(column) is None
+            else row[column].value if isinstance(row[column], enum.Enum)
+            else row[column]
+            for column in columns
+        )
+    buffer.seek(0)
+    
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+    return len(rows)
+
+def copy_rows_skipping_conflicts(
+    db: Session, table, rows: List[Dict[str, Any]], conflict_columns: Sequence[str], columns: Optional[Sequence[str]] = None
+) -> int:
+    """
+    Stream rows into a table with COPY, skipping rows that hit a unique key
+    
+    COPY aborts on the first unique violation, so the rows are copied into a
+    temporary staging table and moved over with
+    ``INSERT ... SELECT ... ON CONFLICT (...) DO NOTHING``.
+    
+    Args:
+        db: Database session bound to PostgreSQL
+        table: Table to load
+        rows: Rows keyed by column name; missing keys are copied as NULL
+        conflict_columns: Columns of the unique constraint to skip conflicts on
+        columns: Columns to load, defaulting to the keys of the first row
+    
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    columns = list(columns or rows[0])
+    column_list = ", ".join(columns)
+    staging = f"{table.name}_staging"
+    
+    db.execute(text(f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {column_list} FROM {table.name} WITH NO DATA"))
+    copy_rows(db, table_clause(staging), rows, columns)
+    result = db.execute(text(
+        f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {staging} "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+    ))
+    # Dropped now rather than at commit so the same transaction can load again
+    db.execute(text(f"DROP TABLE {staging}"))
+    return result.rowcount
+
 def drop_tables():
     """
     Drop all database tables (use with caution!)
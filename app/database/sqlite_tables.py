@@ -0,0 +1,104 @@
+"""
+SQLite table rebuilds for schema changes ALTER TABLE cannot make, and the
+ON DELETE CASCADE actions SQLite skips while foreign keys are off
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import delete, select, text
+
+
+def rebuild_foreign_key(connection, table_name: str, column: str, referent: str, ondelete: Optional[str]):
+    """
+    Change a foreign key's ON DELETE action on SQLite
+
+    SQLite cannot alter a constraint in place, so the table is rebuilt from its
+    own stored definition with only that foreign key clause changed: create a
+    copy, move the rows over, drop the original and rename the copy. The
+    table's indexes and triggers, and any views reading it, are recreated
+    verbatim. Generated columns are left for the copy to compute. Statements
+    are sent to the driver as they are stored, so no text is taken for a bind
+    parameter.
+
+    Foreign key enforcement must be off on the connection, or dropping the
+    original table would fire its children's ON DELETE actions.
+
+    Args:
+        connection: Connection to the SQLite database
+        table_name: Table holding the foreign key
+        column: Foreign key column, referencing ``referent.id``
+        referent: Referenced table
+        ondelete: New ON DELETE action, e.g. "CASCADE"; None for the default
+    """
+    if connection.execute(text("PRAGMA foreign_keys")).scalar():
+        raise RuntimeError(f"Disable PRAGMA foreign_keys before rebuilding {table_name}")
+
+    table_sql = connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table_name}
+    ).scalar_one()
+    clause = re.compile(
+        rf'(FOREIGN KEY\s*\(\s*"?{column}"?\s*\)\s*REFERENCES\s+"?{referent}"?\s*\(\s*"?id"?\s*\))'
+        r'(\s+ON\s+DELETE\s+(?:SET\s+NULL|SET\s+DEFAULT|NO\s+ACTION|RESTRICT|CASCADE))?',
+        re.IGNORECASE,
+    )
+    if not clause.search(table_sql):
+        raise ValueError(f"{table_name} has no foreign key from {column} to {referent}(id)")
+    copy_name = f"_rebuild_{table_name}"
+    copy_sql = clause.sub(lambda match: match.group(1) + (f" ON DELETE {ondelete}" if ondelete else ""), table_sql)
+    copy_sql = re.sub(rf'^CREATE TABLE\s+"?{table_name}"?', f'CREATE TABLE "{copy_name}"', copy_sql, count=1)
+
+    # Hidden columns (generated ones) cannot be inserted into
+    columns = ", ".join(
+        f'"{row[1]}"' for row in connection.execute(text(f'PRAGMA table_xinfo("{table_name}")')) if row[6] == 0
+    )
+    # Index SQL is NULL for the automatic indexes backing UNIQUE and PRIMARY KEY
+    dependents = connection.execute(
+        text("SELECT type, sql FROM sqlite_master WHERE tbl_name = :name AND type IN ('index', 'trigger') AND sql IS NOT NULL"),
+        {"name": table_name},
+    ).all()
+    views = [
+        (name, sql) for name, sql in connection.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'view'"))
+        if re.search(rf'\b{table_name}\b', sql)
+    ]
+
+    statements = (
+        [f'DROP VIEW "{name}"' for name, _ in views]
+        + [
+            copy_sql,
+            f'INSERT INTO "{copy_name}" ({columns}) SELECT {columns} FROM "{table_name}"',
+            f'DROP TABLE "{table_name}"',
+            f'ALTER TABLE "{copy_name}" RENAME TO "{table_name}"',
+        ]
+        + [sql for _, sql in dependents]
+        + [sql for _, sql in views]
+    )
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+def delete_cascaded_rows(connection, table, condition):
+    """
+    Delete the rows an ON DELETE CASCADE foreign key would take with ``table``'s rows
+    
+    The application leaves SQLite's foreign key enforcement off, since older
+    databases hold rows that predate their constraints, and SQLite then skips
+    ON DELETE actions too. This applies them by hand, depth first, for every
+    cascading foreign key in the metadata. Call it before the parent rows are
+    deleted, while ``condition`` still matches them.
+    
+    Args:
+        connection: Connection to the SQLite database
+        table: Table whose rows are about to be deleted
+        condition: WHERE clause matching those rows
+    """
+    for child in table.metadata.tables.values():
+        for foreign_key in child.foreign_keys:
+            # Compare names so foreign keys to tables outside this metadata are not resolved
+            if foreign_key.target_fullname.rsplit(".", 1)[0] != table.fullname:
+                continue
+            if (foreign_key.ondelete or "").upper() != "CASCADE":
+                continue
+            child_condition = foreign_key.parent.in_(select(foreign_key.column).where(condition))
+            delete_cascaded_rows(connection, child, child_condition)
+            connection.execute(delete(child).where(child_condition))
@@ -0,0 +1,143 @@
+"""
+Database-side triggers shared by the models
+"""
+
+from typing import Optional
+
+from sqlalchemy import DDL, Table, event
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger_ddl(table_name: str, dialect: str) -> list:
+    """
+    Build the statements that keep ``updated_at`` current on every UPDATE
+
+    Args:
+        table_name: Table with an ``id`` primary key and ``updated_at`` column
+        dialect: "postgresql" or "sqlite"
+
+    Returns:
+        SQL statements to execute in order
+    """
+    trigger_name = f"trg_{table_name}_updated_at"
+    if dialect == "postgresql":
+        return [
+            SET_UPDATED_AT_FUNCTION,
+            f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}",
+            f"CREATE TRIGGER {trigger_name} BEFORE UPDATE ON {table_name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        ]
+    # SQLite cannot assign NEW in a trigger; touch the row afterwards unless
+    # the statement set updated_at itself (recursive triggers are off)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {trigger_name} AFTER UPDATE ON {table_name} "
+        f"FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at BEGIN "
+        f"UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END",
+    ]
+
+
+def attach_updated_at_trigger(table: Table):
+    """
+    Create the ``updated_at`` trigger whenever the table is created
+
+    Pair with ``server_onupdate=FetchedValue()`` on the column so the ORM
+    neither sends nor caches the value.
+
+    Args:
+        table: Table to attach the trigger to
+    """
+    for dialect in ("postgresql", "sqlite"):
+        for statement in updated_at_trigger_ddl(table.name, dialect):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect=dialect))
+
+
+def counter_trigger_ddl(
+    child_table: str,
+    foreign_key: str,
+    parent_table: str,
+    counter: str,
+    dialect: str,
+    condition: Optional[str] = None,
+    watched_columns: tuple = (),
+) -> list:
+    """
+    Build the statements that keep a parent's child counter current
+
+    Child rows are counted when ``condition`` holds for them. Inserts,
+    deletes, re-parenting and updates that flip the condition adjust the
+    counter by one, so reads never have to aggregate the child table.
+
+    Args:
+        child_table: Table whose rows are counted
+        foreign_key: Column of the child table referencing the parent's ``id``
+        parent_table: Table holding the counter
+        counter: Integer counter column on the parent
+        dialect: "postgresql" or "sqlite"
+        condition: SQL predicate on ``{row}`` (the old or new child row), e.g.
+            ``"{row}.is_active"``; every row counts when omitted
+        watched_columns: Child columns read by ``condition``
+
+    Returns:
+        SQL statements to execute in order
+    """
+    name = f"{child_table}_{counter}"
+    old_counts = (condition or "1 = 1").format(row="OLD")
+    new_counts = (condition or "1 = 1").format(row="NEW")
+    update_columns = ", ".join((foreign_key,) + tuple(watched_columns))
+    decrement = f"UPDATE {parent_table} SET {counter} = {counter} - 1 WHERE id = OLD.{foreign_key}"
+    increment = f"UPDATE {parent_table} SET {counter} = {counter} + 1 WHERE id = NEW.{foreign_key}"
+    if dialect == "postgresql":
+        return [
+            f"""
+CREATE OR REPLACE FUNCTION maintain_{name}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF {old_counts} THEN
+            {decrement};
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF {new_counts} THEN
+            {increment};
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+            f"DROP TRIGGER IF EXISTS trg_{name} ON {child_table}",
+            f"CREATE TRIGGER trg_{name} AFTER INSERT OR DELETE OR UPDATE OF {update_columns} "
+            f"ON {child_table} FOR EACH ROW EXECUTE FUNCTION maintain_{name}()",
+        ]
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{name}_insert AFTER INSERT ON {child_table} "
+        f"FOR EACH ROW WHEN {new_counts} BEGIN {increment}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{name}_delete AFTER DELETE ON {child_table} "
+        f"FOR EACH ROW WHEN {old_counts} BEGIN {decrement}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{name}_update AFTER UPDATE OF {update_columns} ON {child_table} "
+        f"FOR EACH ROW BEGIN {decrement} AND ({old_counts}); {increment} AND ({new_counts}); END",
+    ]
+
+
+def attach_counter_trigger(table: Table, foreign_key: str, parent_table: str, counter: str, **options):
+    """
+    Create a counter trigger (see ``counter_trigger_ddl``) whenever the child table is created
+
+    Args:
+        table: Child table whose rows are counted
+        foreign_key: Column of the child table referencing the parent's ``id``
+        parent_table: Table holding the counter
+        counter: Integer counter column on the parent
+        **options: ``condition`` and ``watched_columns`` for ``counter_trigger_ddl``
+    """
+    for dialect in ("postgresql", "sqlite"):
+        for statement in counter_trigger_ddl(table.name, foreign_key, parent_table, counter, dialect, **options):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect=dialect))
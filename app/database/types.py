@@ -0,0 +1,23 @@
+"""
+Portable column types shared by the database models
+"""
+
+from sqlalchemy import JSON, BigInteger, Enum, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Generic JSON on SQLite, binary JSONB on PostgreSQL so documents are stored
+# pre-parsed and can be covered by GIN indexes
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+# 64-bit keys on PostgreSQL for high-volume tables; SQLite only auto-increments
+# "INTEGER PRIMARY KEY" columns (which are already 64-bit there)
+BigIntegerType = BigInteger().with_variant(Integer, "sqlite")
+
+
+def enum_column_type(enum_class, name):
+    """
+    Enum column storing member values: a native ENUM type on PostgreSQL and
+    VARCHAR(20) with a CHECK constraint on SQLite
+    """
+    return Enum(enum_class, name=name, length=20, native_enum=True, create_constraint=True,
+                values_callable=lambda e: [member.value for member in e])
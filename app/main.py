@@ -15,7 +15,7 @@ import sys
 from pathlib import Path
 
 from app.core.config import settings
-from app.database.session import engine
+from app.database.session import engine, get_pool_status, warm_mappers
 from app.database.init_db import init_db
 from app.api.v1 import auth, students, teachers, classes, assignments, exams, fees, live_classes
 from app.api.v1 import library, transport, hostel, events, cms, crm, reports, communication, forms, report_cards, form_submissions, audit, firebase_auth, role_management, attendance, parents, dashboard
@@ -92,8 +92,9 @@ app.include_router(dashboard.router, prefix=f"{settings.API_V1_STR}/dashboard",
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize the database on startup"""
+    """Initialize the database and configure mappers on startup"""
     init_db()
+    warm_mappers()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -123,6 +124,7 @@ async def health_check():
         return {
             "status": "healthy",
             "database": "connected",
+            "pool": get_pool_status(),
             "version": settings.VERSION,
             "environment": settings.ENVIRONMENT
         }
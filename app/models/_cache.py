@@ -0,0 +1,140 @@
+"""
+Process-local cache for rarely changing reference data (form schemas)
+
+Cached values are immutable snapshots detached from any session, so they can
+be shared safely between requests. Entries expire after a short TTL and are
+dropped once a transaction that wrote the underlying rows through the ORM
+commits.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.form import FieldType, Form, FormField, FormFieldOption
+
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class FormFieldOptionSnapshot:
+    id: int
+    label: str
+    value: str
+    order: int
+
+
+@dataclass(frozen=True)
+class FormFieldSnapshot:
+    id: int
+    label: str
+    field_name: str
+    field_type: FieldType
+    placeholder: Optional[str]
+    default_value: Optional[str]
+    is_required: bool
+    is_filterable: bool
+    is_visible_in_listing: bool
+    validation_rules: Optional[Any]
+    config: Optional[Any]
+    order: int
+    options: Tuple[FormFieldOptionSnapshot, ...]
+
+
+@dataclass(frozen=True)
+class FormSnapshot:
+    id: int
+    name: str
+    key: str
+    description: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    fields: Tuple[FormFieldSnapshot, ...]
+
+
+_form_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
+_form_lock = threading.Lock()
+
+# Session.info flag set when a flush wrote form rows
+_FORM_CACHE_STALE = "form_cache_stale"
+
+
+@cached(_form_cache, key=lambda db, form_key: hashkey(form_key), lock=_form_lock)
+def get_form_by_key(db: Session, form_key: str) -> Optional[FormSnapshot]:
+    """Get a form schema with its fields and options in a single round of queries"""
+    form = db.execute(
+        select(Form)
+        .options(selectinload(Form.fields).selectinload(FormField.options))
+        .where(Form.key == form_key)
+    ).scalar_one_or_none()
+    if not form:
+        return None
+    return FormSnapshot(
+        id=form.id,
+        name=form.name,
+        key=form.key,
+        description=form.description,
+        is_active=form.is_active,
+        created_at=form.created_at,
+        updated_at=form.updated_at,
+        fields=tuple(
+            FormFieldSnapshot(
+                id=field.id,
+                label=field.label,
+                field_name=field.field_name,
+                field_type=field.field_type,
+                placeholder=field.placeholder,
+                default_value=field.default_value,
+                is_required=field.is_required,
+                is_filterable=field.is_filterable,
+                is_visible_in_listing=field.is_visible_in_listing,
+                validation_rules=field.validation_rules,
+                config=field.config,
+                order=field.order,
+                options=tuple(
+                    FormFieldOptionSnapshot(
+                        id=option.id,
+                        label=option.label,
+                        value=option.value,
+                        order=option.order,
+                    )
+                    for option in field.options
+                ),
+            )
+            for field in form.fields
+        ),
+    )
+
+
+def _mark_form_cache_stale(mapper, connection, target):
+    # Other sessions still see the old rows until commit, so only flag the
+    # session here; evicting now would let them cache the old schema again
+    session = Session.object_session(target)
+    if session is not None:
+        session.info[_FORM_CACHE_STALE] = True
+
+
+def _invalidate_form_cache(session):
+    if session.info.pop(_FORM_CACHE_STALE, False):
+        with _form_lock:
+            _form_cache.clear()
+
+
+def _discard_form_cache_flag(session):
+    session.info.pop(_FORM_CACHE_STALE, None)
+
+
+for _model in (Form, FormField, FormFieldOption):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _mark_form_cache_stale)
+
+event.listen(Session, "after_commit", _invalidate_form_cache)
+event.listen(Session, "after_rollback", _discard_form_cache_flag)
@@ -6,6 +6,7 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Foreign
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.types import JSONBType
 
 
 class Subject(Base):
@@ -56,12 +57,12 @@ class Class(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Dynamic data for form builder
-    dynamic_data = Column(JSON, nullable=True)
+    dynamic_data = Column(JSONBType, nullable=True)
     
     # Relationships
     class_teacher = relationship("Teacher", foreign_keys=[class_teacher_id])
     teachers = relationship("Teacher", secondary="teacher_class_associations", back_populates="classes")
-    students = relationship("Student", foreign_keys="Student.current_class_id", back_populates="current_class")
+    students = relationship("Student", back_populates="current_class")
     subjects = relationship("ClassSubject", back_populates="class_info", cascade="all, delete-orphan")
     timetable_slots = relationship("TimetableSlot", back_populates="class_info", cascade="all, delete-orphan")
     assignments = relationship("Assignment", back_populates="class_info", cascade="all, delete-orphan")
@@ -155,7 +156,7 @@ class Assignment(Base):
     status = Column(String(20), default="pending", nullable=False)  # pending, submitted, overdue, graded
     
     # Dynamic data for form builder
-    dynamic_data = Column(JSON, nullable=True)
+    dynamic_data = Column(JSONBType, nullable=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -177,7 +178,7 @@ class AssignmentSubmission(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     assignment_id = Column(Integer, ForeignKey("assignments.id"), nullable=False)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     
     # Submission content
     submission_text = Column(Text, nullable=True)
@@ -252,7 +253,7 @@ class Exam(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Dynamic data for form builder
-    dynamic_data = Column(JSON, nullable=True)
+    dynamic_data = Column(JSONBType, nullable=True)
     
     # Relationships
     class_info = relationship("Class", back_populates="exams")
@@ -296,7 +297,7 @@ class ExamResult(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     exam_id = Column(Integer, ForeignKey("exams.id"), nullable=False)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     
     # Result details
     score = Column(Float, nullable=False)
@@ -324,7 +325,7 @@ class ExamResult(Base):
     # Relationships
     exam = relationship("Exam", back_populates="results")
     student = relationship("Student", back_populates="exam_results")
-    answers = relationship("ExamAnswer", back_populates="result", cascade="all, delete-orphan")
+    answers = relationship("ExamAnswer", back_populates="result", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<ExamResult(id={self.id}, exam_id={self.exam_id}, student_id={self.student_id}, score={self.score})>"
@@ -335,7 +336,7 @@ class ExamAnswer(Base):
     __tablename__ = "exam_answers"
     
     id = Column(Integer, primary_key=True, index=True)
-    result_id = Column(Integer, ForeignKey("exam_results.id"), nullable=False)
+    result_id = Column(Integer, ForeignKey("exam_results.id", ondelete="CASCADE"), nullable=False)
     question_id = Column(Integer, ForeignKey("exam_questions.id"), nullable=False)
     answer_text = Column(Text, nullable=True)
     selected_option = Column(String(10), nullable=True)  # For MCQ questions
@@ -17,6 +17,9 @@ class ActionType(enum.Enum):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    # Migration-only on PostgreSQL: migration 049 partitions the table by month
+    # of timestamp with primary key (id, timestamp). The single id key here is
+    # what SQLite needs, so create_all() does not reproduce the migrated table.
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Nullable for system actions
@@ -26,7 +29,9 @@ class AuditLog(Base):
     resource_id = Column(String(50), nullable=True)  # ID of the affected resource
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Partition key of the monthly range partitions on PostgreSQL (migration 049);
+    # indexed for the recent-activity feed
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     
     # Relationships
     user = relationship("User")
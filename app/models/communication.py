@@ -2,7 +2,7 @@
 Communication and notification database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Table, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
@@ -204,6 +204,25 @@ class SMSTemplate(Base):
         return f"<SMSTemplate(id={self.id}, name='{self.name}', type='{self.template_type}')>"
 
 
+# Classes and individual users a campaign targets
+campaign_target_classes = Table(
+    'campaign_target_classes',
+    Base.metadata,
+    Column('campaign_id', Integer, ForeignKey('communication_campaigns.id', ondelete='CASCADE'), primary_key=True),
+    Column('class_id', Integer, ForeignKey('classes.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key covers campaign -> classes; this covers class -> campaigns
+    Index('ix_campaign_target_classes_class_campaign', 'class_id', 'campaign_id'),
+)
+
+campaign_target_users = Table(
+    'campaign_target_users',
+    Base.metadata,
+    Column('campaign_id', Integer, ForeignKey('communication_campaigns.id', ondelete='CASCADE'), primary_key=True),
+    Column('user_id', Integer, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+    Index('ix_campaign_target_users_user_campaign', 'user_id', 'campaign_id'),
+)
+
+
 class CommunicationCampaign(Base):
     """Communication campaigns for bulk messaging"""
     __tablename__ = "communication_campaigns"
@@ -219,8 +238,6 @@ class CommunicationCampaign(Base):
     
     # Targeting
     target_roles = Column(JSON, nullable=True)  # List of user roles
-    target_classes = Column(JSON, nullable=True)  # List of class IDs
-    target_users = Column(JSON, nullable=True)  # Specific user IDs
     
     # Channels
     channels = Column(JSON, nullable=False)  # email, sms, push, in_app
@@ -250,6 +267,9 @@ class CommunicationCampaign(Base):
     # Relationships
     creator = relationship("User")
     recipients = relationship("CampaignRecipient", back_populates="campaign", cascade="all, delete-orphan")
+    # Batched with one IN query across all loaded campaigns
+    target_classes = relationship("Class", secondary=campaign_target_classes, lazy="selectin", passive_deletes=True)
+    target_users = relationship("User", secondary=campaign_target_users, lazy="selectin", passive_deletes=True)
     
     def __repr__(self):
         return f"<CommunicationCampaign(id={self.id}, name='{self.name}', status='{self.status}')>"
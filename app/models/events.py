@@ -2,10 +2,14 @@
 Event management models
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Date, Time
+import enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Date, Time, Enum, Identity, Index, UniqueConstraint, text
+from sqlalchemy import DDL, FetchedValue, MetaData, Table, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.types import BigIntegerType
+from app.database.triggers import attach_updated_at_trigger
 from datetime import datetime
 
 # Import models to ensure tables exist
@@ -14,9 +18,30 @@ from app.models.student import Student
 from app.models.academic import Class
 
 
+class EventTargetType(str, enum.Enum):
+    SCHOOL_WIDE = "school_wide"
+    TEACHERS = "teachers"
+    CLASS_SPECIFIC = "class_specific"
+
+
+class EventStatus(str, enum.Enum):
+    ACTIVE = "active"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+
+
 class Event(Base):
     """Event model for school events"""
     __tablename__ = "events"
+    __table_args__ = (
+        # Upcoming-events lookups only ever scan active events
+        Index(
+            "ix_events_active_date", "date",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
@@ -30,32 +55,49 @@ class Event(Base):
     location = Column(String(200), nullable=True)
     
     # Targeting
-    target_type = Column(String(20), nullable=False)  # 'school_wide', 'teachers', 'class_specific'
+    target_type = Column(
+        Enum(EventTargetType, name="event_target_type", length=20, native_enum=True, create_constraint=True,
+             values_callable=lambda e: [member.value for member in e]),
+        nullable=False,
+    )
     target_class_id = Column(Integer, ForeignKey("classes.id"), nullable=True)
     
     # Status and metadata
-    status = Column(String(20), default="active")  # active, cancelled, completed
+    status = Column(
+        Enum(EventStatus, name="event_status", length=20, native_enum=True, create_constraint=True,
+             values_callable=lambda e: [member.value for member in e]),
+        default=EventStatus.ACTIVE,
+        index=True,
+    )
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False)
     
     # Relationships
-    creator = relationship("User", foreign_keys=[created_by])
-    target_class = relationship("Class", foreign_keys=[target_class_id])
-    assignments = relationship("EventAssignment", back_populates="event", cascade="all, delete-orphan")
+    # Read-only lookups; list/detail queries opt in with joinedload()
+    creator = relationship("User", foreign_keys=[created_by], lazy="raise", viewonly=True)
+    target_class = relationship("Class", foreign_keys=[target_class_id], lazy="raise", viewonly=True)
+    assignments = relationship("EventAssignment", back_populates="event", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Event(id={self.id}, title='{self.title}', target_type='{self.target_type}')>"
 
 
+attach_updated_at_trigger(Event.__table__)
+
+
 class EventAssignment(Base):
     """Tracks which students are assigned to events"""
     __tablename__ = "event_assignments"
+    __table_args__ = (
+        UniqueConstraint("event_id", "student_id", name="uq_event_assignments_event_student"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
-    id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    id = Column(BigIntegerType, Identity(always=True, start=1, cache=100), primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
     
     # Timestamps
@@ -67,3 +109,45 @@ class EventAssignment(Base):
     
     def __repr__(self):
         return f"<EventAssignment(event_id={self.event_id}, student_id={self.student_id})>"
+
+
+# Effective audience of every event. School-wide and class-wide targets are
+# resolved against the active students on read; only explicit per-student
+# assignments are stored in event_assignments.
+EVENT_EFFECTIVE_ASSIGNMENTS_SELECT = """
+    SELECT e.id AS event_id, s.id AS student_id
+    FROM events e
+    JOIN students s
+      ON s.is_active
+     AND (e.target_type = 'school_wide'
+          OR (e.target_type = 'class_specific' AND s.current_class_id = e.target_class_id))
+    UNION ALL
+    SELECT event_id, student_id FROM event_assignments
+"""
+
+# Kept out of Base.metadata so create_all() never tries to build it as a table
+view_metadata = MetaData()
+
+event_effective_assignments = Table(
+    "event_effective_assignments",
+    view_metadata,
+    Column("event_id", Integer),
+    Column("student_id", Integer),
+    info={"is_view": True},
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(f"CREATE OR REPLACE VIEW event_effective_assignments AS {EVENT_EFFECTIVE_ASSIGNMENTS_SELECT}").execute_if(
+        dialect="postgresql"
+    ),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(f"CREATE VIEW IF NOT EXISTS event_effective_assignments AS {EVENT_EFFECTIVE_ASSIGNMENTS_SELECT}").execute_if(
+        dialect="sqlite"
+    ),
+)
+event.listen(Base.metadata, "before_drop", DDL("DROP VIEW IF EXISTS event_effective_assignments"))
@@ -2,10 +2,17 @@
 Exam and Date-sheet related database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Date, Time, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Date, Time, JSON, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+import enum
+
+
+class DateSheetStatus(str, enum.Enum):
+    DRAFT = "draft"
+    PUBLISHED = "published"
+    ARCHIVED = "archived"
 
 
 class ExamTerm(Base):
@@ -36,7 +43,13 @@ class DateSheet(Base):
     id = Column(Integer, primary_key=True, index=True)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     term_id = Column(Integer, ForeignKey("exam_terms.id"), nullable=False)
-    status = Column(String(20), nullable=False, default="draft")  # draft, published, archived
+    status = Column(
+        Enum(DateSheetStatus, name="datesheet_status", length=20, native_enum=True, create_constraint=True,
+             values_callable=lambda e: [member.value for member in e]),
+        nullable=False,
+        default=DateSheetStatus.DRAFT,
+        index=True,
+    )
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
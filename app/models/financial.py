@@ -1,11 +1,13 @@
 """Financial models for fees, invoices, and transactions."""
 
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Enum, DateTime, Boolean
-from sqlalchemy.orm import relationship
+from typing import List
+from sqlalchemy import Column, Integer, String, Numeric, Date, ForeignKey, Enum, DateTime, Boolean, Identity, Index, bindparam, lambda_stmt, select, text
+from sqlalchemy.orm import relationship, selectinload, column_property, Session
 from sqlalchemy.sql import func
 import enum
 
 from app.database.session import Base
+from app.database.types import BigIntegerType
 
 class FeeCategory(enum.Enum):
     TUITION = "tuition"
@@ -31,8 +33,8 @@ class PaymentStatus(enum.Enum):
 class FeeType(Base):
     __tablename__ = "fee_types"
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, index=True, nullable=False)
-    description = Column(String)
+    name = Column(String(100), unique=True, index=True, nullable=False)
+    description = Column(String(255))
     is_mandatory = Column(Boolean, default=True)
 
 class FeeStructure(Base):
@@ -41,37 +43,67 @@ class FeeStructure(Base):
     id = Column(Integer, primary_key=True, index=True)
     fee_type_id = Column(Integer, ForeignKey("fee_types.id"), nullable=False)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
-    academic_year = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
+    academic_year = Column(String(20), nullable=False)  # e.g., "2024-2025"
+    amount = Column(Numeric(12, 2), nullable=False)
     due_date = Column(Date, nullable=False)
-    frequency = Column(String, nullable=False, default="monthly")
+    frequency = Column(String(20), nullable=False, default="monthly")
 
     fee_type = relationship("FeeType")
     class_obj = relationship("Class")
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (
+        # Partial indexes for the dashboard filters; status holds enum names
+        Index(
+            "ix_invoices_pending", "due_date",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "ix_invoices_unpaid", "student_id", "due_date",
+            postgresql_where=text("status <> 'PAID'"),
+            sqlite_where=text("status <> 'PAID'"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(BigIntegerType, Identity(always=True, start=1, cache=100), primary_key=True, index=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     fee_structure_id = Column(Integer, ForeignKey("fee_structures.id"), nullable=False)
-    amount_due = Column(Float, nullable=False)
+    amount_due = Column(Numeric(12, 2), nullable=False)
     due_date = Column(Date, nullable=False)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING)
     
-    student = relationship("Student")
+    student = relationship("Student", back_populates="fee_payments")
     fee_structure = relationship("FeeStructure")
-    transactions = relationship("Transaction", back_populates="invoice")
+    transactions = relationship("Transaction", back_populates="invoice", cascade="all, delete-orphan", passive_deletes=True)
+
+    @classmethod
+    def for_student(cls, db: Session, student_id: int) -> List["Invoice"]:
+        """Get a student's invoices with their transactions, reusing the cached compiled statement"""
+        stmt = lambda_stmt(lambda: select(Invoice).options(selectinload(Invoice.transactions)))
+        stmt += lambda s: s.where(Invoice.student_id == bindparam("student_id"))
+        return db.execute(stmt, {"student_id": student_id}).scalars().all()
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    invoice_id = Column(Integer, ForeignKey("invoices.id"), nullable=False)
-    amount_paid = Column(Float, nullable=False)
+    id = Column(BigIntegerType, Identity(always=True, start=1, cache=100), primary_key=True, index=True)
+    invoice_id = Column(BigIntegerType, ForeignKey("invoices.id", ondelete="CASCADE"), nullable=False)
+    amount_paid = Column(Numeric(12, 2), nullable=False)
     payment_date = Column(DateTime(timezone=True), server_default=func.now())
     payment_method = Column(Enum(PaymentMethod), nullable=False)
     status = Column(Enum(PaymentStatus), nullable=False)
-    receipt_number = Column(String, unique=True, index=True)
+    receipt_number = Column(String(32), unique=True, index=True)
     
     invoice = relationship("Invoice", back_populates="transactions")
+
+# Total of successful payments against an invoice, summed in the database
+Invoice.amount_paid = column_property(
+    select(func.coalesce(func.sum(Transaction.amount_paid), 0).cast(Numeric(12, 2)))
+    .where(Transaction.invoice_id == Invoice.id, Transaction.status == PaymentStatus.PAID)
+    .correlate_except(Transaction)
+    .scalar_subquery(),
+    deferred=True,
+)
@@ -12,10 +12,12 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     JSON,
+    FetchedValue,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.triggers import attach_updated_at_trigger
 import enum
 
 
@@ -42,6 +44,7 @@ class Form(Base):
     """Model for dynamic forms."""
 
     __tablename__ = "forms"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -54,25 +57,32 @@ class Form(Base):
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
     fields = relationship(
-        "FormField", back_populates="form", cascade="all, delete-orphan"
+        "FormField",
+        back_populates="form",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
         return f"<Form(id={self.id}, key='{self.key}')>"
 
 
+attach_updated_at_trigger(Form.__table__)
+
+
 class FormField(Base):
     """Model for fields within a dynamic form."""
 
     __tablename__ = "form_fields"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
-    form_id = Column(Integer, ForeignKey("forms.id"), nullable=False)
+    form_id = Column(Integer, ForeignKey("forms.id", ondelete="CASCADE"), nullable=False)
     label = Column(String(255), nullable=False)
     field_name = Column(String(100), nullable=False)
     field_type = Column(Enum(FieldType), nullable=False)
@@ -90,26 +100,33 @@ class FormField(Base):
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
     form = relationship("Form", back_populates="fields")
     options = relationship(
-        "FormFieldOption", back_populates="field", cascade="all, delete-orphan"
+        "FormFieldOption",
+        back_populates="field",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
         return f"<FormField(id={self.id}, label='{self.label}', type='{self.field_type}')>"
 
 
+attach_updated_at_trigger(FormField.__table__)
+
+
 class FormFieldOption(Base):
     """Model for options in select, multi-select, radio, etc., fields."""
 
     __tablename__ = "form_field_options"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
-    field_id = Column(Integer, ForeignKey("form_fields.id"), nullable=False)
+    field_id = Column(Integer, ForeignKey("form_fields.id", ondelete="CASCADE"), nullable=False)
     label = Column(String(255), nullable=False)
     value = Column(String(255), nullable=False)
     order = Column(Integer, default=0, nullable=False)
@@ -11,11 +11,13 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     DateTime,
-    JSON,
+    Index,
+    Identity,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.types import BigIntegerType, JSONBType
 import enum
 
 
@@ -23,12 +25,24 @@ class FormSubmission(Base):
     """Model for dynamic forms."""
 
     __tablename__ = "form_submissions"
+    # On PostgreSQL this table comes from the migrations only. Migration 012
+    # range-partitions it by month of submitted_at, keys it on
+    # (id, submitted_at) and numbers ids from a sequence, not this Identity.
+    # create_all() would build the unpartitioned table below instead.
+    __table_args__ = (
+        # Containment lookups on submitted data (PostgreSQL only)
+        Index("ix_form_submissions_data_gin", "data", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    form_id = Column(Integer, ForeignKey("forms.id"), nullable=False)
+    id = Column(BigIntegerType, Identity(always=True, start=1, cache=100), primary_key=True, index=True)
+    form_id = Column(Integer, ForeignKey("forms.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    data = Column(JSON, nullable=False)
-    submitted_at = Column(DateTime(timezone=True), server_default=func.now())
+    data = Column(JSONBType, nullable=False)
+    # Partition key of the monthly range partitions on PostgreSQL (migration 012)
+    submitted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     form = relationship("Form")
 
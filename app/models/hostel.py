@@ -2,13 +2,69 @@
 Hostel and accommodation management database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Date
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-from app.database.session import Base
+import enum
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from sqlalchemy import DDL, Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Date, Index, UniqueConstraint, event
+from sqlalchemy.orm import relationship, Session
+from app.database.session import Base, COPY_THRESHOLD, RELATIONSHIP_LAZY, copy_rows_skipping_conflicts, dialect_insert
+from app.database.mixins import TimestampMixin
+from app.database.types import enum_column_type
+from app.database.triggers import attach_counter_trigger
 
+# Free space left in each heap page of tables whose unindexed status and
+# counter columns are updated in place, so PostgreSQL can keep those updates
+# HOT (heap-only) and skip index maintenance
+HOT_UPDATE_FILLFACTOR = 80
 
-class HostelBlock(Base):
+# Allocations that take up a bed in their room
+OCCUPYING_ALLOCATION = "{row}.status IN ('allocated', 'checked_in')"
+
+
+class RoomCondition(str, enum.Enum):
+    EXCELLENT = "excellent"
+    GOOD = "good"
+    FAIR = "fair"
+    POOR = "poor"
+
+
+class AllocationStatus(str, enum.Enum):
+    ALLOCATED = "allocated"
+    CHECKED_IN = "checked_in"
+    CHECKED_OUT = "checked_out"
+    CANCELLED = "cancelled"
+
+
+class MaintenancePriority(str, enum.Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+class MaintenanceStatus(str, enum.Enum):
+    REPORTED = "reported"
+    ASSIGNED = "assigned"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class HostelPaymentStatus(str, enum.Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REFUNDED = "refunded"
+
+
+class HostelAttendanceStatus(str, enum.Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+    LATE = "late"
+    LEAVE = "leave"
+
+
+class HostelBlock(TimestampMixin, Base):
     """Hostel blocks or buildings"""
     __tablename__ = "hostel_blocks"
     
@@ -19,7 +75,7 @@ class HostelBlock(Base):
     
     # Block details
     total_floors = Column(Integer, nullable=False, default=1)
-    total_rooms = Column(Integer, nullable=False, default=0)
+    total_rooms = Column(Integer, nullable=False, default=0)  # Maintained by a trigger on hostel_rooms
     
     # Amenities
     has_wifi = Column(Boolean, default=True, nullable=False)
@@ -33,10 +89,6 @@ class HostelBlock(Base):
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     warden = relationship("User")
     rooms = relationship("HostelRoom", back_populates="block", cascade="all, delete-orphan")
@@ -45,7 +97,7 @@ class HostelBlock(Base):
         return f"<HostelBlock(id={self.id}, name='{self.block_name}', code='{self.block_code}')>"
 
 
-class HostelRoom(Base):
+class HostelRoom(TimestampMixin, Base):
     """Individual hostel rooms"""
     __tablename__ = "hostel_rooms"
     
@@ -57,7 +109,7 @@ class HostelRoom(Base):
     # Room details
     room_type = Column(String(50), nullable=False)  # single, double, triple, dormitory
     max_occupancy = Column(Integer, nullable=False, default=2)
-    current_occupancy = Column(Integer, nullable=False, default=0)
+    current_occupancy = Column(Integer, nullable=False, default=0)  # Maintained by a trigger on hostel_allocations
     
     # Amenities
     has_attached_bathroom = Column(Boolean, default=False, nullable=False)
@@ -77,14 +129,10 @@ class HostelRoom(Base):
     # Maintenance
     last_cleaned = Column(Date, nullable=True)
     last_maintenance = Column(Date, nullable=True)
-    condition = Column(String(20), nullable=False, default="good")  # excellent, good, fair, poor
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    condition = Column(enum_column_type(RoomCondition, "hostel_room_condition"), nullable=False, default=RoomCondition.GOOD)
     
     # Relationships
-    block = relationship("HostelBlock", back_populates="rooms")
+    block = relationship("HostelBlock", back_populates="rooms", lazy=RELATIONSHIP_LAZY)
     students = relationship("Student", foreign_keys="Student.hostel_room_id", back_populates="hostel_room")
     allocations = relationship("HostelAllocation", back_populates="room", cascade="all, delete-orphan")
     maintenance_requests = relationship("HostelMaintenanceRequest", back_populates="room", cascade="all, delete-orphan")
@@ -93,7 +141,10 @@ class HostelRoom(Base):
         return f"<HostelRoom(id={self.id}, block_id={self.block_id}, number='{self.room_number}')>"
 
 
-class HostelAllocation(Base):
+attach_counter_trigger(HostelRoom.__table__, "block_id", "hostel_blocks", "total_rooms")
+
+
+class HostelAllocation(TimestampMixin, Base):
     """Student hostel room allocations"""
     __tablename__ = "hostel_allocations"
     
@@ -108,7 +159,7 @@ class HostelAllocation(Base):
     planned_check_out = Column(Date, nullable=True)
     
     # Status
-    status = Column(String(20), nullable=False, default="allocated")  # allocated, checked_in, checked_out, cancelled
+    status = Column(enum_column_type(AllocationStatus, "hostel_allocation_status"), nullable=False, default=AllocationStatus.ALLOCATED)
     is_active = Column(Boolean, default=True, nullable=False)
     
     # Fees
@@ -124,20 +175,31 @@ class HostelAllocation(Base):
     # Allocated by
     allocated_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
-    student = relationship("Student")
-    room = relationship("HostelRoom", back_populates="allocations")
-    allocator = relationship("User")
+    student = relationship("Student", lazy=RELATIONSHIP_LAZY)
+    room = relationship("HostelRoom", back_populates="allocations", lazy=RELATIONSHIP_LAZY)
+    allocator = relationship("User", lazy=RELATIONSHIP_LAZY)
     
     def __repr__(self):
         return f"<HostelAllocation(id={self.id}, student_id={self.student_id}, room_id={self.room_id})>"
 
 
-class HostelMaintenanceRequest(Base):
+attach_counter_trigger(
+    HostelAllocation.__table__, "room_id", "hostel_rooms", "current_occupancy",
+    condition=OCCUPYING_ALLOCATION, watched_columns=("status",),
+)
+
+# Keep current_occupancy, is_available and status out of every index, or these
+# updates stop being HOT
+for _table in (HostelRoom.__table__, HostelAllocation.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL(f"ALTER TABLE {_table.name} SET (fillfactor = {HOT_UPDATE_FILLFACTOR})").execute_if(dialect="postgresql"),
+    )
+
+
+class HostelMaintenanceRequest(TimestampMixin, Base):
     """Hostel maintenance and repair requests"""
     __tablename__ = "hostel_maintenance_requests"
     
@@ -149,10 +211,10 @@ class HostelMaintenanceRequest(Base):
     issue_type = Column(String(50), nullable=False)  # plumbing, electrical, furniture, cleaning, etc.
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
-    priority = Column(String(20), nullable=False, default="medium")  # low, medium, high, urgent
+    priority = Column(enum_column_type(MaintenancePriority, "hostel_maintenance_priority"), nullable=False, default=MaintenancePriority.MEDIUM)
     
     # Status tracking
-    status = Column(String(20), nullable=False, default="reported")  # reported, assigned, in_progress, completed, cancelled
+    status = Column(enum_column_type(MaintenanceStatus, "hostel_maintenance_status"), nullable=False, default=MaintenanceStatus.REPORTED)
     assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
     estimated_completion = Column(DateTime(timezone=True), nullable=True)
     actual_completion = Column(DateTime(timezone=True), nullable=True)
@@ -165,10 +227,6 @@ class HostelMaintenanceRequest(Base):
     resolution_notes = Column(Text, nullable=True)
     satisfaction_rating = Column(Integer, nullable=True)  # 1-5 scale
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     room = relationship("HostelRoom", back_populates="maintenance_requests")
     reporter = relationship("User", foreign_keys=[reported_by])
@@ -178,9 +236,15 @@ class HostelMaintenanceRequest(Base):
         return f"<HostelMaintenanceRequest(id={self.id}, room_id={self.room_id}, type='{self.issue_type}')>"
 
 
-class HostelFeePayment(Base):
+class HostelFeePayment(TimestampMixin, Base):
     """Hostel fee payments"""
     __tablename__ = "hostel_fee_payments"
+    __table_args__ = (
+        # Rows arrive roughly in fee-month order, so a block range index stays tiny (PostgreSQL only)
+        Index("ix_hostel_fee_payments_fee_month_brin", "fee_month", postgresql_using="brin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
@@ -193,7 +257,7 @@ class HostelFeePayment(Base):
     payment_method = Column(String(50), nullable=False)  # cash, bank_transfer, online, cheque
     
     # Period covered
-    fee_month = Column(String(20), nullable=True)  # "2024-01" for monthly fees
+    fee_month = Column(Date, nullable=True)  # First day of the month covered, for monthly fees
     fee_year = Column(Integer, nullable=True)
     
     # Transaction details
@@ -201,7 +265,7 @@ class HostelFeePayment(Base):
     receipt_number = Column(String(100), nullable=True)
     
     # Status
-    status = Column(String(20), nullable=False, default="completed")  # pending, completed, failed, refunded
+    status = Column(enum_column_type(HostelPaymentStatus, "hostel_payment_status"), nullable=False, default=HostelPaymentStatus.COMPLETED)
     
     # Collected by
     collected_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -209,10 +273,6 @@ class HostelFeePayment(Base):
     # Notes
     notes = Column(Text, nullable=True)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     student = relationship("Student")
     allocation = relationship("HostelAllocation")
@@ -220,33 +280,43 @@ class HostelFeePayment(Base):
     
     def __repr__(self):
         return f"<HostelFeePayment(id={self.id}, student_id={self.student_id}, amount={self.amount})>"
+    
 
-
-class HostelAttendance(Base):
-    """Daily hostel attendance tracking"""
+class HostelAttendance(TimestampMixin, Base):
+    """
+    Daily hostel attendance tracking
+    
+    Migration 017 range-partitions this table by month of ``date`` on
+    PostgreSQL, keyed on (id, date). The model keeps the single id key SQLite
+    needs, so a PostgreSQL schema must come from the migrations rather than
+    create_all(), which would build an unpartitioned table.
+    """
     __tablename__ = "hostel_attendance"
+    __table_args__ = (
+        # One row per student per day; also serves student date-range lookups
+        UniqueConstraint("student_id", "date", name="uq_hostel_attendance_student_date"),
+        # Attendance for a room over a date range
+        Index("ix_hostel_attendance_room_date", "room_id", "date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
     room_id = Column(Integer, ForeignKey("hostel_rooms.id"), nullable=False)
     
     # Attendance details
+    # Partition key of the monthly range partitions on PostgreSQL (migration 017)
     date = Column(Date, nullable=False, index=True)
     check_in_time = Column(DateTime(timezone=True), nullable=True)
     check_out_time = Column(DateTime(timezone=True), nullable=True)
     is_present_night = Column(Boolean, nullable=True)  # Stayed for the night
     
     # Status
-    status = Column(String(20), nullable=False)  # present, absent, late, leave
+    status = Column(enum_column_type(HostelAttendanceStatus, "hostel_attendance_status"), nullable=False)
     leave_reason = Column(Text, nullable=True)
     
     # Marked by
     marked_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     student = relationship("Student")
     room = relationship("HostelRoom")
@@ -254,3 +324,35 @@ class HostelAttendance(Base):
     
     def __repr__(self):
         return f"<HostelAttendance(student_id={self.student_id}, date={self.date}, status='{self.status}')>"
+    
+    COPY_COLUMNS = (
+        "student_id", "room_id", "date", "check_in_time", "check_out_time", "is_present_night",
+        "status", "leave_reason", "marked_by", "created_at", "updated_at",
+    )
+    
+    @classmethod
+    def bulk_copy(cls, db: Session, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert many attendance rows, streaming them through COPY on PostgreSQL
+        
+        Students already marked for the day are skipped. Large batches on
+        PostgreSQL go through COPY and a staging table; smaller ones, and
+        SQLite, use a batched ``INSERT ... ON CONFLICT (student_id, date) DO NOTHING``.
+        
+        Args:
+            db: Database session
+            records: Attendance rows keyed by column name, all with the same keys
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not records:
+            return 0
+        
+        if db.get_bind().dialect.name != "postgresql" or len(records) < COPY_THRESHOLD:
+            stmt = dialect_insert(db, cls).on_conflict_do_nothing(index_elements=["student_id", "date"])
+            return len(db.scalars(stmt.returning(cls.id), records).all())
+        
+        now = datetime.now(timezone.utc)
+        rows = [{"created_at": now, "updated_at": now, **record} for record in records]
+        return copy_rows_skipping_conflicts(db, cls.__table__, rows, ["student_id", "date"], cls.COPY_COLUMNS)
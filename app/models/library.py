@@ -2,10 +2,14 @@
 Library and Inventory management database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Date, Float
-from sqlalchemy.orm import relationship
+from datetime import date
+from typing import Dict
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Date, Float, Index, and_, case, text, update
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, Session
 from sqlalchemy.sql import func
-from app.database.session import Base
+from app.database.session import Base, RELATIONSHIP_LAZY
+from app.database.expressions import days_since
 
 class BookCategory(Base):
     __tablename__ = "book_categories"
@@ -34,6 +38,41 @@ class Book(Base):
     
     issues = relationship("BookIssue", back_populates="book")
 
+    @hybrid_property
+    def is_available(self):
+        return self.available_copies > 0
+
+    @classmethod
+    def summary_query(cls, db: Session):
+        """Query lightweight (id, title, author, available_copies) rows for listings"""
+        return db.query(cls.id, cls.title, cls.author, cls.available_copies)
+
+    @classmethod
+    def adjust_copies(cls, db: Session, deltas: Dict[int, int]) -> bool:
+        """
+        Apply per-book changes to available_copies in a single conditional UPDATE
+
+        A book is only updated if its count stays between 0 and total_copies,
+        so concurrent issues cannot take the shelf below zero.
+
+        Args:
+            db: Database session
+            deltas: Change in available copies per book ID
+
+        Returns:
+            True if every book was updated; otherwise roll back
+        """
+        if not deltas:
+            return True
+        available_copies = cls.available_copies + case(deltas, value=cls.id, else_=0)
+        result = db.execute(
+            update(cls)
+            .where(cls.id.in_(deltas.keys()), available_copies >= 0, available_copies <= cls.total_copies)
+            .values(available_copies=available_copies)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount == len(deltas)
+
 class LibraryMember(Base):
     __tablename__ = "library_members"
     id = Column(Integer, primary_key=True, index=True)
@@ -45,6 +84,15 @@ class LibraryMember(Base):
 
 class BookIssue(Base):
     __tablename__ = "book_issues"
+    __table_args__ = (
+        # A member's issues by due date, and the overdue scan over open issues
+        Index("ix_book_issues_member_due", "member_id", "due_date"),
+        Index(
+            "ix_book_issues_open_due", "due_date",
+            postgresql_where=text("return_date IS NULL"),
+            sqlite_where=text("return_date IS NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True)
     book_id = Column(Integer, ForeignKey("books.id"), nullable=False)
     member_id = Column(Integer, ForeignKey("library_members.id"), nullable=False)
@@ -53,8 +101,37 @@ class BookIssue(Base):
     due_date = Column(Date, nullable=False)
     return_date = Column(Date, nullable=True)
     
-    book = relationship("Book", back_populates="issues")
-    member = relationship("LibraryMember", back_populates="issues")
+    book = relationship("Book", back_populates="issues", lazy=RELATIONSHIP_LAZY)
+    member = relationship("LibraryMember", back_populates="issues", lazy=RELATIONSHIP_LAZY)
+
+    @hybrid_property
+    def is_overdue(self):
+        return self.return_date is None and self.due_date < date.today()
+
+    @is_overdue.expression
+    def is_overdue(cls):
+        return and_(cls.return_date.is_(None), cls.due_date < func.current_date())
+
+    @hybrid_property
+    def days_overdue(self):
+        if not self.is_overdue:
+            return 0
+        return (date.today() - self.due_date).days
+
+    @days_overdue.expression
+    def days_overdue(cls):
+        return case((cls.is_overdue, days_since(cls.due_date)), else_=0)
+
+    @classmethod
+    def mark_returned(cls, db: Session, issue_id: int) -> bool:
+        """Set today's return date on an open issue; False if it was already returned"""
+        result = db.execute(
+            update(cls)
+            .where(cls.id == issue_id, cls.return_date.is_(None))
+            .values(return_date=func.current_date())
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount == 1
 
 class InventoryCategory(Base):
     __tablename__ = "inventory_categories"
@@ -87,5 +164,5 @@ class InventoryIssue(Base):
     issue_date = Column(Date, default=func.current_date(), nullable=False)
     return_date = Column(Date, nullable=True)
     
-    item = relationship("InventoryItem", back_populates="issues")
-    user = relationship("User")
+    item = relationship("InventoryItem", back_populates="issues", lazy=RELATIONSHIP_LAZY)
+    user = relationship("User", lazy=RELATIONSHIP_LAZY)
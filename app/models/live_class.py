@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Text, Boolean, JSON
-from sqlalchemy.orm import relationship
-from app.database.session import Base
+from sqlalchemy import CheckConstraint, Column, Integer, String, ForeignKey, DateTime, Text, Boolean, Index
+from sqlalchemy.orm import relationship, deferred
+from app.database.session import Base, RELATIONSHIP_LAZY
+from app.database.types import JSONBType
+from app.database.expressions import bitflag_property
 import enum
 
 # Import Class model to ensure it's available for relationships
@@ -12,22 +14,41 @@ class LiveClassStatus(str, enum.Enum):
     COMPLETED = "completed"
     CANCELED = "canceled"
 
+# Bits of LiveClass.feature_flags
+FLAG_CHAT = 1
+FLAG_WHITEBOARD = 2
+FLAG_SCREEN_SHARING = 4
+FLAG_RECORDING = 8
+FLAG_BREAKOUT_ROOMS = 16
+FLAG_POLLS = 32
+FLAG_REACTIONS = 64
+ALL_FEATURES = 127
+
 class LiveClass(Base):
     __tablename__ = "live_classes"
+    __table_args__ = (
+        # Scheduler lookups: classes in a given status starting within a time window
+        Index("ix_live_classes_status_start_time", "status", "start_time"),
+        CheckConstraint(
+            "status IN ('scheduled', 'in_progress', 'completed', 'canceled')", name="ck_live_classes_status"
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    topic = Column(String, index=True)
-    start_time = Column(DateTime, nullable=False)
+    id = Column(Integer, primary_key=True)
+    topic = Column(String(200), index=True, nullable=False)
+    start_time = Column(DateTime(timezone=True), nullable=False)
     duration = Column(Integer, nullable=False)  # in minutes
-    status = Column(Enum(LiveClassStatus), default=LiveClassStatus.SCHEDULED)
+    # Plain string checked by ck_live_classes_status; LiveClassStatus validates it in the app
+    status = Column(String(16), nullable=False, default=LiveClassStatus.SCHEDULED.value)
     recording_url = Column(String, nullable=True)
 
     # Jitsi Meet specific fields
     jitsi_room_name = Column(String(255), unique=True, index=True, nullable=True)
     jitsi_meeting_url = Column(String(500), nullable=True)
     jitsi_meeting_id = Column(String(255), nullable=True)
-    jitsi_settings = Column(JSON, nullable=True)  # Store Jitsi meeting settings
-    jitsi_token = Column(Text, nullable=True)  # JWT token for authentication
+    # Deferred so lookups and listings skip them; undefer_group("jitsi") where they are returned
+    jitsi_settings = deferred(Column(JSONBType, nullable=True), group="jitsi")  # Store Jitsi meeting settings
+    jitsi_token = deferred(Column(Text, nullable=True), group="jitsi")  # JWT token for authentication
     
     # Additional fields
     description = Column(Text, nullable=True)
@@ -38,37 +59,38 @@ class LiveClass(Base):
     mute_upon_entry = Column(Boolean, default=True, nullable=False)
     video_off_upon_entry = Column(Boolean, default=False, nullable=False)
     
-    # Host controls
-    enable_chat = Column(Boolean, default=True, nullable=False)
-    enable_whiteboard = Column(Boolean, default=True, nullable=False)
-    enable_screen_sharing = Column(Boolean, default=True, nullable=False)
-    enable_recording = Column(Boolean, default=True, nullable=False)
-    enable_breakout_rooms = Column(Boolean, default=True, nullable=False)
-    enable_polls = Column(Boolean, default=True, nullable=False)
-    enable_reactions = Column(Boolean, default=True, nullable=False)
+    # Host controls, packed into one integer; the enable_* attributes read and write single bits
+    feature_flags = Column(Integer, default=ALL_FEATURES, server_default=str(ALL_FEATURES), nullable=False)
+    enable_chat = bitflag_property("feature_flags", FLAG_CHAT, ALL_FEATURES)
+    enable_whiteboard = bitflag_property("feature_flags", FLAG_WHITEBOARD, ALL_FEATURES)
+    enable_screen_sharing = bitflag_property("feature_flags", FLAG_SCREEN_SHARING, ALL_FEATURES)
+    enable_recording = bitflag_property("feature_flags", FLAG_RECORDING, ALL_FEATURES)
+    enable_breakout_rooms = bitflag_property("feature_flags", FLAG_BREAKOUT_ROOMS, ALL_FEATURES)
+    enable_polls = bitflag_property("feature_flags", FLAG_POLLS, ALL_FEATURES)
+    enable_reactions = bitflag_property("feature_flags", FLAG_REACTIONS, ALL_FEATURES)
 
     teacher_id = Column(Integer, ForeignKey("users.id"))
     class_id = Column(Integer, ForeignKey("classes.id"))
 
-    teacher = relationship("User", back_populates="hosted_classes")
-    class_ = relationship("Class", back_populates="live_classes")
-    attendance = relationship("ClassAttendance", back_populates="live_class")
+    teacher = relationship("User", back_populates="hosted_classes", lazy=RELATIONSHIP_LAZY)
+    class_ = relationship("Class", back_populates="live_classes", lazy=RELATIONSHIP_LAZY)
+    attendance = relationship("ClassAttendance", back_populates="live_class", passive_deletes=True)
 
 class ClassAttendance(Base):
     __tablename__ = "class_attendance"
 
-    id = Column(Integer, primary_key=True, index=True)
-    join_time = Column(DateTime, nullable=False)
-    leave_time = Column(DateTime, nullable=True)
+    id = Column(Integer, primary_key=True)
+    join_time = Column(DateTime(timezone=True), nullable=False)
+    leave_time = Column(DateTime(timezone=True), nullable=True)
     
     # Jitsi specific attendance fields
     jitsi_participant_id = Column(String(255), nullable=True)
     jitsi_join_token = Column(Text, nullable=True)
     connection_quality = Column(String(50), nullable=True)  # good, poor, etc.
-    device_info = Column(JSON, nullable=True)  # browser, OS, etc.
+    device_info = Column(JSONBType, nullable=True)  # browser, OS, etc.
 
-    live_class_id = Column(Integer, ForeignKey("live_classes.id"))
+    live_class_id = Column(Integer, ForeignKey("live_classes.id", ondelete="CASCADE"))
     user_id = Column(Integer, ForeignKey("users.id"))
 
     live_class = relationship("LiveClass", back_populates="attendance")
-    user = relationship("User", back_populates="live_class_attendance")
\ No newline at end of file
+    user = relationship("User", back_populates="live_class_attendance", lazy=RELATIONSHIP_LAZY)
\ No newline at end of file
@@ -10,11 +10,15 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     DateTime,
-    JSON,
+    Index,
+    text,
 )
-from sqlalchemy.orm import relationship
+from typing import Any, Dict, List
+from sqlalchemy import insert
+from sqlalchemy.orm import relationship, deferred, Session
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.types import JSONBType
 
 
 class ReportCardTemplate(Base):
@@ -22,10 +26,10 @@ class ReportCardTemplate(Base):
 
     __tablename__ = "report_card_templates"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    fields = Column(JSON, nullable=False)  # Stores the template structure
+    fields = Column(JSONBType, nullable=False)  # Stores the template structure
     version = Column(Integer, default=1, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(
@@ -48,13 +52,24 @@ class ReportCard(Base):
     """Model for individual student report cards."""
 
     __tablename__ = "report_cards"
+    __table_args__ = (
+        # Containment lookups on report card data (PostgreSQL only)
+        Index("ix_report_cards_data_gin", "data", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # A student's cards for a term, and the small set of drafts awaiting approval
+        Index("ix_report_cards_student_term", "student_id", "term_id"),
+        Index(
+            "ix_report_cards_drafts", "term_id", "class_id",
+            postgresql_where=text("status = 'draft'"),
+            sqlite_where=text("status = 'draft'"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     template_id = Column(Integer, ForeignKey("report_card_templates.id"), nullable=False)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     term_id = Column(Integer, ForeignKey("exam_terms.id"), nullable=False)
-    data = Column(JSON, nullable=False)  # Stores the filled report card data
+    data = deferred(Column(JSONBType, nullable=False), group="payload")  # Stores the filled report card data
     status = Column(String(20), nullable=False, default="draft")  # draft, submitted, approved
     submitted_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     approved_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -76,4 +91,20 @@ class ReportCard(Base):
     approved_by = relationship("User", foreign_keys=[approved_by_id])
 
     def __repr__(self):
-        return f"<ReportCard(id={self.id}, student_id={self.student_id}, class_id={self.class_id})>"
\ No newline at end of file
+        return f"<ReportCard(id={self.id}, student_id={self.student_id}, class_id={self.class_id})>"
+
+    @classmethod
+    def bulk_create(cls, db: Session, records: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create many report cards in one batched INSERT.
+
+        Args:
+            db: Database session
+            records: Report card rows keyed by column name
+
+        Returns:
+            IDs of the new report cards, in input order
+        """
+        if not records:
+            return []
+        return list(db.scalars(insert(cls).returning(cls.id, sort_by_parameter_order=True), records))
\ No newline at end of file
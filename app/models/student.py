@@ -2,19 +2,57 @@
 Student-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Date, Table, JSON, Time
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, DateTime, Text, ForeignKey, Float, Date, Table, Time, Index, Computed, UniqueConstraint
+from sqlalchemy import DDL, MetaData, case, event, literal, select, text
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
+from sqlalchemy.orm import relationship, deferred, Session
 from sqlalchemy.sql import func
-from app.database.session import Base
+from app.database.session import Base, dialect_insert
+from app.database.types import JSONBType, enum_column_type
+from app.database.expressions import seconds_of_day, weekday, years_since
+from app.models.user import User
 from app.models.financial import Invoice
 from app.models.library import BookIssue, LibraryMember
 from app.models.transport import Route
 from app.models.hostel import HostelRoom
 import enum
-from datetime import time
+from datetime import date, time
+from typing import Any, Dict, List
 
 
 
+# Rows per INSERT statement when upserting attendance
+UPSERT_BATCH_SIZE = 1000
+
+# Day names for AttendancePolicy.working_days_mask; bit 1 << date.weekday() marks a working day
+WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+MONDAY_TO_FRIDAY = 0b0011111
+
+
+class AttendanceStatus(str, enum.Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+    LATE = "late"
+    EXCUSED = "excused"
+    HALF_DAY = "half_day"
+    SICK_LEAVE = "sick_leave"
+    PERSONAL_LEAVE = "personal_leave"
+    EMERGENCY_LEAVE = "emergency_leave"
+
+
+class AttendanceType(str, enum.Enum):
+    DAILY = "daily"
+    PERIOD_WISE = "period_wise"
+    SUBJECT_WISE = "subject_wise"
+    ACTIVITY_WISE = "activity_wise"
+
+
+class PeriodAttendanceStatus(str, enum.Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+    LATE = "late"
+    EXCUSED = "excused"
+
 
 # Association table for parent-student relationships
 parent_student_relationships = Table(
@@ -22,15 +60,21 @@ parent_student_relationships = Table(
     Base.metadata,
     Column('parent_id', Integer, ForeignKey('parents.id'), primary_key=True),
     Column('student_id', Integer, ForeignKey('students.id'), primary_key=True),
-    Column('created_at', DateTime(timezone=True), server_default=func.now())
+    Column('created_at', DateTime(timezone=True), server_default=func.now()),
+    # The primary key covers parent -> students; this covers student -> parents
+    Index('ix_parent_student_relationships_student_parent', 'student_id', 'parent_id'),
 )
 
 
 class Student(Base):
     """Student profile and academic information"""
     __tablename__ = "students"
+    __table_args__ = (
+        # Containment lookups on form builder fields (PostgreSQL only)
+        Index("ix_students_dynamic_data_gin", "dynamic_data", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
     student_id = Column(String(50), unique=True, index=True, nullable=False)  # School-assigned ID
     
@@ -43,8 +87,9 @@ class Student(Base):
     
     # Personal Information
     blood_group = Column(String(5), nullable=True)
-    allergies = Column(Text, nullable=True)
-    medical_conditions = Column(Text, nullable=True)
+    # Free-text profile fields are deferred for listings; undefer_group("extended") on detail views
+    allergies = deferred(Column(Text, nullable=True), group="extended")
+    medical_conditions = deferred(Column(Text, nullable=True), group="extended")
     transportation_mode = Column(String(50), nullable=True)  # bus, car, walk, etc.
     bus_route_id = Column(Integer, ForeignKey("routes.id"), nullable=True)
     
@@ -53,76 +98,123 @@ class Student(Base):
     is_hosteller = Column(Boolean, default=False, nullable=False)
     
     # Dynamic data from form builder
-    dynamic_data = Column(JSON, nullable=True)
+    dynamic_data = Column(JSONBType, nullable=True)
+    # Frequently filtered form fields that only live in dynamic_data, copied
+    # out by the database into indexed columns. Stored on PostgreSQL; SQLite
+    # databases upgraded by migration 038 compute them on read (VIRTUAL)
+    grade_level = Column(String, Computed("dynamic_data->>'grade_level'", persisted=True), index=True)
+    parent_email = Column(String, Computed("dynamic_data->>'parent_email'", persisted=True), index=True)
 
     # Academic Status
     is_active = Column(Boolean, default=True, nullable=False)
     graduation_date = Column(Date, nullable=True)
     dropout_date = Column(Date, nullable=True)
-    dropout_reason = Column(Text, nullable=True)
+    dropout_reason = deferred(Column(Text, nullable=True), group="extended")
     
     # Additional Information
     previous_school = Column(String(200), nullable=True)
     transfer_certificate_number = Column(String(100), nullable=True)
-    hobbies = Column(Text, nullable=True)
-    special_needs = Column(Text, nullable=True)
+    hobbies = deferred(Column(Text, nullable=True), group="extended")
+    special_needs = deferred(Column(Text, nullable=True), group="extended")
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="students")
-    current_class = relationship("Class", foreign_keys=[current_class_id])
-    parents = relationship("Parent", secondary=parent_student_relationships, back_populates="children")
+    # Every student has a user and full_name reads it, so load it in the same query
+    user = relationship("User", back_populates="students", lazy="joined", innerjoin=True)
+    current_class = relationship("Class", back_populates="students")
+    # Batched with one IN query across all loaded students instead of a SELECT per student
+    parents = relationship("Parent", secondary=parent_student_relationships, back_populates="children", lazy="selectin")
     
     # Academic relationships
-    grades = relationship("Grade", back_populates="student", cascade="all, delete-orphan")
-    attendance_records = relationship("AttendanceRecord", back_populates="student", cascade="all, delete-orphan")
-    assignment_submissions = relationship("AssignmentSubmission", back_populates="student", cascade="all, delete-orphan")
-    exam_results = relationship("ExamResult", back_populates="student", cascade="all, delete-orphan")
+    # Collections never lazy load; opt in with selectinload() where they are needed.
+    # List endpoints also add raiseload("*") so any other relationship access fails loudly.
+    # Deleting a student leaves the child rows to the database's ON DELETE CASCADE
+    grades = relationship("Grade", back_populates="student", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    attendance_records = relationship("AttendanceRecord", back_populates="student", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    assignment_submissions = relationship("AssignmentSubmission", back_populates="student", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    exam_results = relationship("ExamResult", back_populates="student", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
     
     # Financial relationships
-    fee_payments = relationship("Invoice", back_populates="student", cascade="all, delete-orphan")
+    # Write-only: page through with student.fee_payments.select(); the database
+    # deletes invoices along with the student
+    fee_payments = relationship("Invoice", back_populates="student", cascade="all, delete-orphan", lazy="write_only", passive_deletes=True)
     
     # Library relationships
     
     # Transport relationships
-    bus_route = relationship("Route", foreign_keys=[bus_route_id])
+    bus_route = relationship("Route")
     
     # Hostel relationships
-    hostel_room = relationship("HostelRoom", foreign_keys=[hostel_room_id])
+    hostel_room = relationship("HostelRoom")
     
     def __repr__(self):
         return f"<Student(id={self.id}, student_id='{self.student_id}', user_id={self.user_id})>"
     
+    @classmethod
+    def dynamic_field(cls, field_name: str):
+        """SQL expression for a form field, using its generated column when it has one"""
+        if field_name in ("grade_level", "parent_email"):
+            return getattr(cls, field_name)
+        return cls.dynamic_data[field_name].astext
+    
     @property
     def full_name(self):
         return self.user.full_name if self.user else "Unknown"
     
-    @property
+    @hybrid_property
     def age(self):
         if self.user and self.user.date_of_birth:
-            from datetime import date
             today = date.today()
             birth_date = self.user.date_of_birth.date()
             return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
         return None
+    
+    @age.expression
+    def age(cls):
+        # Correlated lookup so filters and ORDER BY need no explicit join to users
+        return years_since(
+            select(User.date_of_birth).where(User.id == cls.user_id).correlate_except(User).scalar_subquery()
+        )
 
 
 class AttendanceRecord(Base):
-    """Enhanced student attendance tracking"""
+    """
+    Enhanced student attendance tracking
+    
+    On PostgreSQL the table is migration-only: migration 032 rebuilds it
+    range-partitioned by month of ``date``, with primary key (id, date).
+    create_all() builds a plain table keyed on id alone, so do not use it to
+    create a PostgreSQL schema. SQLite has no partitioning and keeps that plain
+    table. Rows are still identified by id in the ORM.
+    """
     __tablename__ = "attendance_records"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    __table_args__ = (
+        # Attendance for a student or a class over a date range (names match migration 001)
+        Index("idx_attendance_records_student_date", "student_id", "date"),
+        Index("idx_attendance_records_class_date", "class_id", "date"),
+        # One mark per student, class and day; the ON CONFLICT target of upsert()
+        UniqueConstraint("student_id", "date", "class_id", name="uq_attendance_records_student_date_class"),
+        # Absence scans for parent notifications only touch absent rows
+        Index(
+            "ix_attendance_records_absent_date", "date", "student_id",
+            postgresql_where=text("status = 'absent'"),
+            sqlite_where=text("status = 'absent'"),
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     policy_id = Column(Integer, ForeignKey("attendance_policies.id"), nullable=True)
     
     # Date and time information
+    # Partition key of the monthly range partitions on PostgreSQL (migration 032)
     date = Column(Date, nullable=False, index=True)
-    status = Column(String(20), nullable=False)  # present, absent, late, excused, half_day, sick_leave, personal_leave, emergency_leave
-    attendance_type = Column(String(20), default='daily')  # daily, period_wise, subject_wise, activity_wise
+    status = Column(enum_column_type(AttendanceStatus, "attendance_status"), nullable=False)
+    attendance_type = Column(enum_column_type(AttendanceType, "attendance_type"), default=AttendanceType.DAILY)
     
     # Time tracking
     expected_check_in = Column(Time, nullable=True)
@@ -135,8 +227,9 @@ class AttendanceRecord(Base):
     expected_hours = Column(Float, nullable=True)  # Expected hours for the day
     
     # Location tracking (for future GPS integration)
-    check_in_location = Column(JSON, nullable=True)  # {lat, lng, address}
-    check_out_location = Column(JSON, nullable=True)
+    # Deferred: written on check-in/out but not read back by the listings
+    check_in_location = deferred(Column(JSONBType, nullable=True), group="location")  # {lat, lng, address}
+    check_out_location = deferred(Column(JSONBType, nullable=True), group="location")
     
     # Device information
     check_in_device = Column(String(100), nullable=True)  # web, mobile, card, biometric
@@ -157,16 +250,54 @@ class AttendanceRecord(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
+    # Reports load these up front: joinedload(student).joinedload(Student.user), joinedload(class_info)
     student = relationship("Student", back_populates="attendance_records")
     class_info = relationship("Class")
     policy = relationship("AttendancePolicy", back_populates="attendance_records")
-    marker = relationship("User", foreign_keys=[marked_by])
-    verifier = relationship("User", foreign_keys=[verified_by])
+    # Audit-only; never lazy loaded, so a stray access in a listing raises
+    marker = relationship("User", foreign_keys=[marked_by], lazy="raise")
+    verifier = relationship("User", foreign_keys=[verified_by], lazy="raise")
     
     def __repr__(self):
         return f"<AttendanceRecord(student_id={self.student_id}, date={self.date}, status='{self.status}')>"
     
-    @property
+    @classmethod
+    def upsert(cls, db: Session, records: List[Dict[str, Any]]) -> int:
+        """
+        Mark attendance for many students, overwriting any existing mark for the same class and day
+        
+        A re-mark replaces the status, times and notes but keeps the original
+        ``marked_by`` and ``policy_id``.
+        
+        Each batch is a single ``INSERT ... ON CONFLICT (student_id, date, class_id) DO UPDATE``
+        instead of a lookup followed by an INSERT or UPDATE per student. All
+        records must carry the same keys.
+        
+        Args:
+            db: Database session
+            records: Attendance rows keyed by column name
+        
+        Returns:
+            Number of rows inserted or updated
+        """
+        if not records:
+            return 0
+        
+        # A statement may not update the same row twice; the last mark for a student wins
+        records = list({(r["student_id"], r["date"], r["class_id"]): r for r in records}.values())
+        for start in range(0, len(records), UPSERT_BATCH_SIZE):
+            stmt = dialect_insert(db, cls).values(records[start:start + UPSERT_BATCH_SIZE])
+            # Who first marked the day, and under which policy, is kept on a re-mark
+            updates = {
+                column: stmt.excluded[column]
+                for column in records[0]
+                if column not in ("student_id", "date", "class_id", "marked_by", "policy_id")
+            }
+            updates["updated_at"] = func.now()
+            db.execute(stmt.on_conflict_do_update(index_elements=["student_id", "date", "class_id"], set_=updates))
+        return len(records)
+    
+    @hybrid_property
     def is_late(self) -> bool:
         """Check if student was late"""
         if not self.actual_check_in or not self.expected_check_in:
@@ -174,7 +305,14 @@ class AttendanceRecord(Base):
         check_in_time = self.actual_check_in.time()
         return check_in_time > self.expected_check_in
     
-    @property
+    @is_late.expression
+    def is_late(cls):
+        return case(
+            (seconds_of_day(cls.actual_check_in) > seconds_of_day(cls.expected_check_in), True),
+            else_=False,
+        )
+    
+    @hybrid_property
     def late_minutes(self) -> int:
         """Calculate how many minutes late"""
         if not self.is_late:
@@ -184,7 +322,34 @@ class AttendanceRecord(Base):
         return int((check_in_time.hour - expected_time.hour) * 60 + 
                    (check_in_time.minute - expected_time.minute))
     
-    @property
+    @late_minutes.expression
+    def late_minutes(cls):
+        return case(
+            (cls.is_late, seconds_of_day(cls.actual_check_in) // 60 - seconds_of_day(cls.expected_check_in) // 60),
+            else_=0,
+        )
+    
+    @classmethod
+    def late_minutes_array(cls, db: Session, *criteria):
+        """
+        Late minutes of every matching record as a NumPy array, for batch analytics
+        
+        The database evaluates the ``late_minutes`` expression and rows are
+        streamed in chunks straight into the array, so no ORM objects are built.
+        
+        Args:
+            db: Database session
+            *criteria: Filter clauses on AttendanceRecord
+        
+        Returns:
+            int32 array with one entry per matching record
+        """
+        import numpy as np
+        
+        stmt = select(cls.late_minutes).where(*criteria).execution_options(yield_per=50_000)
+        return np.fromiter(db.scalars(stmt), dtype=np.int32)
+    
+    @hybrid_property
     def attendance_percentage(self) -> float:
         """Calculate attendance percentage for the day"""
         if not self.expected_hours or self.expected_hours == 0:
@@ -194,14 +359,29 @@ class AttendanceRecord(Base):
             return 0.0
         
         return min(100.0, (self.total_hours / self.expected_hours) * 100)
+    
+    @attendance_percentage.expression
+    def attendance_percentage(cls):
+        ratio = cls.total_hours * 100.0 / cls.expected_hours
+        return case(
+            (func.coalesce(cls.expected_hours, 0) == 0, case((cls.status == 'present', 100.0), else_=0.0)),
+            (func.coalesce(cls.total_hours, 0) == 0, 0.0),
+            (ratio > 100.0, 100.0),
+            else_=ratio,
+        )
 
 
 class Grade(Base):
     """Student grades and academic performance"""
     __tablename__ = "grades"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    __table_args__ = (
+        # Report cards by term, and a student's grades per subject
+        Index("ix_grades_student_year_term", "student_id", "academic_year", "term"),
+        Index("ix_grades_student_subject", "student_id", "subject_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=False)
     assessment_type = Column(String(50), nullable=False)  # assignment, exam, quiz, project
     assessment_id = Column(Integer, nullable=True)  # ID of specific assignment/exam
@@ -212,7 +392,9 @@ class Grade(Base):
     max_score = Column(Float, nullable=False)
     grade_letter = Column(String(5), nullable=True)  # A, B, C, D, F
     grade_points = Column(Float, nullable=True)  # GPA points
-    percentage = Column(Float, nullable=True)
+    # Generated by the database and recomputed whenever score or max_score change.
+    # Stored on PostgreSQL; SQLite databases upgraded by migration 028 compute it on read (VIRTUAL)
+    percentage = Column(Float, Computed("CASE WHEN max_score > 0 THEN score * 100.0 / max_score ELSE 0 END", persisted=True))
     
     # Additional information
     term = Column(String(20), nullable=False)  # semester, quarter, etc.
@@ -232,23 +414,17 @@ class Grade(Base):
     
     def __repr__(self):
         return f"<Grade(student_id={self.student_id}, subject_id={self.subject_id}, score={self.score}/{self.max_score})>"
-    
-    @property
-    def percentage_score(self):
-        if self.max_score > 0:
-            return (self.score / self.max_score) * 100
-        return 0
 
 
 class StudentDocument(Base):
     """Student documents and certificates"""
     __tablename__ = "student_documents"
     
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     document_type = Column(String(100), nullable=False)  # birth_certificate, transfer_certificate, etc.
     document_name = Column(String(200), nullable=False)
-    file_path = Column(String(500), nullable=False)
+    file_path = Column(String(320), nullable=False)
     file_size = Column(Integer, nullable=True)
     mime_type = Column(String(100), nullable=True)
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -272,11 +448,11 @@ class StudentNote(Base):
     """Notes and observations about students"""
     __tablename__ = "student_notes"
     
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     note_type = Column(String(50), nullable=False)  # academic, behavioral, medical, general
     title = Column(String(200), nullable=False)
-    content = Column(Text, nullable=False)
+    content = deferred(Column(Text, nullable=False), group="details")
     is_confidential = Column(Boolean, default=False, nullable=False)
     is_visible_to_parents = Column(Boolean, default=True, nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -295,14 +471,14 @@ class StudentAchievement(Base):
     """Student achievements, awards, and recognitions"""
     __tablename__ = "student_achievements"
     
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     achievement_type = Column(String(100), nullable=False)  # academic, sports, arts, behavior, etc.
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     date_achieved = Column(Date, nullable=False)
     level = Column(String(50), nullable=True)  # school, district, state, national, international
-    certificate_path = Column(String(500), nullable=True)
+    certificate_path = Column(String(320), nullable=True)
     points = Column(Integer, nullable=True)  # Achievement points
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -321,7 +497,7 @@ class AttendancePolicy(Base):
     """Attendance policies and rules"""
     __tablename__ = "attendance_policies"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     
@@ -332,28 +508,29 @@ class AttendancePolicy(Base):
     # Time settings
     school_start_time = Column(Time, nullable=False, default=time(8, 0))  # 8:00 AM
     school_end_time = Column(Time, nullable=False, default=time(15, 0))   # 3:00 PM
-    late_threshold_minutes = Column(Integer, default=15)  # Minutes after start time
-    early_departure_threshold_minutes = Column(Integer, default=30)  # Minutes before end time
+    late_threshold_minutes = Column(SmallInteger, default=15)  # Minutes after start time
+    early_departure_threshold_minutes = Column(SmallInteger, default=30)  # Minutes before end time
     
     # Attendance requirements
     minimum_attendance_percentage = Column(Float, default=75.0)
-    max_consecutive_absences = Column(Integer, default=5)
-    max_total_absences = Column(Integer, default=30)
+    max_consecutive_absences = Column(SmallInteger, default=5)
+    max_total_absences = Column(SmallInteger, default=30)
     
     # Notification settings
     notify_parents_on_absence = Column(Boolean, default=True)
     notify_parents_on_late = Column(Boolean, default=False)
-    notify_after_consecutive_absences = Column(Integer, default=3)
+    notify_after_consecutive_absences = Column(SmallInteger, default=3)
     
     # Auto-marking settings
-    auto_mark_absent_after_minutes = Column(Integer, nullable=True)  # NULL to disable
+    auto_mark_absent_after_minutes = Column(SmallInteger, nullable=True)  # NULL to disable
     allow_self_check_in = Column(Boolean, default=False)
     allow_self_check_out = Column(Boolean, default=False)
     
     # Advanced settings
-    grace_period_minutes = Column(Integer, default=5)
+    grace_period_minutes = Column(SmallInteger, default=5)
     half_day_threshold_hours = Column(Float, default=4.0)
-    working_days = Column(JSON, default=['monday', 'tuesday', 'wednesday', 'thursday', 'friday'])
+    # Working days packed into one integer; working_days reads and writes it as day names
+    working_days_mask = Column(SmallInteger, default=MONDAY_TO_FRIDAY, server_default=str(MONDAY_TO_FRIDAY), nullable=False)
     
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
@@ -362,19 +539,40 @@ class AttendancePolicy(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    class_info = relationship("Class", foreign_keys=[class_id])
-    creator = relationship("User", foreign_keys=[created_by])
+    class_info = relationship("Class")
+    creator = relationship("User")
     attendance_records = relationship("AttendanceRecord", back_populates="policy")
     
     def __repr__(self):
         return f"<AttendancePolicy(id={self.id}, name='{self.name}', class_id={self.class_id})>"
 
+    @property
+    def working_days(self) -> List[str]:
+        mask = MONDAY_TO_FRIDAY if self.working_days_mask is None else self.working_days_mask
+        return [name for day, name in enumerate(WEEKDAY_NAMES) if mask & (1 << day)]
+
+    @working_days.setter
+    def working_days(self, names: List[str]):
+        unknown = {name for name in names if name.lower() not in WEEKDAY_NAMES}
+        if unknown:
+            raise ValueError(f"Unknown working day names: {', '.join(sorted(unknown))}")
+        self.working_days_mask = sum(1 << WEEKDAY_NAMES.index(name.lower()) for name in set(names))
+
+    @hybrid_method
+    def is_working_day(self, day: date) -> bool:
+        mask = MONDAY_TO_FRIDAY if self.working_days_mask is None else self.working_days_mask
+        return bool(mask & (1 << day.weekday()))
+
+    @is_working_day.expression
+    def is_working_day(cls, day):
+        return cls.working_days_mask.op("&")(literal(1).op("<<")(weekday(day))) != 0
+
 
 class AttendanceSession(Base):
     """Attendance sessions for period-wise tracking"""
     __tablename__ = "attendance_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=True)
     session_name = Column(String(100), nullable=False)  # e.g., "Morning Session", "Math Period"
@@ -382,7 +580,7 @@ class AttendanceSession(Base):
     # Time settings
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
-    late_threshold_minutes = Column(Integer, default=5)
+    late_threshold_minutes = Column(SmallInteger, default=5)
     
     # Session settings
     is_required = Column(Boolean, default=True)
@@ -405,14 +603,20 @@ class AttendanceSession(Base):
 class PeriodAttendance(Base):
     """Period-wise attendance records"""
     __tablename__ = "period_attendance"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    __table_args__ = (
+        # A student's periods over a date range, and a session's roll for a day
+        Index("ix_period_attendance_student_date", "student_id", "date"),
+        Index("ix_period_attendance_session_date", "session_id", "date"),
+        UniqueConstraint("student_id", "session_id", "date", name="uq_period_attendance_student_session_date"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     session_id = Column(Integer, ForeignKey("attendance_sessions.id"), nullable=False)
     date = Column(Date, nullable=False, index=True)
     
     # Attendance details
-    status = Column(String(20), nullable=False, default='absent')  # present, absent, late, excused
+    status = Column(enum_column_type(PeriodAttendanceStatus, "period_attendance_status"), nullable=False, default=PeriodAttendanceStatus.ABSENT)
     check_in_time = Column(DateTime(timezone=True), nullable=True)
     check_out_time = Column(DateTime(timezone=True), nullable=True)
     
@@ -428,7 +632,7 @@ class PeriodAttendance(Base):
     # Relationships
     student = relationship("Student")
     session = relationship("AttendanceSession", back_populates="period_attendance")
-    marker = relationship("User", foreign_keys=[marked_by])
+    marker = relationship("User")
     
     def __repr__(self):
         return f"<PeriodAttendance(student_id={self.student_id}, session_id={self.session_id}, date={self.date})>"
@@ -437,9 +641,12 @@ class PeriodAttendance(Base):
 class AttendanceException(Base):
     """Attendance exceptions and overrides"""
     __tablename__ = "attendance_exceptions"
+    __table_args__ = (
+        UniqueConstraint("student_id", "date", "exception_type", name="uq_attendance_exceptions_student_date_type"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     date = Column(Date, nullable=False, index=True)
     
     # Exception details
@@ -458,7 +665,7 @@ class AttendanceException(Base):
     
     # Relationships
     student = relationship("Student")
-    approver = relationship("User", foreign_keys=[approved_by])
+    approver = relationship("User")
     
     def __repr__(self):
         return f"<AttendanceException(student_id={self.student_id}, date={self.date}, type='{self.exception_type}')>"
@@ -468,8 +675,8 @@ class AttendanceNotification(Base):
     """Attendance notifications and alerts"""
     __tablename__ = "attendance_notifications"
     
-    id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     notification_type = Column(String(50), nullable=False)  # absence, late, consecutive_absence, etc.
     
     # Notification details
@@ -492,3 +699,80 @@ class AttendanceNotification(Base):
     
     def __repr__(self):
         return f"<AttendanceNotification(student_id={self.student_id}, type='{self.notification_type}')>"
+
+
+# Monthly attended and expected hours per student. PostgreSQL keeps it as a
+# materialized view refreshed nightly by refresh_student_attendance_summary();
+# SQLite has no materialized views and computes it on read.
+STUDENT_ATTENDANCE_SUMMARY_SELECT = """
+    SELECT student_id, {month} AS month,
+           SUM(total_hours) AS total_hours,
+           SUM(expected_hours) AS expected_hours,
+           100.0 * SUM(total_hours) / NULLIF(SUM(expected_hours), 0) AS percentage
+    FROM attendance_records
+    GROUP BY student_id, {month}
+"""
+POSTGRESQL_SUMMARY_MONTH = "CAST(date_trunc('month', date) AS DATE)"
+SQLITE_SUMMARY_MONTH = "date(date, 'start of month')"
+
+# Kept out of Base.metadata so create_all() never tries to build it as a table
+view_metadata = MetaData()
+
+student_attendance_summary = Table(
+    "student_attendance_summary",
+    view_metadata,
+    Column("student_id", Integer),
+    Column("month", Date),
+    Column("total_hours", Float),
+    Column("expected_hours", Float),
+    Column("percentage", Float),
+    info={"is_view": True},
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS student_attendance_summary AS "
+        + STUDENT_ATTENDANCE_SUMMARY_SELECT.format(month=POSTGRESQL_SUMMARY_MONTH)
+    ).execute_if(dialect="postgresql"),
+)
+# REFRESH ... CONCURRENTLY needs a unique index on the view
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_student_attendance_summary_student_month "
+        "ON student_attendance_summary (student_id, month)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE VIEW IF NOT EXISTS student_attendance_summary AS "
+        + STUDENT_ATTENDANCE_SUMMARY_SELECT.format(month=SQLITE_SUMMARY_MONTH)
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    Base.metadata, "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS student_attendance_summary").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata, "before_drop",
+    DDL("DROP VIEW IF EXISTS student_attendance_summary").execute_if(dialect="sqlite"),
+)
+
+
+def refresh_student_attendance_summary(db: Session):
+    """
+    Recompute student_attendance_summary from attendance_records
+    
+    Refreshes concurrently so dashboards keep reading the previous contents
+    meanwhile. A no-op on SQLite, where the summary is a plain view.
+    
+    Args:
+        db: Database session
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY student_attendance_summary"))
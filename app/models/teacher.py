@@ -2,10 +2,13 @@
 Teacher-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Date, Table, JSON
-from sqlalchemy.orm import relationship
+from typing import Any, Dict, List
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Date, Table, Index, REAL, UniqueConstraint
+from sqlalchemy.orm import relationship, Session
 from sqlalchemy.sql import func
-from app.database.session import Base
+from app.database.mixins import TimestampMixin
+from app.database.session import Base, COPY_THRESHOLD, copy_rows_skipping_conflicts, dialect_insert
+from app.database.types import JSONBType
 
 
 
@@ -31,7 +34,7 @@ teacher_class_associations = Table(
 )
 
 
-class Teacher(Base):
+class Teacher(TimestampMixin, Base):
     """Teacher profile and professional information"""
     __tablename__ = "teachers"
     
@@ -74,29 +77,29 @@ class Teacher(Base):
     teaching_philosophy = Column(Text, nullable=True)
     awards_recognitions = Column(Text, nullable=True)
     publications = Column(Text, nullable=True)
-    
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Dynamic data for form builder
-    dynamic_data = Column(JSON, nullable=True)
+    dynamic_data = Column(JSONBType, nullable=True)
 
     # Permissions
     can_create_class = Column(Boolean, default=False, nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="teachers")
-    subjects = relationship("Subject", secondary="teacher_subject_associations", back_populates="teachers")
-    classes = relationship("Class", secondary="teacher_class_associations", back_populates="teachers")
+    # Every teacher has a user and full_name reads it, so load it in the same query
+    user = relationship("User", back_populates="teachers", lazy="joined", innerjoin=True)
+    # Batched with one IN query across all loaded teachers instead of a SELECT per teacher;
+    # queries that never read them can skip the extra SELECT with noload()
+    subjects = relationship("Subject", secondary="teacher_subject_associations", back_populates="teachers", lazy="selectin")
+    classes = relationship("Class", secondary="teacher_class_associations", back_populates="teachers", lazy="selectin")
     
     # Teaching relationships
-    assignments_created = relationship("Assignment", back_populates="teacher", cascade="all, delete-orphan")
-    exams_created = relationship("Exam", back_populates="teacher", cascade="all, delete-orphan")
+    # Collections never lazy load; opt in with selectinload() where they are needed
+    assignments_created = relationship("Assignment", back_populates="teacher", cascade="all, delete-orphan", lazy="raise")
+    exams_created = relationship("Exam", back_populates="teacher", cascade="all, delete-orphan", lazy="raise")
     
     # Attendance and schedule
-    attendance_records = relationship("TeacherAttendance", back_populates="teacher", cascade="all, delete-orphan")
-    timetable_slots = relationship("TimetableSlot", back_populates="teacher", cascade="all, delete-orphan")
+    attendance_records = relationship("TeacherAttendance", back_populates="teacher", cascade="all, delete-orphan", lazy="raise")
+    timetable_slots = relationship("TimetableSlot", back_populates="teacher", cascade="all, delete-orphan", lazy="raise")
     
     def __repr__(self):
         return f"<Teacher(id={self.id}, employee_id='{self.employee_id}', user_id={self.user_id})>"
@@ -106,13 +109,24 @@ class Teacher(Base):
         return self.user.full_name if self.user else "Unknown"
 
 
-class TeacherAttendance(Base):
+class TeacherAttendance(TimestampMixin, Base):
     """Teacher attendance tracking"""
     __tablename__ = "teacher_attendance"
+    __table_args__ = (
+        # One row per teacher and day; also serves per-teacher date range lookups
+        UniqueConstraint("teacher_id", "date", name="uq_teacher_attendance_teacher_date"),
+        # Days are marked in order, so on PostgreSQL a block range index serves
+        # date range scans at a fraction of a B-tree's size
+        Index(
+            "ix_teacher_attendance_date_brin", "date",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+        Index("ix_teacher_attendance_date", "date").ddl_if(dialect="sqlite"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     teacher_id = Column(Integer, ForeignKey("teachers.id"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
+    date = Column(Date, nullable=False)
     check_in_time = Column(DateTime(timezone=True), nullable=True)
     check_out_time = Column(DateTime(timezone=True), nullable=True)
     status = Column(String(20), nullable=False)  # present, absent, half_day, leave
@@ -121,8 +135,6 @@ class TeacherAttendance(Base):
     approved_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     hours_worked = Column(Float, nullable=True)
     overtime_hours = Column(Float, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     teacher = relationship("Teacher", back_populates="attendance_records")
@@ -130,9 +142,33 @@ class TeacherAttendance(Base):
     
     def __repr__(self):
         return f"<TeacherAttendance(teacher_id={self.teacher_id}, date={self.date}, status='{self.status}')>"
+    
+    @classmethod
+    def bulk_copy(cls, db: Session, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert a day's attendance for many teachers at once
+        
+        Teachers already marked for the day are skipped. Large batches on
+        PostgreSQL are streamed with COPY through a staging table; smaller ones,
+        and SQLite, use a batched ``INSERT ... ON CONFLICT (teacher_id, date)
+        DO NOTHING``.
+        
+        Args:
+            db: Database session
+            records: Attendance rows keyed by column name, all with the same keys
+        
+        Returns:
+            Number of rows inserted
+        """
+        if len(records) >= COPY_THRESHOLD and db.get_bind().dialect.name == "postgresql":
+            return copy_rows_skipping_conflicts(db, cls.__table__, records, ["teacher_id", "date"])
+        if not records:
+            return 0
+        stmt = dialect_insert(db, cls).on_conflict_do_nothing(index_elements=["teacher_id", "date"])
+        return len(db.scalars(stmt.returning(cls.id), records).all())
 
 
-class TeacherLeave(Base):
+class TeacherLeave(TimestampMixin, Base):
     """Teacher leave applications and management"""
     __tablename__ = "teacher_leaves"
     
@@ -150,8 +186,6 @@ class TeacherLeave(Base):
     rejection_reason = Column(Text, nullable=True)
     substitute_teacher_id = Column(Integer, ForeignKey("teachers.id"), nullable=True)
     document_path = Column(String(500), nullable=True)  # Medical certificate, etc.
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     teacher = relationship("Teacher", foreign_keys=[teacher_id])
@@ -162,7 +196,7 @@ class TeacherLeave(Base):
         return f"<TeacherLeave(id={self.id}, teacher_id={self.teacher_id}, type='{self.leave_type}')>"
 
 
-class TeacherQualification(Base):
+class TeacherQualification(TimestampMixin, Base):
     """Teacher qualifications and certifications"""
     __tablename__ = "teacher_qualifications"
     
@@ -178,8 +212,6 @@ class TeacherQualification(Base):
     is_verified = Column(Boolean, default=False, nullable=False)
     verified_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     verified_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     teacher = relationship("Teacher")
@@ -189,7 +221,7 @@ class TeacherQualification(Base):
         return f"<TeacherQualification(id={self.id}, teacher_id={self.teacher_id}, name='{self.qualification_name}')>"
 
 
-class TeacherTraining(Base):
+class TeacherTraining(TimestampMixin, Base):
     """Teacher training and professional development records"""
     __tablename__ = "teacher_trainings"
     
@@ -208,8 +240,6 @@ class TeacherTraining(Base):
     feedback_comments = Column(Text, nullable=True)
     is_mandatory = Column(Boolean, default=False, nullable=False)
     status = Column(String(20), nullable=False, default="registered")  # registered, completed, cancelled
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     teacher = relationship("Teacher")
@@ -218,7 +248,7 @@ class TeacherTraining(Base):
         return f"<TeacherTraining(id={self.id}, teacher_id={self.teacher_id}, name='{self.training_name}')>"
 
 
-class TeacherPerformance(Base):
+class TeacherPerformance(TimestampMixin, Base):
     """Teacher performance evaluations and appraisals"""
     __tablename__ = "teacher_performance"
     
@@ -227,15 +257,15 @@ class TeacherPerformance(Base):
     evaluation_period = Column(String(20), nullable=False)  # e.g., "2024-Q1", "2024-Annual"
     evaluator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
-    # Performance metrics (out of 5)
-    teaching_effectiveness = Column(Float, nullable=True)
-    student_engagement = Column(Float, nullable=True)
-    subject_knowledge = Column(Float, nullable=True)
-    classroom_management = Column(Float, nullable=True)
-    punctuality = Column(Float, nullable=True)
-    communication_skills = Column(Float, nullable=True)
-    professional_development = Column(Float, nullable=True)
-    innovation = Column(Float, nullable=True)
+    # Performance metrics (out of 5); single precision is plenty for a 0-5 score
+    teaching_effectiveness = Column(REAL, nullable=True)
+    student_engagement = Column(REAL, nullable=True)
+    subject_knowledge = Column(REAL, nullable=True)
+    classroom_management = Column(REAL, nullable=True)
+    punctuality = Column(REAL, nullable=True)
+    communication_skills = Column(REAL, nullable=True)
+    professional_development = Column(REAL, nullable=True)
+    innovation = Column(REAL, nullable=True)
     
     # Overall rating
     overall_rating = Column(Float, nullable=False)
@@ -253,10 +283,6 @@ class TeacherPerformance(Base):
     evaluation_date = Column(Date, nullable=False)
     acknowledgment_date = Column(Date, nullable=True)
     
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     # Relationships
     teacher = relationship("Teacher")
     evaluator = relationship("User")
@@ -265,7 +291,7 @@ class TeacherPerformance(Base):
         return f"<TeacherPerformance(id={self.id}, teacher_id={self.teacher_id}, rating={self.overall_rating})>"
 
 
-class TeacherDocument(Base):
+class TeacherDocument(TimestampMixin, Base):
     """Teacher documents and certificates storage"""
     __tablename__ = "teacher_documents"
     
@@ -282,8 +308,6 @@ class TeacherDocument(Base):
     verified_at = Column(DateTime(timezone=True), nullable=True)
     expiry_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     teacher = relationship("Teacher")
@@ -2,15 +2,24 @@
 Transportation management database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Time, Date
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Float, Time, Date, Index, select, type_coerce
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, Session
+from app.database.mixins import TimestampMixin
 from app.database.session import Base
+from app.database.triggers import attach_counter_trigger
 
+# Stop coordinates are stored as integer multiples of 1e-7 degree (about 1 cm)
+COORDINATE_SCALE = 10_000_000
 
-class Vehicle(Base):
+
+class Vehicle(TimestampMixin, Base):
     """Vehicle for school transportation"""
     __tablename__ = "vehicles"
+    __table_args__ = (
+        # A route's vehicles
+        Index("ix_vehicles_route_id", "route_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     registration_number = Column(String(50), nullable=False, unique=True)
@@ -20,9 +29,6 @@ class Vehicle(Base):
     insurance_expiry = Column(Date, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    
     route_id = Column(Integer, ForeignKey("routes.id"), nullable=True)
     route = relationship("Route", back_populates="vehicles")
 
@@ -30,16 +36,14 @@ class Vehicle(Base):
         return f"<Vehicle(id={self.id}, registration_number='{self.registration_number}')>"
 
 
-class Route(Base):
+class Route(TimestampMixin, Base):
     """Transport routes"""
     __tablename__ = "routes"
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=True)
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    current_occupancy = Column(Integer, nullable=False, default=0, server_default="0")  # Maintained by a trigger on transport_members
     
     stops = relationship("Stop", back_populates="route", cascade="all, delete-orphan")
     vehicles = relationship("Vehicle", back_populates="route")
@@ -52,11 +56,15 @@ class Route(Base):
 class Stop(Base):
     """Stops along a transport route"""
     __tablename__ = "stops"
+    __table_args__ = (
+        # A route's stops in morning pickup order; every route response nests them
+        Index("ix_stops_route_arrival", "route_id", "arrival_time_am"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    latitude = Column(Float, nullable=True)
-    longitude = Column(Float, nullable=True)
+    latitude_e7 = Column(Integer, nullable=True)
+    longitude_e7 = Column(Integer, nullable=True)
     arrival_time_am = Column(Time, nullable=True)
     departure_time_am = Column(Time, nullable=True)
     arrival_time_pm = Column(Time, nullable=True)
@@ -70,10 +78,61 @@ class Stop(Base):
     def __repr__(self):
         return f"<Stop(id={self.id}, name='{self.name}')>"
 
+    @hybrid_property
+    def latitude(self):
+        return None if self.latitude_e7 is None else self.latitude_e7 / COORDINATE_SCALE
+
+    @latitude.setter
+    def latitude(self, value):
+        self.latitude_e7 = None if value is None else round(value * COORDINATE_SCALE)
+
+    @latitude.expression
+    def latitude(cls):
+        return type_coerce(cls.latitude_e7 / COORDINATE_SCALE, Float)
+
+    @hybrid_property
+    def longitude(self):
+        return None if self.longitude_e7 is None else self.longitude_e7 / COORDINATE_SCALE
+
+    @longitude.setter
+    def longitude(self, value):
+        self.longitude_e7 = None if value is None else round(value * COORDINATE_SCALE)
+
+    @longitude.expression
+    def longitude(cls):
+        return type_coerce(cls.longitude_e7 / COORDINATE_SCALE, Float)
+
+    @classmethod
+    def route_points(cls, db: Session, route_id: int):
+        """
+        Stream a route's stop coordinates as plain rows in pickup order, for map and tracking views
+        
+        Rows are fetched in chunks and never become Stop instances, so nothing
+        is added to the session's identity map.
+        
+        Args:
+            db: Database session
+            route_id: Route to read
+        
+        Returns:
+            Iterator of (id, latitude, longitude, arrival_time_am) rows
+        """
+        return db.execute(
+            select(cls.id, cls.latitude.label("latitude"), cls.longitude.label("longitude"), cls.arrival_time_am)
+            .where(cls.route_id == route_id)
+            .order_by(cls.arrival_time_am, cls.id)
+            .execution_options(yield_per=1000)
+        )
+
 
 class TransportMember(Base):
     """Association table for users (students/staff) and transport routes"""
     __tablename__ = "transport_members"
+    __table_args__ = (
+        # Riders per route and stop, and the routes a user is assigned to
+        Index("ix_transport_members_route_stop", "route_id", "stop_id"),
+        Index("ix_transport_members_user_id", "user_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -86,3 +145,6 @@ class TransportMember(Base):
 
     def __repr__(self):
         return f"<TransportMember(user_id={self.user_id}, route_id={self.route_id})>"
+
+
+attach_counter_trigger(TransportMember.__table__, "route_id", "routes", "current_occupancy")
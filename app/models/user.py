@@ -2,10 +2,11 @@
 User-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, ForeignKey, event
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Text, ForeignKey, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
+from app.database.types import JSONBType
 from app.core.permissions import UserRole
 import enum
 
@@ -168,12 +169,18 @@ class Parent(Base):
 class SystemNotification(Base):
     """System-wide notifications and announcements"""
     __tablename__ = "system_notifications"
+    __table_args__ = (
+        # Role containment lookups (target_roles @> '["teacher"]') on PostgreSQL
+        Index("ix_system_notifications_target_roles_gin", "target_roles", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     message = Column(Text, nullable=False)
     notification_type = Column(String(50), nullable=False)  # info, warning, error, success
-    target_roles = Column(Text, nullable=True)  # JSON array of target roles
+    target_roles = Column(JSONBType, nullable=True)  # List of target roles
     is_active = Column(Boolean, default=True, nullable=False)
     start_date = Column(DateTime(timezone=True), nullable=True)
     end_date = Column(DateTime(timezone=True), nullable=True)
@@ -4,6 +4,8 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 from datetime import date, time, datetime
 
+from app.models.exam import DateSheetStatus
+
 # ExamTerm Schemas
 
 class ExamTermBase(BaseModel):
@@ -68,7 +70,7 @@ class DateSheetBase(BaseModel):
     """Base date-sheet schema"""
     class_id: int = Field(..., description="ID of the class")
     term_id: int = Field(..., description="ID of the exam term")
-    status: str = Field("draft", description="Status of the date-sheet (draft, published, archived)")
+    status: DateSheetStatus = Field(DateSheetStatus.DRAFT, description="Status of the date-sheet (draft, published, archived)")
 
 class DateSheetCreate(DateSheetBase):
     """Schema for creating a new date-sheet"""
@@ -76,7 +78,7 @@ class DateSheetCreate(DateSheetBase):
 
 class DateSheetUpdate(BaseModel):
     """Schema for updating a date-sheet"""
-    status: Optional[str] = Field(None, description="Status of the date-sheet")
+    status: Optional[DateSheetStatus] = Field(None, description="Status of the date-sheet")
     entries: Optional[List[DateSheetEntryUpdate]] = Field(None, description="List of date-sheet entries")
 
 class DateSheetResponse(DateSheetBase):
@@ -46,6 +46,15 @@ class Book(BookBase):
     class Config:
         orm_mode = True
 
+class BookSummary(BaseModel):
+    id: int
+    title: str
+    author: str
+    available_copies: int
+
+    class Config:
+        orm_mode = True
+
 # LibraryMember Schemas
 class LibraryMemberBase(BaseModel):
     user_id: int
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from typing import Optional, List, Any, Dict
 from app.models.live_class import LiveClassStatus
@@ -32,7 +32,7 @@ class ClassAttendance(ClassAttendanceBase):
 
 # Base schema for LiveClass
 class LiveClassBase(BaseModel):
-    topic: str
+    topic: str = Field(..., max_length=200)
     start_time: datetime
     duration: int
     class_id: int
@@ -64,7 +64,7 @@ class LiveClassCreate(LiveClassBase):
 
 # Schema for updating a LiveClass
 class LiveClassUpdate(BaseModel):
-    topic: Optional[str] = None
+    topic: Optional[str] = Field(None, max_length=200)
     start_time: Optional[datetime] = None
     duration: Optional[int] = None
     status: Optional[LiveClassStatus] = None
@@ -29,6 +29,12 @@ class Stop(StopBase):
     class Config:
         orm_mode = True
 
+class RoutePoint(BaseModel):
+    id: int
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    arrival_time_am: Optional[time] = None
+
 # Route Schemas
 class RouteBase(BaseModel):
     name: str
@@ -42,6 +48,7 @@ class RouteUpdate(RouteBase):
 
 class Route(RouteBase):
     id: int
+    current_occupancy: int = 0
     stops: List[Stop] = []
 
     class Config:
@@ -537,3 +537,4 @@ class NotificationService:
             logger.error(f"Notification cleanup error: {str(e)}")
             self.db.rollback()
             return 0
+
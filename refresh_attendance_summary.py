@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Refresh the student_attendance_summary materialized view
+
+Schedule nightly, e.g. from cron: 15 2 * * * python refresh_attendance_summary.py
+"""
+from app.database.session import SessionLocal
+from app.models.student import refresh_student_attendance_summary
+
+def refresh_attendance_summary():
+    """Recompute the monthly per-student attendance summary"""
+    db = SessionLocal()
+    try:
+        refresh_student_attendance_summary(db)
+        db.commit()
+        print("✅ student_attendance_summary refreshed")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    refresh_attendance_summary()
@@ -0,0 +1,72 @@
+import sys
+import os
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.main import app
+from app.api.deps import get_current_user
+from app.database.session import Base, get_db
+from app.models.user import User, UserRole
+
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+
+# One in-memory database shared by the test session and the app under test
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+def override_get_current_user():
+    return User(id=1, email="admin@example.com", username="admin", role=UserRole.ADMIN)
+
+@pytest.fixture(scope="function")
+def db_session():
+    """Fresh schema per test, with the app's get_db pointed at it"""
+    Base.metadata.create_all(bind=engine)
+    previous_overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = override_get_db
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(previous_overrides)
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="function")
+def client():
+    return TestClient(app)
+
+@pytest.fixture(scope="function")
+def admin_user(db_session):
+    """Authenticate every request as an admin"""
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    return override_get_current_user()
+
+@pytest.fixture(scope="function")
+def count_queries():
+    """Collect the SQL statements executed while the test runs"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
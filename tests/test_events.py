@@ -0,0 +1,61 @@
+import pytest
+from datetime import date, datetime
+from pydantic import ValidationError
+from sqlalchemy import update
+
+from app.api.v1.events import EventCreateRequest, EventUpdateRequest
+from app.schemas.exam import DateSheetUpdate
+from app.models.events import Event, EventAssignment, EventTargetType, event_effective_assignments
+from app.models.student import Student
+
+def _effective_student_ids(db, event_id):
+    rows = db.execute(
+        event_effective_assignments.select().where(event_effective_assignments.c.event_id == event_id)
+    )
+    return sorted(row.student_id for row in rows)
+
+def test_effective_assignments_resolve_targets(db_session):
+    for index, class_id in enumerate([1, 1, 2], start=1):
+        db_session.add(Student(
+            user_id=index, student_id=f"S{index}", admission_date=date(2024, 4, 1),
+            academic_year="2024-2025", current_class_id=class_id,
+        ))
+    db_session.add(Student(
+        user_id=4, student_id="S4", admission_date=date(2024, 4, 1),
+        academic_year="2024-2025", current_class_id=1, is_active=False,
+    ))
+    school_event = Event(title="Sports Day", event_type="Sports", date=date(2024, 5, 1),
+                         target_type=EventTargetType.SCHOOL_WIDE, created_by=1)
+    class_event = Event(title="Field Trip", event_type="Trip", date=date(2024, 5, 2),
+                        target_type=EventTargetType.CLASS_SPECIFIC, target_class_id=2, created_by=1)
+    db_session.add_all([school_event, class_event])
+    db_session.commit()
+    db_session.add(EventAssignment(event_id=class_event.id, student_id=1))
+    db_session.commit()
+
+    assert _effective_student_ids(db_session, school_event.id) == [1, 2, 3]
+    assert _effective_student_ids(db_session, class_event.id) == [1, 3]
+
+def test_bulk_update_touches_updated_at(db_session):
+    event = Event(title="Exam Week", event_type="Academic", date=date(2024, 5, 1),
+                  target_type=EventTargetType.SCHOOL_WIDE, created_by=1)
+    db_session.add(event)
+    db_session.commit()
+    db_session.execute(update(Event).where(Event.id == event.id).values(updated_at=datetime(2000, 1, 1)))
+    db_session.commit()
+
+    db_session.execute(update(Event).where(Event.id == event.id).values(title="Exam Fortnight"))
+    db_session.commit()
+    db_session.refresh(event)
+
+    assert event.title == "Exam Fortnight"
+    assert event.updated_at.year > 2000
+
+def test_event_and_date_sheet_schemas_reject_unknown_enum_values():
+    assert EventCreateRequest(title="Sports Day", target_type="teachers").target_type == EventTargetType.TEACHERS
+    with pytest.raises(ValidationError):
+        EventCreateRequest(title="Sports Day", target_type="everyone")
+    with pytest.raises(ValidationError):
+        EventUpdateRequest(status="postponed")
+    with pytest.raises(ValidationError):
+        DateSheetUpdate(status="final")
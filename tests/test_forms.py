@@ -124,4 +124,24 @@ def test_get_form_for_rendering(db_session):
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "Render Form"
-    assert data["key"] == "render-form"
\ No newline at end of file
+    assert data["key"] == "render-form"
+
+
+def test_render_form_reflects_updates(db_session):
+    client.post(
+        "/api/v1/forms/",
+        json={"name": "Cached Form", "key": "cached-form", "is_active": True},
+    )
+
+    response = client.get("/api/v1/forms/cached-form/render")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Cached Form"
+
+    client.put(
+        "/api/v1/forms/cached-form",
+        json={"name": "Renamed Form", "key": "cached-form", "is_active": True},
+    )
+
+    response = client.get("/api/v1/forms/cached-form/render")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed Form"
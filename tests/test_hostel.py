@@ -0,0 +1,35 @@
+from datetime import date
+from types import SimpleNamespace
+
+from app.database.session import COPY_THRESHOLD
+from app.models import hostel
+from app.models.hostel import HostelAttendance, HostelAttendanceStatus
+
+def _attendance(student_id, status=HostelAttendanceStatus.PRESENT):
+    return {"student_id": student_id, "room_id": 1, "date": date(2024, 9, 2), "status": status, "marked_by": 1}
+
+def test_bulk_copy_skips_students_already_marked(db_session):
+    assert HostelAttendance.bulk_copy(db_session, [_attendance(1), _attendance(2)]) == 2
+    assert HostelAttendance.bulk_copy(db_session, [_attendance(2, HostelAttendanceStatus.ABSENT), _attendance(3)]) == 1
+    db_session.commit()
+
+    statuses = dict(db_session.query(HostelAttendance.student_id, HostelAttendance.status))
+    assert statuses == {1: HostelAttendanceStatus.PRESENT, 2: HostelAttendanceStatus.PRESENT, 3: HostelAttendanceStatus.PRESENT}
+
+def test_bulk_copy_skips_conflicts_on_the_postgresql_copy_path(monkeypatch):
+    calls = []
+
+    def copy_rows_skipping_conflicts(db, table, rows, conflict_columns, columns):
+        calls.append((table, conflict_columns, columns, rows))
+        return len(rows) - 1
+
+    monkeypatch.setattr(hostel, "copy_rows_skipping_conflicts", copy_rows_skipping_conflicts)
+    db = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")))
+    records = [_attendance(student_id) for student_id in range(COPY_THRESHOLD)]
+
+    assert HostelAttendance.bulk_copy(db, records) == COPY_THRESHOLD - 1
+    (table, conflict_columns, columns, rows), = calls
+    assert table is HostelAttendance.__table__
+    assert conflict_columns == ["student_id", "date"]
+    assert columns == HostelAttendance.COPY_COLUMNS
+    assert rows[0]["created_at"] is not None
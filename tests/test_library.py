@@ -0,0 +1,40 @@
+from app.models.library import Book, LibraryMember
+from app.models.user import User, UserRole
+
+def _add_book_and_member(db):
+    user = User(
+        email="reader@example.com", username="reader", hashed_password="x",
+        first_name="Avid", last_name="Reader", role=UserRole.STUDENT,
+    )
+    db.add(user)
+    db.flush()
+    member = LibraryMember(user_id=user.id, member_type="Student")
+    book = Book(title="Dune", author="Frank Herbert", total_copies=1, available_copies=1)
+    db.add_all([member, book])
+    db.commit()
+    return book, member
+
+def test_issuing_and_returning_keeps_available_copies_in_range(db_session, client):
+    book, member = _add_book_and_member(db_session)
+    issue = {"book_id": book.id, "member_id": member.id, "due_date": "2030-01-15"}
+
+    first = client.post("/api/v1/library/book-issues/", json=issue)
+    assert first.status_code == 201
+    # The only copy is out, so a second issue is refused instead of going negative
+    assert client.post("/api/v1/library/book-issues/", json=issue).status_code == 409
+    db_session.refresh(book)
+    assert book.available_copies == 0
+
+    returned = client.post(f"/api/v1/library/book-issues/{first.json()['id']}/return")
+    assert returned.status_code == 200
+    assert returned.json()["return_date"] is not None
+    assert client.post(f"/api/v1/library/book-issues/{first.json()['id']}/return").status_code == 409
+    db_session.refresh(book)
+    assert book.available_copies == 1
+
+def test_issuing_a_missing_book_is_not_found(db_session, client):
+    _, member = _add_book_and_member(db_session)
+
+    response = client.post("/api/v1/library/book-issues/", json={"book_id": 999, "member_id": member.id, "due_date": "2030-01-15"})
+
+    assert response.status_code == 404
@@ -0,0 +1,211 @@
+import sys
+import os
+import glob
+import importlib.util
+import shutil
+import pytest
+from datetime import date, datetime, time
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.main import app  # noqa: F401 -- registers every model
+from app.models.financial import FeeStructure, Invoice
+from app.models.form import Form, FormField, FormFieldOption
+from app.models.live_class import ClassAttendance, LiveClass
+from app.models.academic import Subject
+from app.models.student import AttendanceSession, Grade, PeriodAttendance, PeriodAttendanceStatus, Student
+from app.models.user import User, UserRole, UserSession
+
+MIGRATIONS = sorted(glob.glob(os.path.join(PROJECT_ROOT, "app", "database", "migrations", "0*.py")))
+# The bundled eschool.db is at revision 002
+BASE_REVISION = "002"
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    # The application leaves these off; the cascade tests turn them on so the
+    # migrated foreign keys themselves do the deleting
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+def _upgrade(engine):
+    for path in MIGRATIONS:
+        name = os.path.basename(path)[:-3]
+        if name[:3] <= BASE_REVISION:
+            continue
+        spec = importlib.util.spec_from_file_location(name, path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        with engine.connect() as connection:
+            context = MigrationContext.configure(connection, opts={"transactional_ddl": True})
+            with Operations.context(context), context.begin_transaction():
+                migration.upgrade()
+
+@pytest.fixture(scope="module")
+def migrated_database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("migrated") / "eschool.db"
+    shutil.copy(os.path.join(PROJECT_ROOT, "eschool.db"), path)
+    engine = create_engine(f"sqlite:///{path}")
+    _upgrade(engine)
+    engine.dispose()
+    return path
+
+def _session(database, tmp_path, enforce_foreign_keys):
+    path = tmp_path / "eschool.db"
+    shutil.copy(database, path)
+    engine = create_engine(f"sqlite:///{path}")
+    if enforce_foreign_keys:
+        event.listen(engine, "connect", _enable_foreign_keys)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+@pytest.fixture(scope="function")
+def migrated_session(migrated_database, tmp_path):
+    yield from _session(migrated_database, tmp_path, enforce_foreign_keys=True)
+
+@pytest.fixture(scope="function")
+def app_session(migrated_database, tmp_path):
+    """A session configured like the application's, with foreign keys off"""
+    yield from _session(migrated_database, tmp_path, enforce_foreign_keys=False)
+
+def _new_student(db):
+    # A student with no other rows, so only the cascading foreign keys are in play
+    user = User(
+        email="migrated@example.com", username="migrated", hashed_password="x",
+        first_name="Migrated", last_name="Student", role=UserRole.STUDENT,
+    )
+    db.add(user)
+    db.flush()
+    student = Student(
+        user_id=user.id, student_id="MIGRATED-1", admission_date=date(2024, 4, 1), academic_year="2024-2025",
+        current_class_id=db.scalar(select(Student.current_class_id).where(Student.current_class_id.isnot(None))),
+    )
+    db.add(student)
+    db.flush()
+    return student
+
+def test_student_generated_columns_exist_after_migrating(migrated_session):
+    student = migrated_session.query(Student).first()
+    assert student is not None
+
+    student.dynamic_data = {"grade_level": "5", "parent_email": "parent@example.com"}
+    migrated_session.commit()
+
+    assert migrated_session.query(Student).filter(Student.grade_level == "5").one() is student
+    assert student.parent_email == "parent@example.com"
+
+def test_deleting_a_form_cascades_to_its_fields_after_migrating(migrated_session):
+    form = migrated_session.query(Form).join(Form.fields).join(FormField.options).first()
+    assert form is not None
+    field_ids = [field_id for field_id, in migrated_session.query(FormField.id).filter(FormField.form_id == form.id)]
+
+    migrated_session.execute(delete(Form).where(Form.id == form.id))
+    migrated_session.commit()
+
+    assert migrated_session.query(FormField).filter(FormField.id.in_(field_ids)).count() == 0
+    assert migrated_session.query(FormFieldOption).filter(FormFieldOption.field_id.in_(field_ids)).count() == 0
+
+def test_deleting_a_student_cascades_to_grades_after_migrating(migrated_session):
+    student = _new_student(migrated_session)
+    migrated_session.add(Grade(
+        student_id=student.id, subject_id=migrated_session.scalar(select(Subject.id)),
+        assessment_type="quiz", assessment_name="Quiz 1", score=8, max_score=10,
+        term="Term 1", academic_year="2024-2025", graded_by=student.user_id, graded_at=datetime(2024, 9, 1),
+    ))
+    migrated_session.commit()
+    student_id = student.id
+
+    migrated_session.execute(delete(Student).where(Student.id == student_id))
+    migrated_session.commit()
+
+    assert migrated_session.query(Grade).filter(Grade.student_id == student_id).count() == 0
+
+def test_grade_percentage_follows_score_after_migrating(migrated_session):
+    student = migrated_session.query(Student).first()
+    grade = Grade(
+        student_id=student.id, subject_id=migrated_session.scalar(select(Subject.id)),
+        assessment_type="quiz", assessment_name="Quiz 1", score=8, max_score=10,
+        term="Term 1", academic_year="2024-2025", graded_by=student.user_id, graded_at=datetime(2024, 9, 1),
+    )
+    migrated_session.add(grade)
+    migrated_session.commit()
+    assert grade.percentage == pytest.approx(80.0)
+
+    # A regrade is reflected too
+    grade.score = 9
+    migrated_session.commit()
+    assert grade.percentage == pytest.approx(90.0)
+
+def test_deleting_a_student_cascades_to_invoices_after_migrating(migrated_session):
+    student = _new_student(migrated_session)
+    migrated_session.add(Invoice(
+        student_id=student.id, fee_structure_id=migrated_session.scalar(select(FeeStructure.id)),
+        amount_due=1000, due_date=date(2024, 10, 1),
+    ))
+    migrated_session.commit()
+    student_id = student.id
+
+    migrated_session.execute(delete(Student).where(Student.id == student_id))
+    migrated_session.commit()
+
+    assert migrated_session.query(Invoice).filter(Invoice.student_id == student_id).count() == 0
+
+def test_deleting_a_student_cascades_to_period_attendance_after_migrating(migrated_session):
+    student = _new_student(migrated_session)
+    session = AttendanceSession(
+        class_id=student.current_class_id, session_name="Period 1", start_time=time(9), end_time=time(10),
+    )
+    migrated_session.add(session)
+    migrated_session.flush()
+    migrated_session.add(PeriodAttendance(
+        student_id=student.id, session_id=session.id, date=date(2024, 9, 2),
+        status=PeriodAttendanceStatus.PRESENT, marked_by=student.user_id,
+    ))
+    migrated_session.commit()
+    student_id = student.id
+
+    migrated_session.execute(delete(Student).where(Student.id == student_id))
+    migrated_session.commit()
+
+    assert migrated_session.query(PeriodAttendance).filter(PeriodAttendance.student_id == student_id).count() == 0
+
+def test_deleting_a_live_class_cascades_to_its_attendance_after_migrating(migrated_session):
+    live_class = migrated_session.query(LiveClass).join(LiveClass.attendance).first()
+    assert live_class is not None
+    live_class_id = live_class.id
+
+    migrated_session.execute(delete(LiveClass).where(LiveClass.id == live_class_id))
+    migrated_session.commit()
+
+    assert migrated_session.query(ClassAttendance).filter(ClassAttendance.live_class_id == live_class_id).count() == 0
+
+def test_deleting_a_student_and_user_with_sessions_after_migrating(app_session):
+    student = app_session.query(Student).first()
+    user = student.user
+    app_session.add(UserSession(
+        user_id=user.id, session_token="token-1", expires_at=datetime(2030, 1, 1),
+    ))
+    app_session.add(Grade(
+        student_id=student.id, subject_id=app_session.scalar(select(Subject.id)),
+        assessment_type="quiz", assessment_name="Quiz 1", score=8, max_score=10,
+        term="Term 1", academic_year="2024-2025", graded_by=user.id, graded_at=datetime(2024, 9, 1),
+    ))
+    app_session.commit()
+    student_id = student.id
+
+    # What the student delete endpoint does
+    app_session.delete(student)
+    app_session.delete(user)
+    app_session.commit()
+
+    assert app_session.get(Student, student_id) is None
+    assert app_session.query(Grade).filter(Grade.student_id == student_id).count() == 0
@@ -0,0 +1,91 @@
+import pytest
+from datetime import date, datetime, time
+from pydantic import ValidationError
+
+from app.api.v1.attendance import AttendancePolicyCreate
+from app.models.academic import Class
+from app.models.student import AttendancePolicy, AttendanceRecord, AttendanceStatus, Student
+from app.models.user import User, UserRole
+
+def _add_students(db, count):
+    school_class = Class(name="Grade 5", section="A", grade_level=5, academic_year="2024-2025")
+    db.add(school_class)
+    db.flush()
+    for index in range(1, count + 1):
+        user = User(
+            email=f"student{index}@example.com", username=f"student{index}", hashed_password="x",
+            first_name="Student", last_name=str(index), role=UserRole.STUDENT,
+        )
+        db.add(user)
+        db.flush()
+        db.add(Student(
+            user_id=user.id, student_id=f"S{index}", admission_date=date(2024, 4, 1),
+            academic_year="2024-2025", current_class_id=school_class.id,
+        ))
+    db.commit()
+
+def test_list_students_query_count_is_constant(db_session, client, count_queries):
+    _add_students(db_session, 5)
+    count_queries.clear()
+
+    response = client.get("/api/v1/students")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 5
+    assert all(student["current_class"]["name"] == "Grade 5" for student in data["students"])
+    # One COUNT and one SELECT with the user and class joined in, however many students
+    assert len(count_queries) <= 2
+
+def test_attendance_upsert_keeps_who_first_marked_the_day(db_session):
+    _add_students(db_session, 1)
+    student = db_session.query(Student).one()
+    mark = {
+        "student_id": student.id, "class_id": student.current_class_id, "policy_id": None,
+        "date": date(2024, 9, 2), "status": AttendanceStatus.ABSENT, "marked_by": student.user_id,
+    }
+    AttendanceRecord.upsert(db_session, [mark])
+    AttendanceRecord.upsert(db_session, [{**mark, "status": AttendanceStatus.LATE, "marked_by": student.user_id + 1}])
+    db_session.commit()
+
+    record = db_session.query(AttendanceRecord).one()
+    assert record.status == AttendanceStatus.LATE
+    assert record.marked_by == student.user_id
+
+def test_attendance_policy_rejects_unknown_working_days():
+    policy = {"name": "Default", "academic_year": "2024-2025", "school_start_time": "08:00", "school_end_time": "14:00"}
+    assert AttendancePolicyCreate(**policy, working_days=["monday", "saturday"]).working_days[-1] == "saturday"
+    with pytest.raises(ValidationError):
+        AttendancePolicyCreate(**policy, working_days=["mon"])
+    with pytest.raises(ValueError, match="mon"):
+        AttendancePolicy().working_days = ["mon"]
+
+def _mark_check_ins(db):
+    _add_students(db, 3)
+    students = db.query(Student).order_by(Student.id).all()
+    check_ins = [None, datetime(2024, 9, 2, 8, 0), datetime(2024, 9, 2, 8, 25)]
+    for student, check_in in zip(students, check_ins):
+        db.add(AttendanceRecord(
+            student_id=student.id, class_id=student.current_class_id, date=date(2024, 9, 2),
+            status=AttendanceStatus.PRESENT if check_in else AttendanceStatus.ABSENT,
+            expected_check_in=time(8, 0), actual_check_in=check_in, marked_by=student.user_id,
+        ))
+    db.commit()
+
+def test_late_minutes_array_counts_missing_and_on_time_check_ins_as_zero(db_session):
+    _mark_check_ins(db_session)
+
+    late_minutes = AttendanceRecord.late_minutes_array(db_session, AttendanceRecord.date == date(2024, 9, 2))
+
+    assert sorted(late_minutes.tolist()) == [0, 0, 25]
+
+def test_attendance_analytics_reports_late_minutes(db_session, client, admin_user):
+    _mark_check_ins(db_session)
+
+    response = client.get("/api/v1/attendance/analytics", params={"start_date": "2024-09-01", "end_date": "2024-09-30"})
+
+    assert response.status_code == 200
+    summary = response.json()["summary"]
+    assert summary["late_check_ins"] == 1
+    assert summary["average_late_minutes"] == 25
+    assert summary["max_late_minutes"] == 25
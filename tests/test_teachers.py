@@ -0,0 +1,37 @@
+from datetime import date
+
+from app.models.teacher import Teacher, TeacherAttendance
+from app.models.user import User, UserRole
+
+def _add_teachers(db, count):
+    teachers = []
+    for index in range(count):
+        user = User(
+            email=f"teacher{index}@example.com", username=f"teacher{index}", hashed_password="x",
+            first_name="Test", last_name=f"Teacher{index}", role=UserRole.TEACHER,
+        )
+        db.add(user)
+        db.flush()
+        teachers.append(Teacher(
+            user_id=user.id, employee_id=f"T{index}", hire_date=date(2020, 6, 1), employment_type="permanent",
+        ))
+    db.add_all(teachers)
+    db.commit()
+    return teachers
+
+def test_bulk_teacher_attendance_skips_teachers_already_marked(db_session, client, admin_user):
+    first, second = _add_teachers(db_session, 2)
+    day = {"date": "2024-09-02", "records": [{"teacher_id": first.id, "status": "present"}]}
+    assert client.post("/api/v1/teachers/attendance/bulk", json=day).json()["inserted_count"] == 1
+
+    day["records"] = [
+        {"teacher_id": first.id, "status": "absent"},
+        {"teacher_id": second.id, "status": "leave", "leave_type": "sick"},
+    ]
+    response = client.post("/api/v1/teachers/attendance/bulk", json=day)
+
+    assert response.status_code == 200
+    assert response.json()["inserted_count"] == 1
+    assert response.json()["skipped_count"] == 1
+    statuses = dict(db_session.query(TeacherAttendance.teacher_id, TeacherAttendance.status))
+    assert statuses == {first.id: "present", second.id: "leave"}
@@ -0,0 +1,25 @@
+import pytest
+from datetime import time
+
+from app.models.transport import Route, Stop
+
+def test_route_points_are_listed_in_pickup_order(db_session, client):
+    route = Route(name="North Loop")
+    db_session.add(route)
+    db_session.flush()
+    db_session.add_all([
+        Stop(name="School Gate", route_id=route.id, latitude=12.9716, longitude=77.5946, arrival_time_am=time(8, 30)),
+        Stop(name="Park Street", route_id=route.id, latitude=12.9352, longitude=77.6245, arrival_time_am=time(7, 45)),
+    ])
+    db_session.commit()
+
+    response = client.get(f"/api/v1/transport/routes/{route.id}/points")
+
+    assert response.status_code == 200
+    points = response.json()
+    assert [point["arrival_time_am"] for point in points] == ["07:45:00", "08:30:00"]
+    assert points[0]["latitude"] == pytest.approx(12.9352)
+    assert points[0]["longitude"] == pytest.approx(77.6245)
+
+def test_route_points_for_missing_route(db_session, client):
+    assert client.get("/api/v1/transport/routes/999/points").status_code == 404